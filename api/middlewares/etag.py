@@ -0,0 +1,74 @@
+import hashlib
+import os
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.v1.conditional import etag_matches
+
+ETAG_MIDDLEWARE_ENABLED = os.getenv("ETAG_MIDDLEWARE_ENABLED", "true").lower() in ("1", "true", "yes", "on")
+
+
+class ETagMiddleware:
+    """
+    ETag fraco a partir do hash do corpo para respostas JSON 200 de GET que ainda
+    não têm ETag (as rotas com token de versão já definem o seu e respondem 304 sozinhas).
+    Se o If-None-Match bate, devolve 304 sem corpo: a rota roda, mas o payload não trafega.
+
+    Só bufferiza application/json; respostas em streaming (NDJSON, SSE) passam direto.
+    """
+
+    def __init__(self, app: ASGIApp, enabled: bool = ETAG_MIDDLEWARE_ENABLED):
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if not self.enabled or scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message = None
+        body = []
+        passthrough = False
+
+        async def send_with_etag(message: Message):
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] != 200
+                    or "etag" in headers
+                    or not headers.get("content-type", "").startswith("application/json")
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            payload = b"".join(body)
+            etag = f'W/"{hashlib.sha1(payload).hexdigest()}"'
+            headers = MutableHeaders(scope=start_message)
+            headers["ETag"] = etag
+            if "cache-control" not in headers:
+                headers["Cache-Control"] = "no-cache"
+
+            if etag_matches(if_none_match, etag):
+                del headers["content-length"]
+                del headers["content-type"]
+                start_message["status"] = 304
+                payload = b""
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": payload})
+
+        await self.app(scope, receive, send_with_etag)
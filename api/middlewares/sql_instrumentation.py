@@ -0,0 +1,43 @@
+import os
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from db.instrumentation import end_request_stats, report_request_stats, start_request_stats
+
+SQL_STATS_HEADERS = os.getenv("SQL_STATS_HEADERS", "false").lower() in ("1", "true", "yes", "on")
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Mede quantos statements SQL cada requisição executa e quanto tempo passa no banco.
+
+    Sempre registra um aviso de N+1 no log; com SQL_STATS_HEADERS=true também devolve
+    os headers X-DB-Query-Count e X-DB-Time-Ms.
+    """
+
+    def __init__(self, app: ASGIApp, headers: bool = SQL_STATS_HEADERS):
+        self.app = app
+        self.headers = headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_request_stats(f"{scope['method']} {scope['path']}")
+
+        async def send_with_stats(message: Message):
+            if self.headers and message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["X-DB-Time-Ms"] = str(stats.total_time_ms)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            end_request_stats(token)
+            endpoint = scope.get("endpoint")
+            if endpoint is not None:
+                stats.route = f"{stats.route} ({endpoint.__module__}.{endpoint.__name__})"
+            report_request_stats(stats)
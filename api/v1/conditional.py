@@ -0,0 +1,68 @@
+"""
+GET condicional (ETag / If-None-Match, Last-Modified / If-Modified-Since).
+
+As rotas de leitura mais consultadas calculam um token de versão barato (máximos de
+updated_at e contagens, ver repository/version_repository.py) antes de carregar os dados.
+Se o cliente já tem essa versão, a rota responde 304 sem consultar nem serializar o payload.
+
+As demais respostas JSON recebem ETag do hash do corpo no ETagMiddleware: economiza banda,
+mas não o trabalho da rota.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional
+
+from fastapi import HTTPException, Request, Response
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparação fraca (RFC 9110): ignora o prefixo W/ e aceita lista ou '*'."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: Optional[datetime]) -> bool:
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def check_not_modified(request: Request, response: Response, version: Iterable) -> None:
+    """
+    Publica ETag e Last-Modified da versão informada (uma linha de version_repository)
+    e levanta 304 se o cliente já tem essa versão. A URL entra no ETag, então cursor,
+    limit e filtros geram versões distintas.
+    """
+    version = tuple(version)
+    last_modified = max((_as_utc(v) for v in version if isinstance(v, datetime)), default=None)
+    etag = make_etag(request.url.path, request.url.query, *version)
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    response.headers.update(headers)
+
+    # If-None-Match tem precedência; If-Modified-Since só vale sem ele
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, etag) or (
+        if_none_match is None and not_modified_since(request.headers.get("if-modified-since"), last_modified)
+    ):
+        raise HTTPException(status_code=304, headers=headers)
@@ -1,10 +1,12 @@
 from datetime import datetime
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from fastapi import APIRouter, Query, Response, WebSocket, WebSocketDisconnect, Depends
 from sqlalchemy.orm import Session
-from api.v1.repository.chat_repository import save_message
+from api.v1.pagination import PageParams
+from api.v1.repository.chat_repository import get_chat_history, save_message
 from api.v1.services.chat_ws_manager import ConnectionManager
-from db.models.chat_message import ChatMessage
-from db.session import get_db
+from api.v1.streaming import ExportFormat, iter_ndjson, ndjson_response
+from db.session import SessionLocal, get_read_db
+from db.unit_of_work import UnitOfWork
 import json
 
 manager = ConnectionManager()
@@ -12,7 +14,7 @@ router = APIRouter()
 
 
 @router.websocket("/ws/{channel_id}/{user_id}")
-async def websocket_endpoint(websocket: WebSocket, channel_id: str, user_id: str, db: Session = Depends(get_db)):
+async def websocket_endpoint(websocket: WebSocket, channel_id: str, user_id: str):
     await websocket.accept()
 
     await manager.connect(websocket, channel_id, user_id)
@@ -25,7 +27,9 @@ async def websocket_endpoint(websocket: WebSocket, channel_id: str, user_id: str
                 to_id = message_data["to"]
                 content = message_data["message"]
 
-                save_message(db, from_id=from_id, to_id=to_id, content=content)
+                # Uma transação por mensagem: a conexão só sai do pool durante o INSERT
+                with UnitOfWork(SessionLocal) as db:
+                    save_message(db, from_id=from_id, to_id=to_id, content=content)
 
                 # Broadcast para todos no canal
                 await manager.send_channel_message({
@@ -50,21 +54,19 @@ async def presence_websocket(websocket: WebSocket, user_id: str):
         manager.disconnect(websocket, f"presence-{user_id}")
 
 @router.get("/history/{user1_id}/{user2_id}")
-def chat_history(user1_id: str, user2_id: str, db: Session = Depends(get_db)):
-    messages = db.query(ChatMessage).filter(
-        ((ChatMessage.from_id == user1_id) & (ChatMessage.to_id == user2_id)) |
-        ((ChatMessage.from_id == user2_id) & (ChatMessage.to_id == user1_id))
-    ).order_by(ChatMessage.created_at).all()
-
-    return [
-        {
-            "from_id": msg.from_id,
-            "to_id": msg.to_id,
-            "content": msg.content,
-            "created_at": msg.created_at
-        }
-        for msg in messages
-    ]
+def chat_history(
+    user1_id: str,
+    user2_id: str,
+    response: Response,
+    page_params: PageParams = Depends(),
+    format: ExportFormat = Query("json", description="ndjson: exporta o histórico inteiro em streaming"),
+    db: Session = Depends(get_read_db)
+):
+    if format == "ndjson":
+        return ndjson_response(iter_ndjson(
+            lambda export_db, params: get_chat_history(export_db, user1_id, user2_id, params), page_params.cursor
+        ))
+    return get_chat_history(db, user1_id, user2_id, page_params).apply(response)
 
 @router.get("/status/{user_id}")
 def get_user_status(user_id: str):
@@ -1,15 +1,18 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.orm import Session
 from typing import List
 
+from api.v1.conditional import check_not_modified
+from api.v1.repository.version_repository import countries_version
 from api.v1.schemas.country_schema import CountryCreate, CountryUpdate, CountryResponse
 from api.v1.services import country_service
-from db.session import get_db
+from db.session import get_db, get_read_db
 
 router = APIRouter()
 
 @router.get("/", response_model=List[CountryResponse])
-def get_all_countries(db: Session = Depends(get_db)):
+def get_all_countries(request: Request, response: Response, db: Session = Depends(get_read_db)):
+    check_not_modified(request, response, db.execute(countries_version()).one())
     return country_service.get_all_countries(db)
 
 @router.get("/{country_id}", response_model=CountryResponse)
@@ -1,74 +1,39 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime, timezone
+from typing import List, Literal, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
+from api.v1.conditional import check_not_modified
+from api.v1.repository.version_repository import deliveries_per_project_version
+from api.v1.services import analytics_service
 from api.v1.services.dashboard_service import DashboardService
-from db.models.project import Project
-from db.models.task import Deliverable
-from db.session import get_db
+from db.session import get_read_db
 
 
 router = APIRouter()
 
 @router.get("/summary/{enterprise_id}")
-def get_dashboard_summary(enterprise_id: UUID, db: Session = Depends(get_db)):
+def get_dashboard_summary(enterprise_id: UUID, db: Session = Depends(get_read_db)):
     return DashboardService.get_summary(db, enterprise_id)
 
 @router.get("/deliveries-per-project")
 def get_deliveries_per_project(
+    request: Request,
+    response: Response,
     enterprise_id: str = Query(...),
     project_ids: Optional[List[str]] = Query(None),
-    db: Session = Depends(get_db)
+    start_date: Optional[date] = Query(None, description="Padrão: 1º de janeiro do ano corrente"),
+    end_date: Optional[date] = Query(None, description="Inclusivo. Padrão: 31 de dezembro do ano corrente"),
+    granularity: Literal["day", "week", "month"] = Query("month"),
+    db: Session = Depends(get_read_db)
 ):
-    current_year = datetime.now().year
-
-    query = (
-        db.query(
-            Deliverable.project_id,
-            Project.name.label("project_name"),
-            func.month(Deliverable.created_at).label("month"),
-            func.count(Deliverable.id).label("count")
-        )
-        .join(Project, Project.id == Deliverable.project_id)
-        .filter(
-            func.year(Deliverable.created_at) == current_year,
-            Project.enterprise_id == enterprise_id,
-            Deliverable.status == "COMPLETED"
-        )
-    )
-
-    if project_ids:
-        query = query.filter(Project.id.in_(project_ids))
-
-    results = (
-        query.group_by(
-            Deliverable.project_id,
-            Project.name,
-            func.month(Deliverable.created_at)
-        )
-        .order_by(Project.name, func.month(Deliverable.created_at))
-        .all()
+    version = tuple(db.execute(deliveries_per_project_version(enterprise_id)).one())
+    if start_date is None or end_date is None:
+        # o período padrão depende do ano corrente, que não aparece na URL: entra na versão,
+        # e o início do ano no Last-Modified, para a virada de ano não devolver 304
+        start_date, end_date = analytics_service.resolve_date_range(start_date, end_date)
+        version += (start_date, end_date, datetime(datetime.now().year, 1, 1, tzinfo=timezone.utc))
+    check_not_modified(request, response, version)
+    return analytics_service.get_deliveries_per_project(
+        db, enterprise_id, start_date, end_date, granularity, project_ids
     )
-
-    # agrupa dados no formato ApexCharts
-    project_data = {}
-    for row in results:
-        if row.project_name not in project_data:
-            project_data[row.project_name] = [0] * 12
-        project_data[row.project_name][row.month - 1] = row.count
-
-    series = [
-        {
-            "name": project_name,
-            "type": "line",
-            "data": [
-                {"x": datetime(1900, m + 1, 1).strftime('%b'), "y": monthly_data[m]}
-                for m in range(12)
-            ]
-        }
-        for project_name, monthly_data in project_data.items()
-    ]
-
-    return {"series": series}
\ No newline at end of file
@@ -1,12 +1,17 @@
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from api.v1.pagination import PageParams
 from api.v1.repository.task_repository import TaskSubmissionRepository
-from api.v1.schemas.task_schema import SubmissionWithDeliverable, TaskSubmissionResponse, TaskSubmissionValidate
+from api.v1.serialization import submissions_response
+from api.v1.streaming import ExportFormat, iter_ndjson, ndjson_response
+from api.v1.schemas.task_schema import SubmissionWithDeliverable, TaskSubmissionBatchValidate, TaskSubmissionBatchValidateResponse, TaskSubmissionResponse, TaskSubmissionValidate
 from api.v1.schemas.auth_schema import ForgotPasswordRequest, ForgotPasswordResponse, ResetPasswordRequest, ResetPasswordResponse
 from api.v1.services.password_reset_service import PasswordResetService
-from db.session import get_db
+from db.session import get_async_db, get_db
 from api.v1.schemas.enterprise_schema import (
     EnterpriseCreateForm,
     LoginRequest,
@@ -22,7 +27,7 @@ from api.v1.services.enterprise_service import (
     delete_enterprise_service
 )
 from api.v1.repository.enterprise_repository import (
-    get_enterprise_by_email,
+    get_enterprise_by_email_async,
     get_enterprise_by_id,
     list_enterprises_by_student,
 )
@@ -31,10 +36,11 @@ router = APIRouter()
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(data: LoginRequest, db: Session = Depends(get_db)):
-    enterprise = get_enterprise_by_email(db, data.email)
+async def login(data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    enterprise = await get_enterprise_by_email_async(db, data.email)
 
-    if not enterprise or not verify_password(data.password, enterprise.hashed_password):
+    # bcrypt é CPU-bound; roda fora do event loop
+    if not enterprise or not await run_in_threadpool(verify_password, data.password, enterprise.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid username or password")
 
     token_data = {"sub": str(enterprise.id), "email": enterprise.email}
@@ -61,15 +67,17 @@ def list_submissions_to_validate(
     search: Optional[str] = None,
     project_id: Optional[UUID] = None,
     status: Optional[str] = None,
+    page_params: PageParams = Depends(),
     db: Session = Depends(get_db),
 ):
-    return TaskSubmissionRepository.get_filtered_submissions_to_validate(
+    return submissions_response(TaskSubmissionRepository.get_filtered_submissions_to_validate(
         db=db,
         enterprise_id=enterprise_id,
         search=search,
         project_id=project_id,
-        status=status
-    )
+        status=status,
+        params=page_params
+    ))
 
 
 @router.get("/{enterprise_id}", response_model=EnterpriseResponse)
@@ -96,6 +104,13 @@ def delete_enterprise(enterprise_id: UUID, db: Session = Depends(get_db)):
     delete_enterprise_service(db, enterprise_id)
 
 
+@router.post("/submissions/validate-batch", response_model=TaskSubmissionBatchValidateResponse)
+def validate_task_submissions_batch(
+    data: TaskSubmissionBatchValidate,
+    db: Session = Depends(get_db),
+):
+    return TaskSubmissionRepository.validate_submissions(db, data)
+
 @router.post("/submissions/{submission_id}/validate", response_model=TaskSubmissionResponse)
 def validate_task_submission(
     submission_id: UUID,
@@ -107,9 +122,16 @@ def validate_task_submission(
 @router.get("/submissions/{enterprise_id}", response_model=List[SubmissionWithDeliverable])
 def list_submissions_for_enterprise(
     enterprise_id: UUID,
+    page_params: PageParams = Depends(),
+    format: ExportFormat = Query("json", description="ndjson: exporta todas as submissões em streaming"),
     db: Session = Depends(get_db)
 ):
-    return TaskSubmissionRepository.get_submissions_grouped_by_deliverable(db, enterprise_id)
+    if format == "ndjson":
+        return ndjson_response(iter_ndjson(
+            lambda export_db, params: TaskSubmissionRepository.get_submissions_grouped_by_deliverable(export_db, enterprise_id, params),
+            page_params.cursor,
+        ))
+    return submissions_response(TaskSubmissionRepository.get_submissions_grouped_by_deliverable(db, enterprise_id, page_params))
 
 @router.post("/forgot-password", response_model=ForgotPasswordResponse)
 def forgot_password(data: ForgotPasswordRequest, db: Session = Depends(get_db)):
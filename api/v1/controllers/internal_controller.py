@@ -0,0 +1,47 @@
+import os
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from db.init_db import test_db_connection
+from db.pool import pool_status
+from db.slow_query_log import slow_query_log
+
+router = APIRouter()
+
+
+def verify_internal_token(x_internal_token: Optional[str] = Header(None)):
+    """Exige o header X-Internal-Token igual a INTERNAL_API_TOKEN; sem o token configurado, as rotas ficam fechadas."""
+    expected = os.getenv("INTERNAL_API_TOKEN")
+    if not expected or not secrets.compare_digest(x_internal_token or "", expected):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+@router.get("/health/live")
+def liveness():
+    return {"status": "ok"}
+
+
+@router.get("/health/ready")
+def readiness():
+    """Readiness probe: só responde 200 quando o banco aceita conexões."""
+    if not test_db_connection():
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    return {"status": "ready"}
+
+
+@router.get("/db/pool", dependencies=[Depends(verify_internal_token)])
+def get_pool_stats():
+    """Estatísticas do pool de conexões de cada engine (checked out, ociosas, overflow, espera)."""
+    return pool_status()
+
+
+@router.get("/db/slow-queries", dependencies=[Depends(verify_internal_token)])
+def get_slow_queries(limit: int = Query(50, ge=1, le=1000)):
+    """Queries lentas mais recentes deste worker (statement, parâmetros, rota, função do repositório e plano)."""
+    return slow_query_log.entries(limit)
+
+
+@router.delete("/db/slow-queries", status_code=204, dependencies=[Depends(verify_internal_token)])
+def clear_slow_queries():
+    slow_query_log.clear()
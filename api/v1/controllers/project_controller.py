@@ -1,8 +1,14 @@
 from typing import List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from db.session import get_db
+from db.session import get_async_db, get_db, get_read_db
+from api.v1.conditional import check_not_modified
+from api.v1.repository.version_repository import enterprise_projects_version
+from api.v1.responses import FastJSONResponse
+from api.v1.streaming import ExportFormat, aiter_ndjson, ndjson_response
+from api.v1.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageParams
 from api.v1.schemas.project_schema import CompleteProjectInput, ProjectBasicInfo, ProjectList, ProjectResponse, UpdateProjectInput, UpdateStatusInput
 from api.v1.services.project_service import (
     delete_project_service,
@@ -19,16 +25,26 @@ from api.v1.services.project_service import (
 router = APIRouter()
 
 @router.get("/", response_model=list[ProjectList])
-async def list_projects_route(db: Session = Depends(get_db)):
+async def list_projects_route(
+    response: Response,
+    page_params: PageParams = Depends(),
+    format: ExportFormat = Query("json", description="ndjson: exporta todos os projetos em streaming"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    if format == "ndjson":
+        return ndjson_response(aiter_ndjson(list_projects_service, page_params.cursor, ProjectList.model_validate))
     try:
-        return await list_projects_service(db)
+        page = await list_projects_service(db, page_params)
+        return page.apply(response)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
 @router.get("/projects-options", response_model=List[ProjectBasicInfo])
 async def list_projects(
     enterprise_id: UUID = Query(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     return await list_projects_by_enterprise_service(db, enterprise_id)
 
@@ -41,12 +57,16 @@ async def publish_project_route(payload: CompleteProjectInput, db: Session = Dep
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
         
-@router.get("/filter", response_model=list[ProjectResponse])
-def filter_projects(name: str = Query(..., min_length=1), db: Session = Depends(get_db)):
-    return get_filtered_projects(db, name)
+@router.get("/filter", response_model=list[ProjectResponse], response_class=FastJSONResponse)
+def filter_projects(
+    name: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_read_db)
+):
+    return get_filtered_projects(db, name, limit)
     
 @router.get("/{project_id}")
-async def retrieve_project(project_id: UUID, db: Session = Depends(get_db)):
+async def retrieve_project(project_id: UUID, db: AsyncSession = Depends(get_async_db)):
     try:
         return await get_project_service(db, project_id)
     except Exception as e:
@@ -54,7 +74,7 @@ async def retrieve_project(project_id: UUID, db: Session = Depends(get_db)):
 
 
 @router.put("/{project_id}")
-async def update_project_route(project_id: UUID, payload: UpdateProjectInput, db: Session = Depends(get_db)):
+async def update_project_route(project_id: UUID, payload: UpdateProjectInput, db: AsyncSession = Depends(get_async_db)):
     try:
         return await update_project_service(db, project_id, payload.name)
     except Exception as e:
@@ -62,17 +82,28 @@ async def update_project_route(project_id: UUID, payload: UpdateProjectInput, db
 
 
 @router.delete("/{project_id}")
-async def delete_project_route(project_id: UUID, db: Session = Depends(get_db)):
+async def delete_project_route(project_id: UUID, db: AsyncSession = Depends(get_async_db)):
     try:
         return await delete_project_service(db, project_id)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/enterprises/{enterprise_id}", response_model=list[ProjectResponse])
-async def get_projects_by_enterprise_id(enterprise_id: UUID, db: Session = Depends(get_db)):
+@router.get("/enterprises/{enterprise_id}", response_model=list[ProjectResponse], response_class=FastJSONResponse)
+async def get_projects_by_enterprise_id(
+    enterprise_id: UUID,
+    request: Request,
+    response: Response,
+    page_params: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db)
+):
     try:
-        projects = await list_enterprise_projects(db, enterprise_id)
-        return projects
+        # versão barata antes de carregar projetos e requisitos do Blob Storage
+        version = (await db.execute(enterprise_projects_version(enterprise_id))).one()
+        check_not_modified(request, response, version)
+        page = await list_enterprise_projects(db, enterprise_id, page_params)
+        return page.apply(response)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
@@ -80,7 +111,7 @@ async def get_projects_by_enterprise_id(enterprise_id: UUID, db: Session = Depen
 async def update_project_status_route(
     project_id: UUID,
     payload: UpdateStatusInput,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         updated = await update_project_status_service(db, str(project_id), payload.new_status)
@@ -1,17 +1,25 @@
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Query, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from api.v1.conditional import check_not_modified
+from api.v1.pagination import PageParams
+from api.v1.responses import FastJSONResponse
 from api.v1.repository.dashboard_repository import StudentDashboardRepository
 from api.v1.repository.task_repository import TaskSubmissionRepository
+from api.v1.repository.version_repository import visible_projects_version
 from api.v1.schemas.task_schema import TaskSubmissionCreate, TaskSubmissionResponse, StudentSubmissionResponse
 from api.v1.schemas.auth_schema import ForgotPasswordRequest, ForgotPasswordResponse, ResetPasswordRequest, ResetPasswordResponse
 from api.v1.services import student_service
 from api.v1.services.project_service import list_visible_projects
-from db.session import get_db
+from api.v1.services.student_import_service import get_import_job, start_student_import
+from db.session import get_async_db, get_db, get_read_db
 from api.v1.schemas.student_schema import (
     StudentCreateForm,
     StudentDashboardResponse,
+    StudentImportJobResponse,
     StudentLoginRequest, 
     StudentTokenResponse, 
     StudentResponse,
@@ -29,16 +37,17 @@ from api.v1.services.student_service import (
     update_student_service, 
     delete_student_service,
 )
-from api.v1.repository.student_repository import get_student_by_email, get_student_with_projects
+from api.v1.repository.student_repository import get_student_by_email_async, get_student_with_projects
 from api.v1.services.password_reset_service import PasswordResetService
 
 router = APIRouter()
 
 @router.post("/login", response_model=StudentTokenResponse)
-async def login(data: StudentLoginRequest, db: Session = Depends(get_db)):
-    student = get_student_by_email(db, data.email)
+async def login(data: StudentLoginRequest, db: AsyncSession = Depends(get_async_db)):
+    student = await get_student_by_email_async(db, data.email)
 
-    if not student or not verify_password(data.password, student.password):
+    # bcrypt é CPU-bound; roda fora do event loop
+    if not student or not await run_in_threadpool(verify_password, data.password, student.password):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     token_data = {"sub": str(student.id), "email": student.email}
@@ -111,12 +120,27 @@ def create_new_student(
     return create_student_service(form_data, db)
 
 @router.get("/", response_model=List[StudentResponse])
-def get_students(enterprise_id: str = Query(...), db: Session = Depends(get_db)):
-    return list_students(db, enterprise_id)
+def get_students(
+    response: Response,
+    enterprise_id: str = Query(...),
+    page_params: PageParams = Depends(),
+    db: Session = Depends(get_read_db)
+):
+    return list_students(db, enterprise_id, page_params).apply(response)
+
+@router.get("/visible-projects", response_class=FastJSONResponse)
+def get_visible_projects(request: Request, response: Response, page_params: PageParams = Depends(), db: Session = Depends(get_read_db)):
+    check_not_modified(request, response, db.execute(visible_projects_version()).one())
+    return list_visible_projects(db, page_params).apply(response)
+
+@router.post("/import", response_model=StudentImportJobResponse, status_code=202)
+def import_students(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
+    """Importa alunos de um CSV em segundo plano; acompanhe por GET /students/import/{job_id}."""
+    return start_student_import(file, background_tasks)
 
-@router.get("/visible-projects")
-def get_visible_projects(db: Session = Depends(get_db)):
-    return list_visible_projects(db)
+@router.get("/import/{job_id}", response_model=StudentImportJobResponse)
+def get_student_import(job_id: str):
+    return get_import_job(job_id)
 
 @router.get("/{student_id}", response_model=StudentResponse)
 def read_student(student_id: str, db: Session = Depends(get_db)):
@@ -195,7 +219,7 @@ def link_student_to_project(student_id: UUID, project_id: UUID, db: Session = De
     return student_service.link_student_to_project(db, student_id, project_id)
 
 @router.get("/{student_id}/dashboard", response_model=StudentDashboardResponse)
-def get_student_dashboard(student_id: UUID, db: Session = Depends(get_db)):
+def get_student_dashboard(student_id: UUID, db: Session = Depends(get_read_db)):
     try:
         data = StudentDashboardRepository.get_dashboard_data(db, student_id)
         return data
@@ -217,11 +241,18 @@ def submit_task(student_id: UUID, data: TaskSubmissionCreate, db: Session = Depe
     return TaskSubmissionRepository.create_submission(db, student_id, data)
 
 @router.get("/{student_id}/submissions", response_model=List[StudentSubmissionResponse])
-def get_student_submissions(student_id: UUID, db: Session = Depends(get_db)):
-    """Busca todas as submissões de um estudante"""
+def get_student_submissions(
+    student_id: UUID,
+    response: Response,
+    page_params: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    """Busca as submissões de um estudante, da mais recente para a mais antiga"""
     try:
-        submissions = TaskSubmissionRepository.get_student_submissions(db, str(student_id))
-        return submissions
+        page = TaskSubmissionRepository.get_student_submissions(db, str(student_id), page_params)
+        return page.apply(response)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from db.session import get_db
-from api.v1.schemas.student_project_schema import StudentProjectCreate, StudentProjectRead
-from api.v1.repository.student_project_repository import create_student_project
+from api.v1.schemas.student_project_schema import StudentProjectBulkCreate, StudentProjectBulkResult, StudentProjectCreate, StudentProjectRead
+from api.v1.repository.student_project_repository import create_student_project, create_student_projects_bulk
 
 router = APIRouter()
 
@@ -12,3 +12,10 @@ def create_student_project_link(
     db: Session = Depends(get_db)
 ):
     return create_student_project(db=db, link=link)
+
+@router.post("/bulk", response_model=StudentProjectBulkResult)
+def create_student_project_links_bulk(
+    data: StudentProjectBulkCreate,
+    db: Session = Depends(get_db)
+):
+    return create_student_projects_bulk(db=db, data=data)
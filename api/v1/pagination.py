@@ -0,0 +1,106 @@
+"""
+Paginação por cursor (keyset) para as rotas de listagem.
+
+O cursor é opaco para o cliente: base64 de (ordenação, id) do último item da página.
+A próxima página é buscada com WHERE (col, id) < (valor, id), então o custo não
+cresce com a posição na lista como aconteceria com OFFSET.
+
+O corpo das respostas continua sendo a lista de itens; o cursor da próxima página
+vai no header X-Next-Cursor (ausente na última página).
+"""
+import base64
+import json
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = int(os.getenv("PAGINATION_DEFAULT_LIMIT", "50"))
+MAX_PAGE_SIZE = int(os.getenv("PAGINATION_MAX_LIMIT", "200"))
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: datetime, item_id: Any) -> str:
+    raw = json.dumps([sort_value.isoformat(), str(item_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), item_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+
+
+class PageParams:
+    """Dependência com os parâmetros de paginação: ?cursor=...&limit=..."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="Valor do header X-Next-Cursor da página anterior"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+@dataclass
+class Page:
+    items: List[Any]
+    next_cursor: Optional[str] = None
+
+    def apply(self, response: Response) -> List[Any]:
+        """Publica o cursor no header da resposta e devolve os itens."""
+        if self.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = self.next_cursor
+        return self.items
+
+
+def keyset(query, params: PageParams, sort_column, id_column, descending: bool = True):
+    """
+    Aplica filtro do cursor, ordenação e limite (limit + 1, para saber se há próxima página).
+    Funciona com Query (sync) e select() (async).
+    """
+    if params.cursor:
+        sort_value, item_id = decode_cursor(params.cursor)
+        if getattr(id_column.type, "as_uuid", False):
+            item_id = uuid.UUID(item_id)
+        if descending:
+            query = query.filter(or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < item_id),
+            ))
+        else:
+            query = query.filter(or_(
+                sort_column > sort_value,
+                and_(sort_column == sort_value, id_column > item_id),
+            ))
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    return query.limit(params.limit + 1)
+
+
+def build_page(rows: List[Any], params: PageParams, key: Callable[[Any], Tuple[datetime, Any]]) -> Page:
+    """Corta a linha extra buscada por keyset() e gera o cursor a partir do último item."""
+    rows = list(rows)
+    if len(rows) <= params.limit:
+        return Page(items=rows)
+    rows = rows[:params.limit]
+    return Page(items=rows, next_cursor=encode_cursor(*key(rows[-1])))
+
+
+def paginate(query, params: PageParams, sort_column, id_column, descending: bool = True, key=None) -> Page:
+    """Atalho para Query síncrona: keyset() + all() + build_page()."""
+    if key is None:
+        key = lambda item: (getattr(item, sort_column.key), getattr(item, id_column.key))
+    rows = keyset(query, params, sort_column, id_column, descending).all()
+    return build_page(rows, params, key)
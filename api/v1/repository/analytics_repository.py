@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import Date, Integer, cast, func, literal_column
+from sqlalchemy.orm import Session
+
+from db.models.project import Project
+from db.models.task import Deliverable
+
+GRANULARITIES = ("day", "week", "month")
+
+
+def bucket_expression(column, granularity: str):
+    """
+    Início do período (dia, semana começando na segunda ou mês) de uma coluna de data, em T-SQL.
+    Só é usado no GROUP BY: o filtro por período é sempre um intervalo sobre a coluna pura.
+    As constantes vão inline (literal_column) porque o SQL Server não reconhece como iguais
+    expressões do SELECT e do GROUP BY que tenham parâmetros.
+    """
+    if granularity == "day":
+        return cast(column, Date)
+    if granularity == "week":
+        # dias desde 1900-01-01 (uma segunda-feira), arredondados para baixo em múltiplos de 7
+        days = func.datediff(literal_column("day"), literal_column("0"), column, type_=Integer)
+        return cast(
+            func.dateadd(literal_column("day"), days // literal_column("7", Integer) * literal_column("7", Integer), literal_column("0")),
+            Date
+        )
+    if granularity == "month":
+        return func.datefromparts(func.year(column), func.month(column), literal_column("1"))
+    raise ValueError(f"Granularidade inválida: {granularity}")
+
+
+class AnalyticsRepository:
+    @staticmethod
+    def count_completed_deliverables(
+        db: Session,
+        enterprise_id: str,
+        start: datetime,
+        end: datetime,
+        granularity: str = "month",
+        project_ids: Optional[List[str]] = None,
+    ):
+        """
+        Entregáveis concluídos por projeto e período, com created_at em [start, end).
+        Retorna linhas (project_id, project_name, bucket, count).
+        """
+        bucket = bucket_expression(Deliverable.created_at, granularity).label("bucket")
+
+        query = (
+            db.query(
+                Deliverable.project_id,
+                Project.name.label("project_name"),
+                bucket,
+                func.count(Deliverable.id).label("count")
+            )
+            .join(Project, Project.id == Deliverable.project_id)
+            .filter(
+                Project.enterprise_id == enterprise_id,
+                Deliverable.status == "COMPLETED",
+                Deliverable.created_at >= start,
+                Deliverable.created_at < end,
+            )
+        )
+
+        if project_ids:
+            query = query.filter(Project.id.in_(project_ids))
+
+        return (
+            query.group_by(Deliverable.project_id, Project.name, bucket)
+            .order_by(Project.name, bucket)
+            .all()
+        )
@@ -1,10 +1,30 @@
 from sqlalchemy.orm import Session
 
+from api.v1.pagination import Page, PageParams, paginate
 from db.models.chat_message import ChatMessage
 
 def save_message(db: Session, from_id: str, to_id: str, content: str):
     message = ChatMessage(from_id=from_id, to_id=to_id, content=content)
     db.add(message)
-    db.commit()
-    db.refresh(message)
+    db.flush()
     return message
+
+
+def get_chat_history(db: Session, user1_id: str, user2_id: str, params: PageParams) -> Page:
+    query = db.query(ChatMessage).filter(
+        ((ChatMessage.from_id == user1_id) & (ChatMessage.to_id == user2_id)) |
+        ((ChatMessage.from_id == user2_id) & (ChatMessage.to_id == user1_id))
+    )
+    # Ordem cronológica: o cursor avança para mensagens mais novas
+    page = paginate(query, params, ChatMessage.created_at, ChatMessage.id, descending=False)
+
+    page.items = [
+        {
+            "from_id": msg.from_id,
+            "to_id": msg.to_id,
+            "content": msg.content,
+            "created_at": msg.created_at
+        }
+        for msg in page.items
+    ]
+    return page
@@ -41,8 +41,7 @@ def create_country(db: Session, country: CountryCreate) -> Country:
         code=country.code,
     )
     db.add(db_country)
-    db.commit()
-    db.refresh(db_country)
+    db.flush()
     return db_country
 
 def update_country(db: Session, country_id: str, data: CountryUpdate) -> Country:
@@ -70,8 +69,7 @@ def update_country(db: Session, country_id: str, data: CountryUpdate) -> Country
         
     country.updated_at = datetime.now(timezone.utc)
 
-    db.commit()
-    db.refresh(country)
+    db.flush()
     return country
 
 def delete_country(db: Session, country_id: str) -> Country:
@@ -82,6 +80,5 @@ def delete_country(db: Session, country_id: str) -> Country:
     country.is_active = False
     country.deleted_at = datetime.now(timezone.utc)
 
-    db.commit()
-    db.refresh(country)
+    db.flush()
     return country 
\ No newline at end of file
@@ -1,84 +1,173 @@
-from sqlalchemy import func
+import os
+from datetime import datetime, timezone
+from typing import List, Optional
+from sqlalchemy import delete, distinct, func, insert, literal, select, update
 from sqlalchemy.orm import Session
 from uuid import UUID
 
+from api.v1.cache import TTLCache
 from db.models.project import Project
+from db.models.student import Student
+from db.models.student_dashboard import StudentDashboardSnapshot
 from db.models.student_project import StudentProject
 from db.models.task import Deliverable, Task
 
 
+# Resumo do dashboard por empresa; invalidado quando submissões, status de projetos ou vínculos mudam
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "30"))
+summary_cache = TTLCache(DASHBOARD_CACHE_TTL_SECONDS)
+
+ACTIVE_PROJECT_FILTER = (
+    Project.status != "COMPLETED",
+    Project.status != "CANCELLED",
+    Project.status != "PENDING",
+)
+
+
+def invalidate_enterprise_summary(db: Session, enterprise_id):
+    summary_cache.invalidate_on_commit(db, str(enterprise_id) if enterprise_id else None)
+
+
+def invalidate_summary_for_project(db: Session, project_id):
+    enterprise_id = db.execute(select(Project.enterprise_id).where(Project.id == project_id)).scalar()
+    invalidate_enterprise_summary(db, enterprise_id)
+
+
+def invalidate_summary_for_deliverable(db: Session, deliverable_id):
+    enterprise_id = db.execute(
+        select(Project.enterprise_id)
+        .join(Deliverable, Deliverable.project_id == Project.id)
+        .where(Deliverable.id == deliverable_id)
+    ).scalar()
+    invalidate_enterprise_summary(db, enterprise_id)
+
 
 class DashboardRepository:
     @staticmethod
-    def count_pending_tasks(db: Session, enterprise_id: UUID) -> int:
-        return (
-            db.query(Task)
+    def get_summary_counts(db: Session, enterprise_id: UUID) -> dict:
+        """Tarefas pendentes, projetos ativos e alunos em projetos ativos num único SELECT."""
+        pending_tasks = (
+            select(func.count(Task.id))
             .join(Deliverable, Task.deliverable_id == Deliverable.id)
             .join(Project, Deliverable.project_id == Project.id)
-            .filter(Project.enterprise_id == enterprise_id, Project.status != "PENDING", Task.status == "Pendente")
-            .count()
+            .where(Project.enterprise_id == enterprise_id, Project.status != "PENDING", Task.status == "Pendente")
+            .scalar_subquery()
         )
-
-    @staticmethod
-    def count_active_projects(db: Session, enterprise_id: UUID):
-        return (
-            db.query(Project)
-            .filter(Project.enterprise_id == enterprise_id, Project.status != "COMPLETED", Project.status != "CANCELLED", Project.status != "PENDING")
-            .count()
+        active_projects = (
+            select(func.count(Project.id))
+            .where(Project.enterprise_id == enterprise_id, *ACTIVE_PROJECT_FILTER)
+            .scalar_subquery()
         )
-
-    @staticmethod
-    def count_students_in_projects(db: Session, enterprise_id: UUID):
-        return (
-            db.query(StudentProject.student_id)
+        students_in_projects = (
+            select(func.count(distinct(StudentProject.student_id)))
             .join(Project, Project.id == StudentProject.project_id)
-            .filter(Project.enterprise_id == enterprise_id, Project.status != "COMPLETED", Project.status != "CANCELLED", Project.status != "PENDING")
-            .distinct()
-            .count()
+            .where(Project.enterprise_id == enterprise_id, *ACTIVE_PROJECT_FILTER)
+            .scalar_subquery()
         )
 
-class StudentDashboardRepository:
+        row = db.execute(select(
+            pending_tasks.label("pending_tasks"),
+            active_projects.label("active_projects"),
+            students_in_projects.label("students_in_projects"),
+        )).one()
+        return dict(row._mapping)
 
-    @staticmethod
-    def get_dashboard_data(db: Session, student_id: UUID):
-        # Subquery para pegar projetos do aluno
-        student_projects = (
-            db.query(StudentProject.project_id)
-            .filter(StudentProject.student_id == student_id)
-            .subquery()
+def student_dashboard_totals(student_ids: Optional[List[str]] = None):
+    """
+    SELECT com os números do dashboard por aluno, a partir dos contadores de progresso dos
+    projetos vinculados (cada projeto conta uma vez, mesmo com vínculo duplicado).
+    Alunos sem projetos aparecem com zeros.
+    """
+    links = select(StudentProject.student_id, StudentProject.project_id).distinct().subquery()
+    deliverables = (
+        select(Deliverable.project_id, func.count(Deliverable.id).label("total"))
+        .group_by(Deliverable.project_id)
+        .subquery()
+    )
+    totals = (
+        select(
+            links.c.student_id,
+            func.sum(Project.approved_tasks).label("completed_tasks"),
+            func.sum(Project.total_tasks - Project.approved_tasks).label("in_progress_tasks"),
+            func.sum(func.coalesce(deliverables.c.total, 0)).label("total_deliverables"),
         )
-
-        # Total de entregáveis
-        total_deliverables = (
-            db.query(Deliverable)
-            .join(Project, Deliverable.project_id == Project.id)
-            .filter(Deliverable.project_id.in_(student_projects))
-            .count()
+        .join(Project, Project.id == links.c.project_id)
+        .outerjoin(deliverables, deliverables.c.project_id == Project.id)
+        .group_by(links.c.student_id)
+        .subquery()
+    )
+    query = (
+        select(
+            Student.id.label("student_id"),
+            func.coalesce(totals.c.completed_tasks, 0).label("completed_tasks"),
+            func.coalesce(totals.c.in_progress_tasks, 0).label("in_progress_tasks"),
+            func.coalesce(totals.c.total_deliverables, 0).label("total_deliverables"),
         )
+        .outerjoin(totals, totals.c.student_id == Student.id)
+    )
+    if student_ids is not None:
+        query = query.where(Student.id.in_(student_ids))
+    return query
 
-        # Total de tarefas por status
-        tasks_query = (
-            db.query(Task.status, func.count(Task.id))
-            .join(Deliverable, Task.deliverable_id == Deliverable.id)
-            .join(Project, Deliverable.project_id == Project.id)
-            .filter(Project.id.in_(student_projects))
-            .group_by(Task.status)
-            .all()
+
+def refresh_student_snapshots(db: Session, student_ids: List[str]):
+    """Recalcula os snapshots dos alunos (vínculos novos ou removidos, reparo de divergência)."""
+    student_ids = [str(student_id) for student_id in student_ids]
+    if not student_ids:
+        return
+    db.execute(delete(StudentDashboardSnapshot).where(StudentDashboardSnapshot.student_id.in_(student_ids)))
+    source = student_dashboard_totals(student_ids).add_columns(
+        literal(datetime.now(timezone.utc)).label("updated_at")
+    )
+    db.execute(insert(StudentDashboardSnapshot).from_select(
+        ["student_id", "completed_tasks", "in_progress_tasks", "total_deliverables", "updated_at"], source
+    ))
+
+
+def refresh_snapshots_for_project(db: Session, project_id):
+    student_ids = db.execute(
+        select(StudentProject.student_id).where(StudentProject.project_id == str(project_id)).distinct()
+    ).scalars().all()
+    refresh_student_snapshots(db, student_ids)
+
+
+def apply_task_approval_to_snapshots(db: Session, deliverable_id: str, delta: int):
+    """Move delta tarefas de "em andamento" para "concluídas" em todos os alunos do projeto."""
+    if not delta:
+        return
+    project_id = select(Deliverable.project_id).where(Deliverable.id == deliverable_id).scalar_subquery()
+    db.execute(
+        update(StudentDashboardSnapshot)
+        .where(StudentDashboardSnapshot.student_id.in_(
+            select(StudentProject.student_id).where(StudentProject.project_id == project_id)
+        ))
+        .values(
+            completed_tasks=StudentDashboardSnapshot.completed_tasks + delta,
+            in_progress_tasks=StudentDashboardSnapshot.in_progress_tasks - delta,
+            updated_at=datetime.now(timezone.utc),
         )
+        .execution_options(synchronize_session=False)
+    )
 
-        # Processa os dados de status
-        completed_tasks = 0
-        in_progress_tasks = 0
 
-        for status, count in tasks_query:
-            if status == "Concluída":
-                completed_tasks = count
-            else:
-                in_progress_tasks += count
+class StudentDashboardRepository:
+
+    @staticmethod
+    def get_dashboard_data(db: Session, student_id: UUID):
+        # Leitura O(1) pela PK; sem snapshot (aluno novo ou antes do backfill), calcula na hora
+        row = db.execute(
+            select(
+                StudentDashboardSnapshot.completed_tasks,
+                StudentDashboardSnapshot.in_progress_tasks,
+                StudentDashboardSnapshot.total_deliverables,
+            ).where(StudentDashboardSnapshot.student_id == str(student_id))
+        ).first()
+        if row is None:
+            row = db.execute(student_dashboard_totals([str(student_id)])).first()
 
         return {
-            "completed_tasks": completed_tasks,
-            "in_progress_tasks": in_progress_tasks,
-            "total_deliverables": total_deliverables,
+            "completed_tasks": row.completed_tasks if row else 0,
+            "in_progress_tasks": row.in_progress_tasks if row else 0,
+            "total_deliverables": row.total_deliverables if row else 0,
             "certificate": 0
         }
@@ -0,0 +1,151 @@
+from datetime import date, datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import case, delete, func, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from api.v1.repository.analytics_repository import bucket_expression
+from db.models.delivery_rollup import DeliveryMonthlyRollup
+from db.models.project import Project
+from db.models.task import Deliverable
+
+
+def month_of(value) -> date:
+    """Primeiro dia do mês de uma data/datetime (chave da tabela de agregados)."""
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.replace(day=1)
+
+
+def bump_rollup(
+    db: Session,
+    project_id: str,
+    month: date,
+    enterprise_id: Optional[str] = None,
+    completed_deliverables: int = 0,
+    approved_tasks: int = 0,
+):
+    """
+    Soma os deltas na linha (projeto, mês) com UPDATE atômico; se a linha ainda não existe,
+    insere dentro de um savepoint. Se outra transação inseriu a mesma linha no meio tempo,
+    o INSERT falha pela PK e o UPDATE é refeito.
+    """
+    if not completed_deliverables and not approved_tasks:
+        return
+
+    stmt = (
+        update(DeliveryMonthlyRollup)
+        .where(DeliveryMonthlyRollup.project_id == project_id, DeliveryMonthlyRollup.month == month)
+        .values(
+            completed_deliverables=DeliveryMonthlyRollup.completed_deliverables + completed_deliverables,
+            approved_tasks=DeliveryMonthlyRollup.approved_tasks + approved_tasks,
+            updated_at=datetime.now(timezone.utc),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if db.execute(stmt).rowcount:
+        return
+
+    if enterprise_id is None:
+        enterprise_id = db.execute(select(Project.enterprise_id).where(Project.id == project_id)).scalar()
+    try:
+        with db.begin_nested():
+            db.execute(insert(DeliveryMonthlyRollup).values(
+                project_id=project_id,
+                month=month,
+                enterprise_id=enterprise_id,
+                completed_deliverables=completed_deliverables,
+                approved_tasks=approved_tasks,
+            ))
+    except IntegrityError:
+        db.execute(stmt)
+
+
+def set_deliverable_status(db: Session, deliverable: Deliverable, new_status: str, enterprise_id: Optional[str] = None):
+    """Altera o status do entregável mantendo o agregado mensal de entregáveis concluídos."""
+    delta = int(new_status == "COMPLETED") - int(deliverable.status == "COMPLETED")
+    deliverable.status = new_status
+    if delta:
+        bump_rollup(db, deliverable.project_id, month_of(deliverable.created_at), enterprise_id, completed_deliverables=delta)
+
+
+def record_approved_tasks(db: Session, deliverable_id: str, delta: int):
+    """Soma delta nas tarefas aprovadas do mês do entregável."""
+    if not delta:
+        return
+    row = db.execute(
+        select(Deliverable.project_id, Deliverable.created_at, Project.enterprise_id)
+        .join(Project, Project.id == Deliverable.project_id)
+        .where(Deliverable.id == deliverable_id)
+    ).first()
+    if row:
+        bump_rollup(db, row.project_id, month_of(row.created_at), row.enterprise_id, approved_tasks=delta)
+
+
+class DeliveryRollupRepository:
+    @staticmethod
+    def monthly_completed_deliverables(
+        db: Session,
+        enterprise_id: str,
+        start_month: date,
+        end_month: date,
+        project_ids: Optional[List[str]] = None,
+    ):
+        """
+        Entregáveis concluídos por projeto e mês em [start_month, end_month), lidos do agregado.
+        Mesmo formato de AnalyticsRepository.count_completed_deliverables.
+        """
+        query = (
+            db.query(
+                DeliveryMonthlyRollup.project_id,
+                Project.name.label("project_name"),
+                DeliveryMonthlyRollup.month.label("bucket"),
+                DeliveryMonthlyRollup.completed_deliverables.label("count"),
+            )
+            .join(Project, Project.id == DeliveryMonthlyRollup.project_id)
+            .filter(
+                DeliveryMonthlyRollup.enterprise_id == enterprise_id,
+                DeliveryMonthlyRollup.month >= start_month,
+                DeliveryMonthlyRollup.month < end_month,
+                DeliveryMonthlyRollup.completed_deliverables > 0,
+            )
+        )
+
+        if project_ids:
+            query = query.filter(DeliveryMonthlyRollup.project_id.in_(project_ids))
+
+        return query.order_by(Project.name, DeliveryMonthlyRollup.month).all()
+
+    @staticmethod
+    def rebuild(db: Session, enterprise_id: Optional[str] = None) -> int:
+        """
+        Recalcula o agregado a partir de deliverables (usa o contador approved_tasks de cada
+        entregável). Sem enterprise_id, reconstrói a tabela inteira. Retorna o número de linhas.
+        """
+        month = bucket_expression(Deliverable.created_at, "month")
+        source = (
+            select(
+                Deliverable.project_id,
+                month.label("month"),
+                Project.enterprise_id,
+                func.sum(case((Deliverable.status == "COMPLETED", 1), else_=0)).label("completed_deliverables"),
+                func.sum(Deliverable.approved_tasks).label("approved_tasks"),
+                literal(datetime.now(timezone.utc)).label("updated_at"),
+            )
+            .join(Project, Project.id == Deliverable.project_id)
+            .group_by(Deliverable.project_id, month, Project.enterprise_id)
+        )
+        clear = delete(DeliveryMonthlyRollup)
+        if enterprise_id is not None:
+            source = source.where(Project.enterprise_id == enterprise_id)
+            clear = clear.where(DeliveryMonthlyRollup.enterprise_id == enterprise_id)
+
+        db.execute(clear)
+        result = db.execute(
+            insert(DeliveryMonthlyRollup).from_select(
+                ["project_id", "month", "enterprise_id", "completed_deliverables", "approved_tasks", "updated_at"],
+                source,
+            )
+        )
+        return result.rowcount
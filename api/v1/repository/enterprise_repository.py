@@ -1,7 +1,8 @@
 from datetime import datetime, timezone
 from uuid import UUID
 from fastapi import HTTPException, status
-from sqlalchemy import and_
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 
@@ -14,92 +15,76 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def get_enterprise_by_id(db: Session, enterprise_id: UUID):
-    try:
-        return db.query(Enterprise).filter(Enterprise.id == enterprise_id).first()
-    finally:
-        db.close()
+    return db.query(Enterprise).filter(Enterprise.id == enterprise_id).first()
 
 
 def get_enterprise_by_username(db: Session, username: str):
-    try:
-        return db.query(Enterprise).filter(Enterprise.username == username).first()
-    finally:
-        db.close()
+    return db.query(Enterprise).filter(Enterprise.username == username).first()
 
 
 def get_enterprise_by_email(db: Session, email: str):
-    try:
-        return db.query(Enterprise).filter(Enterprise.email == email).first()
-    finally:
-        db.close()
+    return db.query(Enterprise).filter(Enterprise.email == email).first()
+
+
+async def get_enterprise_by_email_async(db: AsyncSession, email: str):
+    result = await db.execute(select(Enterprise).filter(Enterprise.email == email))
+    return result.scalars().first()
 
 
 def create_enterprise(db: Session, enterprise: EnterpriseCreateForm):
-    try:
-        existing = db.query(Enterprise).filter(Enterprise.email == enterprise.email).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already exists",
-            )
+    existing = db.query(Enterprise).filter(Enterprise.email == enterprise.email).first()
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already exists",
+        )
 
 
-        db.add(enterprise)
-        db.commit()
-        db.refresh(enterprise)
-        return enterprise
-    finally:
-        db.close()
+    db.add(enterprise)
+    db.flush()
+    return enterprise
 
 
 def update_enterprise(db: Session, enterprise_id: UUID, data: EnterpriseCreateForm) -> Enterprise:
-    try:
-        enterprise = db.query(Enterprise).filter(Enterprise.id == enterprise_id).first()
-        if not enterprise:
-            raise HTTPException(status_code=404, detail="Enterprise not found")
-
-        if data.cnpj:
-            existing = db.query(Enterprise).filter(
-                and_(Enterprise.cnpj == data.cnpj, Enterprise.id != enterprise_id)
-            ).first()
-            if existing:
-                raise HTTPException(status_code=400, detail="CNPJ is already in use")
-
-        if data.email:
-            existing_email = db.query(Enterprise).filter(
-                and_(Enterprise.email == data.email, Enterprise.id != enterprise_id)
-            ).first()
-            if existing_email:
-                raise HTTPException(status_code=400, detail="E-mail is already in use")
-
-        for field, value in data.__dict__.items():
-            setattr(enterprise, field, value)
-
-        enterprise.updated_at = datetime.now(timezone.utc)
-        db.commit()
-        db.refresh(enterprise)
-        return enterprise
-    finally:
-        db.close()
+    enterprise = db.query(Enterprise).filter(Enterprise.id == enterprise_id).first()
+    if not enterprise:
+        raise HTTPException(status_code=404, detail="Enterprise not found")
 
+    if data.cnpj:
+        existing = db.query(Enterprise).filter(
+            and_(Enterprise.cnpj == data.cnpj, Enterprise.id != enterprise_id)
+        ).first()
+        if existing:
+            raise HTTPException(status_code=400, detail="CNPJ is already in use")
 
-def delete_enterprise(db: Session, enterprise_id: UUID) -> bool:
-    try:
-        enterprise = db.query(Enterprise).filter(
-            Enterprise.id == enterprise_id,
-            Enterprise.is_active == True
+    if data.email:
+        existing_email = db.query(Enterprise).filter(
+            and_(Enterprise.email == data.email, Enterprise.id != enterprise_id)
         ).first()
+        if existing_email:
+            raise HTTPException(status_code=400, detail="E-mail is already in use")
+
+    for field, value in data.__dict__.items():
+        setattr(enterprise, field, value)
 
-        if not enterprise:
-            raise HTTPException(status_code=404, detail="Enterprise not found or already inactive")
+    enterprise.updated_at = datetime.now(timezone.utc)
+    db.flush()
+    return enterprise
 
-        enterprise.is_active = False
-        enterprise.deleted_at = datetime.now(timezone.utc)
-        db.commit()
-        db.refresh(enterprise)
-        return enterprise
-    finally:
-        db.close()
+
+def delete_enterprise(db: Session, enterprise_id: UUID) -> bool:
+    enterprise = db.query(Enterprise).filter(
+        Enterprise.id == enterprise_id,
+        Enterprise.is_active == True
+    ).first()
+
+    if not enterprise:
+        raise HTTPException(status_code=404, detail="Enterprise not found or already inactive")
+
+    enterprise.is_active = False
+    enterprise.deleted_at = datetime.now(timezone.utc)
+    db.flush()
+    return enterprise
 
 def list_enterprises_by_student(db: Session, student_id: UUID):
     """
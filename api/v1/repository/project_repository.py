@@ -1,14 +1,21 @@
 from typing import List
+import uuid
 from uuid import UUID
 from fastapi import HTTPException
-from sqlalchemy import String, case, cast, extract, func, literal, text
+from sqlalchemy import String, case, cast, extract, func, insert, literal, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.exc import NoResultFound
 from db.models.project import Project
 from db.models.student import Student
 from db.models.student_project import StudentProject
 from db.models.task import AcceptanceCriteria, Deliverable, Task
 from sqlalchemy.orm import Session
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
+
+from api.v1.pagination import Page, PageParams, build_page, keyset, paginate
+from api.v1.repository.dashboard_repository import invalidate_enterprise_summary, refresh_student_snapshots
+from api.v1.repository.delivery_rollup_repository import set_deliverable_status
+from api.v1.search_index import index_project_on_commit, remove_project_on_commit
 
 from db.models.enterprise import Enterprise
 
@@ -34,154 +41,211 @@ async def save_project_to_sql(
     score: str,
     country: str):
     
-    try:
-        project = Project(
-            name=project_name,
-            enterprise_id=enterprise_id,
-            blob_path=blob_path,
-            description=description,
-            technologies=technologies,
-            complexity=complexity,
-            category=category,
-            score=score,
-            country=country
-        )
-        
-        enterprise = db.query(Enterprise).filter(Enterprise.id == project.enterprise_id).first()
-        if not enterprise:
-            raise HTTPException(status_code=400, detail="Enterprise not found.")
-        
-        db.add(project)
-        db.flush()  # Para gerar o ID do projeto
-
-        for ent in deliverables:
-            deliverable = Deliverable(name=ent["nome"], project_id=project.id)
-            db.add(deliverable)
-            db.flush()
-
-            for task in ent["tarefas"]:
-                task_obj = Task(
-                    name=task["nome"],
-                    description=task["descricao"],
-                    estimated_time=task["tempo_estimado"],
-                    deliverable_id=deliverable.id,
-                )
-                db.add(task_obj)
-                db.flush()
-
-                for criterio in task["criterios_de_aceitacao"]:
-                    crit = AcceptanceCriteria(description=criterio, task_id=task_obj.id)
-                    db.add(crit)
-
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        raise e
-    finally:
-        db.close()
-
-async def get_all_projects(db: Session) -> List[Project]:
-    return (
-        db.query(Project)
-        .options(joinedload(Project.students))
-        .all()
+    project = Project(
+        name=project_name,
+        enterprise_id=enterprise_id,
+        blob_path=blob_path,
+        description=description,
+        technologies=technologies,
+        complexity=complexity,
+        category=category,
+        score=score,
+        country=country,
+        total_tasks=sum(len(ent["tarefas"]) for ent in deliverables)
     )
+    
+    enterprise = db.query(Enterprise).filter(Enterprise.id == project.enterprise_id).first()
+    if not enterprise:
+        raise HTTPException(status_code=400, detail="Enterprise not found.")
+    
+    db.add(project)
+    db.flush()
+
+    # IDs gerados no cliente: entregáveis, tarefas e critérios saem em três executemany,
+    # independentemente do tamanho do projeto
+    deliverable_rows, task_rows, criteria_rows = [], [], []
+    for ent in deliverables:
+        deliverable_id = str(uuid.uuid4())
+        deliverable_rows.append({
+            "id": deliverable_id,
+            "name": ent["nome"],
+            "project_id": project.id,
+            "total_tasks": len(ent["tarefas"]),
+        })
+
+        for task in ent["tarefas"]:
+            task_id = str(uuid.uuid4())
+            task_rows.append({
+                "id": task_id,
+                "name": task["nome"],
+                "description": task["descricao"],
+                "estimated_time": task["tempo_estimado"],
+                "deliverable_id": deliverable_id,
+            })
+
+            for criterio in task["criterios_de_aceitacao"]:
+                criteria_rows.append({"id": str(uuid.uuid4()), "description": criterio, "task_id": task_id})
+
+    for model, rows in ((Deliverable, deliverable_rows), (Task, task_rows), (AcceptanceCriteria, criteria_rows)):
+        if rows:
+            db.execute(insert(model), rows)
 
-async def get_project_by_id(db: Session, project_id: int) -> Project:
-    try:
-        project = db.query(Project).options(
+    index_project_on_commit(db, project.id, project.name)
+
+async def get_all_projects(db: AsyncSession, params: PageParams) -> Page:
+    # team é serializado na resposta; progress vem dos contadores da própria linha
+    stmt = keyset(
+        select(Project).options(selectinload(Project.students)),
+        params, Project.created_at, Project.id
+    )
+    result = await db.execute(stmt)
+    return build_page(result.scalars().all(), params, key=lambda p: (p.created_at, p.id))
+
+async def get_project_by_id(db: AsyncSession, project_id: int) -> Project:
+    result = await db.execute(
+        select(Project).options(
             joinedload(Project.deliverables)
             .joinedload(Deliverable.tasks)
-            .joinedload(Task.acceptance_criteria)).filter(Project.id == project_id).first()
-        if not project:
-            raise NoResultFound("Project not found")
-        return project
-    finally:
-        db.close()
-
-async def update_project(db: Session, project_id: int, new_name: str) -> Project:
-    try:
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
-            raise NoResultFound("Project not found")
-
-        project.name = new_name
-        db.commit()
-        db.refresh(project)
-        return project
-    finally:
-        db.close()
-
-async def delete_project(db: Session, project_id: int) -> bool:
-    try:
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
-            raise NoResultFound("Project not found")
-
-        db.delete(project)
-        db.commit()
-        return True
-    finally:
-        db.close()
+            .joinedload(Task.acceptance_criteria)).filter(Project.id == project_id)
+    )
+    project = result.unique().scalars().first()
+    if not project:
+        raise NoResultFound("Project not found")
+    return project
+
+async def update_project(db: AsyncSession, project_id: int, new_name: str) -> Project:
+    result = await db.execute(select(Project).filter(Project.id == project_id))
+    project = result.scalars().first()
+    if not project:
+        raise NoResultFound("Project not found")
+
+    project.name = new_name
+    await db.flush()
+    index_project_on_commit(db, project.id, new_name)
+    return project
+
+async def delete_project(db: AsyncSession, project_id: int) -> bool:
+    result = await db.execute(select(Project).filter(Project.id == project_id))
+    project = result.scalars().first()
+    if not project:
+        raise NoResultFound("Project not found")
+
+    student_ids = (await db.execute(
+        select(StudentProject.student_id).filter(StudentProject.project_id == project_id).distinct()
+    )).scalars().all()
+
+    await db.delete(project)
+    await db.flush()
+    invalidate_enterprise_summary(db, project.enterprise_id)
+    remove_project_on_commit(db, project.id)
+    await db.run_sync(refresh_student_snapshots, student_ids)
+    return True
 
 def get_projects_by_enterprise(db: Session, enterprise_id: str)-> List[Project]:
-    try:
-        return db.query(Project).options(
-            joinedload(Project.students),
-            joinedload(Project.deliverables)
-            .joinedload(Deliverable.tasks)
-            .joinedload(Task.acceptance_criteria)
-        ).filter(Project.enterprise_id == enterprise_id).all()
-    finally:
-        db.close()
+    return db.query(Project).options(
+        joinedload(Project.students),
+        joinedload(Project.deliverables)
+        .joinedload(Deliverable.tasks)
+        .joinedload(Task.acceptance_criteria)
+    ).filter(Project.enterprise_id == enterprise_id).all()
         
-def filter_projects_by_name(db: Session, name: str):
-    return db.query(Project).filter(Project.name.ilike(f"%{name}%")).all()
+async def get_projects_by_enterprise_async(db: AsyncSession, enterprise_id: str, params: PageParams) -> Page:
+    stmt = keyset(
+        select(Project).options(
+            selectinload(Project.students),
+            selectinload(Project.deliverables)
+            .selectinload(Deliverable.tasks)
+            .selectinload(Task.acceptance_criteria)
+        ).filter(Project.enterprise_id == enterprise_id),
+        params, Project.created_at, Project.id
+    )
+    result = await db.execute(stmt)
+    return build_page(result.scalars().all(), params, key=lambda p: (p.created_at, p.id))
+
+def get_projects_by_ids(db: Session, project_ids: List[str]) -> List[Project]:
+    """Carrega os projetos com tudo o que ProjectResponse serializa, em lotes (sem lazy load por linha)."""
+    if not project_ids:
+        return []
+    return db.query(Project).options(
+        selectinload(Project.students),
+        selectinload(Project.deliverables)
+        .selectinload(Deliverable.tasks)
+        .selectinload(Task.acceptance_criteria)
+    ).filter(Project.id.in_(project_ids)).all()
 
 
 def can_transition(current: str, new: str) -> bool:
     return new in valid_transitions.get(current, [])
 
 def update_project_status(db: Session, project_id: str, new_status: str):
-    try:
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
-            raise NoResultFound("Project not found")
-        
-        current_status = project.status
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise NoResultFound("Project not found")
+    
+    current_status = project.status
 
-        if not can_transition(current_status, new_status):
-            raise HTTPException(status_code=400, detail=f"Cannot transition from {current_status} to {new_status}")
+    if not can_transition(current_status, new_status):
+        raise HTTPException(status_code=400, detail=f"Cannot transition from {current_status} to {new_status}")
 
-        project.status = new_status
-        
-        if new_status == "IN_PROGRESS":
-            for deliverable in project.deliverables:
-                if deliverable.status in ["IN_PLANNING"]:
-                    deliverable.status = "IN_DEVELOPMENT"
-                    
-        if new_status == "COMPLETED":
+    project.status = new_status
+    invalidate_enterprise_summary(db, project.enterprise_id)
+    
+    if new_status == "IN_PROGRESS":
+        for deliverable in project.deliverables:
+            if deliverable.status in ["IN_PLANNING"]:
+                deliverable.status = "IN_DEVELOPMENT"
+                
+    if new_status == "COMPLETED":
+        for deliverable in project.deliverables:
+            if deliverable.status in ["IN_DEVELOPMENT"]:
+                set_deliverable_status(db, deliverable, "COMPLETED", project.enterprise_id)
+    
+    db.flush()
+    return project
+    
+async def update_project_status_async(db: AsyncSession, project_id: str, new_status: str):
+    result = await db.execute(
+        select(Project).options(selectinload(Project.deliverables)).filter(Project.id == project_id)
+    )
+    project = result.scalars().first()
+    if not project:
+        raise NoResultFound("Project not found")
+
+    current_status = project.status
+
+    if not can_transition(current_status, new_status):
+        raise HTTPException(status_code=400, detail=f"Cannot transition from {current_status} to {new_status}")
+
+    project.status = new_status
+    invalidate_enterprise_summary(db, project.enterprise_id)
+
+    if new_status == "IN_PROGRESS":
+        for deliverable in project.deliverables:
+            if deliverable.status in ["IN_PLANNING"]:
+                deliverable.status = "IN_DEVELOPMENT"
+
+    if new_status == "COMPLETED":
+        # o agregado mensal é mantido pelo helper síncrono, na mesma transação
+        def complete_deliverables(session: Session):
             for deliverable in project.deliverables:
                 if deliverable.status in ["IN_DEVELOPMENT"]:
-                    deliverable.status = "COMPLETED"
-        
-        db.commit()
-        db.refresh(project)
-        return project
-    finally:
-        db.close()
-        
-def get_visible_projects_for_students(db: Session) -> List[Project]:
-  return (
+                    set_deliverable_status(session, deliverable, "COMPLETED", project.enterprise_id)
+
+        await db.run_sync(complete_deliverables)
+
+    await db.flush()
+    return project
+
+def get_visible_projects_for_students(db: Session, params: PageParams) -> Page:
+    query = (
         db.query(Project)
         .options(
             joinedload(Project.owner),  # para acessar project.owner.name
-            joinedload(Project.deliverables).joinedload(Deliverable.tasks)  # para acessar deliverable.tasks
+            selectinload(Project.deliverables).selectinload(Deliverable.tasks)  # para acessar deliverable.tasks
         )
         .filter(Project.status != "PENDING")
-        .order_by(Project.created_at.desc())
-        .all()
     )
+    return paginate(query, params, Project.created_at, Project.id)
 
 def list_projects_by_enterprise(db: Session, enterprise_id: UUID) -> List[Project]:
     return (
@@ -189,4 +253,12 @@ def list_projects_by_enterprise(db: Session, enterprise_id: UUID) -> List[Projec
         .filter(Project.enterprise_id == enterprise_id)
         .order_by(Project.name)
         .all()
-    )
\ No newline at end of file
+    )
+
+async def list_projects_by_enterprise_async(db: AsyncSession, enterprise_id: UUID) -> List[Project]:
+    result = await db.execute(
+        select(Project)
+        .filter(Project.enterprise_id == enterprise_id)
+        .order_by(Project.name)
+    )
+    return result.scalars().all()
\ No newline at end of file
@@ -1,13 +1,71 @@
+import os
+from collections import Counter
+from fastapi import HTTPException
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
-from api.v1.schemas.student_project_schema import StudentProjectCreate
+from api.v1.repository.dashboard_repository import invalidate_enterprise_summary, invalidate_summary_for_project, refresh_student_snapshots
+from api.v1.schemas.student_project_schema import StudentProjectBulkCreate, StudentProjectCreate
+from db.models.project import Project
+from db.models.student import Student
 from db.models.student_project import StudentProject
 
+STUDENT_PROJECT_BULK_MAX_SIZE = int(os.getenv("STUDENT_PROJECT_BULK_MAX_SIZE", "1000"))
+
 def create_student_project(db: Session, link: StudentProjectCreate):
     student_project = StudentProject(
         student_id=link.student_id,
         project_id=link.project_id
     )
     db.add(student_project)
-    db.commit()
-    db.refresh(student_project)
+    db.flush()
+    invalidate_summary_for_project(db, link.project_id)
+    refresh_student_snapshots(db, [link.student_id])
     return student_project
+
+def create_student_projects_bulk(db: Session, data: StudentProjectBulkCreate) -> dict:
+    """
+    Vincula uma turma de alunos a um projeto: uma consulta por tabela para validar os ids
+    (projeto, alunos e vínculos existentes), um INSERT em lote para os vínculos novos.
+    Alunos já vinculados ao projeto e ids repetidos no pedido são ignorados e listados no retorno.
+    """
+    counts = Counter(str(student_id) for student_id in data.student_ids)
+    student_ids = list(counts)
+    duplicates = [student_id for student_id, count in counts.items() if count > 1]
+    if len(student_ids) > STUDENT_PROJECT_BULK_MAX_SIZE:
+        raise HTTPException(status_code=400, detail=f"Lote maior que o limite de {STUDENT_PROJECT_BULK_MAX_SIZE} alunos.")
+
+    project = db.execute(
+        select(Project.id, Project.status, Project.enterprise_id).where(Project.id == data.project_id)
+    ).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if project.status in ("PENDING", "CANCELLED"):
+        raise HTTPException(
+            status_code=400,
+            detail="Cannot join a project that has not started or has been cancelled"
+        )
+
+    found = set(db.execute(select(Student.id).where(Student.id.in_(student_ids))).scalars())
+    missing = [student_id for student_id in student_ids if student_id not in found]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Students not found: {', '.join(missing)}")
+
+    linked = set(db.execute(
+        select(StudentProject.student_id)
+        .where(StudentProject.project_id == project.id, StudentProject.student_id.in_(student_ids))
+    ).scalars())
+    created = [student_id for student_id in student_ids if student_id not in linked]
+
+    if created:
+        db.execute(insert(StudentProject), [
+            {"student_id": student_id, "project_id": project.id} for student_id in created
+        ])
+        invalidate_enterprise_summary(db, project.enterprise_id)
+        refresh_student_snapshots(db, created)
+
+    return {
+        "project_id": project.id,
+        "created": created,
+        "skipped": [student_id for student_id in student_ids if student_id in linked],
+        "duplicates": duplicates,
+    }
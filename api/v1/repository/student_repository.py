@@ -4,9 +4,14 @@ from db.models.student import Student
 from db.models.task import Task, Deliverable
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import and_, func
+from typing import List
+from sqlalchemy import and_, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, Session
 from passlib.context import CryptContext
+from api.v1.pagination import Page, PageParams, paginate
+from api.v1.repository.dashboard_repository import invalidate_enterprise_summary, refresh_student_snapshots
+from api.v1.repository.submission_search_repository import rename_student_in_search
 from api.v1.schemas.student_schema import StudentUpdate
 from db.models.student_project import StudentProject
 
@@ -18,6 +23,10 @@ def get_student_by_id(db: Session, student_id: str):
 def get_student_by_email(db: Session, email: str):
     return db.query(Student).filter(Student.email == email, Student.is_active == True).first()
 
+async def get_student_by_email_async(db: AsyncSession, email: str):
+    result = await db.execute(select(Student).filter(Student.email == email, Student.is_active == True))
+    return result.scalars().first()
+
 def get_student_with_projects_and_deliverables(db: Session, student_id: str):
     """Busca o aluno com seus projetos, entregáveis e tasks de cada entregável."""
     return db.query(Student).options(
@@ -47,11 +56,19 @@ def get_student_with_projects(db: Session, student_id: str):
         
 def repo_create_student(db: Session, student: Student):
     db.add(student)
-    db.commit()
-    db.refresh(student)
+    db.flush()
     return student
 
-def get_all_students(db: Session, enterprise_id: str):
+def existing_student_emails(db: Session, emails: List[str]) -> set:
+    """E-mails (em minúsculas) da lista que já pertencem a algum aluno; uma consulta por lote."""
+    found = db.execute(select(Student.email).where(Student.email.in_(emails))).scalars()
+    return {email.lower() for email in found}
+
+def insert_students(db: Session, rows: List[dict]):
+    """INSERT em lote (executemany); id e colunas de controle vêm dos defaults do model."""
+    db.execute(insert(Student), rows)
+
+def get_all_students(db: Session, enterprise_id: str, params: PageParams) -> Page:
     subquery = (
         db.query(
             StudentProject.student_id,
@@ -63,14 +80,17 @@ def get_all_students(db: Session, enterprise_id: str):
         .subquery()
     )
 
-    result = (
+    query = (
         db.query(Student, subquery.c.project_count)
         .join(subquery, Student.id == subquery.c.student_id)  # <-- INNER JOIN 
         .filter(Student.is_active == True)
-        .all()
+    )
+    page = paginate(
+        query, params, Student.created_at, Student.id,
+        key=lambda row: (row[0].created_at, row[0].id)
     )
 
-    return [
+    page.items = [
         {
             "id": student.id,
             "name": student.name,
@@ -89,8 +109,9 @@ def get_all_students(db: Session, enterprise_id: str):
             "updated_at": student.updated_at,
             "project_count": project_count
         }
-        for student, project_count in result
+        for student, project_count in page.items
     ]
+    return page
     
 def get_all_students_by_project(db: Session, student_id: str):
     student = db.query(Student).filter(Student.id == student_id).first()
@@ -125,8 +146,9 @@ def link_student_to_project(db: Session, student_id: uuid.UUID, project_id: uuid
     )
 
     db.add(student_project)
-    db.commit()
-    db.refresh(student_project)
+    db.flush()
+    invalidate_enterprise_summary(db, project.enterprise_id)
+    refresh_student_snapshots(db, [student.id])
 
     return student_project
 
@@ -155,11 +177,12 @@ def update_student(db: Session, student_id: str, data: StudentUpdate) -> Student
 
     for field, value in update_data.items():
         setattr(student, field, value)
+    if 'name' in update_data:
+        rename_student_in_search(db, student.id, student.name)
         
     student.updated_at = datetime.now(timezone.utc)
 
-    db.commit()
-    db.refresh(student)
+    db.flush()
     return student
 
 def delete_student(db: Session, student_id: str) -> Student:
@@ -170,6 +193,5 @@ def delete_student(db: Session, student_id: str) -> Student:
     student.is_active = False
     student.deleted_at = datetime.now(timezone.utc)
 
-    db.commit()
-    db.refresh(student)
+    db.flush()
     return student
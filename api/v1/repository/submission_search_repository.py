@@ -0,0 +1,57 @@
+import os
+import re
+
+from sqlalchemy import insert, or_, select, text, update
+from sqlalchemy.orm import Session
+
+from db.models.submission_search import SubmissionSearch
+
+# Com o índice full-text da migração 0007: busca por prefixo de palavra via CONTAINS.
+# Sem ele: LIKE '%termo%' na tabela de busca (uma tabela estreita, sem joins).
+SUBMISSION_SEARCH_FULLTEXT = os.getenv("SUBMISSION_SEARCH_FULLTEXT", "false").lower() in ("1", "true", "yes", "on")
+
+SEARCH_COLUMNS = (SubmissionSearch.student_name, SubmissionSearch.deliverable_name, SubmissionSearch.task_name)
+
+
+def fulltext_query(search: str) -> str:
+    """'joão api' -> '"joão*" AND "api*"' (cada palavra como prefixo)."""
+    words = re.findall(r"\w+", search)
+    return " AND ".join(f'"{word}*"' for word in words)
+
+
+def index_submission(db: Session, submission_id: str, enterprise_id: str, student_id: str,
+                     student_name: str, deliverable_name: str, task_name: str):
+    db.execute(insert(SubmissionSearch).values(
+        submission_id=str(submission_id),
+        enterprise_id=str(enterprise_id),
+        student_id=str(student_id),
+        student_name=student_name or "",
+        deliverable_name=deliverable_name or "",
+        task_name=task_name or "",
+    ))
+
+
+def rename_student_in_search(db: Session, student_id: str, name: str):
+    db.execute(
+        update(SubmissionSearch)
+        .where(SubmissionSearch.student_id == str(student_id))
+        .values(student_name=name or "")
+        .execution_options(synchronize_session=False)
+    )
+
+
+class SubmissionSearchRepository:
+    @staticmethod
+    def matching_ids(enterprise_id, search: str):
+        """Subquery com os IDs das submissões da empresa que casam com o termo."""
+        query = select(SubmissionSearch.submission_id).where(SubmissionSearch.enterprise_id == str(enterprise_id))
+
+        terms = fulltext_query(search) if SUBMISSION_SEARCH_FULLTEXT else None
+        if terms:
+            return query.where(
+                text("CONTAINS((student_name, deliverable_name, task_name), :search_terms)")
+                .bindparams(search_terms=terms)
+            )
+
+        search_like = f"%{search.lower()}%"
+        return query.where(or_(*[column.ilike(search_like) for column in SEARCH_COLUMNS]))
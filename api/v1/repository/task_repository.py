@@ -1,19 +1,91 @@
+import os
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Optional
 from uuid import UUID
 from fastapi import HTTPException
 from requests import Session
-from sqlalchemy import func, or_
-from sqlalchemy.orm import joinedload
-
-from api.v1.schemas.project_schema import ProjectResponse
-from api.v1.schemas.student_schema import StudentResponse
-from api.v1.schemas.task_schema import DeliverableWithTasks, ProjectResponseSchema, SubmissionWithDeliverable, TaskBasicInfo, TaskSubmissionCreate, TaskSubmissionValidate
+from sqlalchemy import case, exists, select, update
+from sqlalchemy.orm import joinedload, selectinload
+
+from api.v1.pagination import DEFAULT_PAGE_SIZE, Page, PageParams, paginate
+from api.v1.repository.dashboard_repository import apply_task_approval_to_snapshots, invalidate_enterprise_summary, invalidate_summary_for_project
+from api.v1.repository.delivery_rollup_repository import record_approved_tasks, set_deliverable_status
+from api.v1.repository.submission_search_repository import SubmissionSearchRepository, index_submission
+from api.v1.schemas.task_schema import SubmissionDecision, TaskSubmissionBatchValidate, TaskSubmissionCreate, TaskSubmissionValidate
+from api.v1.serialization import SubmissionSerializer
 from db.models.enterprise import Enterprise
 from db.models.project import Project
 from db.models.student import Student
 from db.models.task import Deliverable, Task, TaskSubmission
 
+VALIDATE_BATCH_MAX_SIZE = int(os.getenv("VALIDATE_BATCH_MAX_SIZE", "500"))
+
+
+def adjust_approved_tasks(db: Session, deliverable_id: str, delta: int):
+    """
+    Soma delta em approved_tasks do entregável e do projeto (e nos agregados que dependem
+    deles) com UPDATEs atômicos no banco,
+    sem ler-modificar-gravar (validações simultâneas não perdem incrementos).
+    Objetos já carregados na sessão não são sincronizados.
+    """
+    if not delta:
+        return
+    db.execute(
+        update(Deliverable)
+        .where(Deliverable.id == deliverable_id)
+        .values(approved_tasks=Deliverable.approved_tasks + delta)
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        update(Project)
+        .where(Project.id == select(Deliverable.project_id).where(Deliverable.id == deliverable_id).scalar_subquery())
+        .values(approved_tasks=Project.approved_tasks + delta)
+        .execution_options(synchronize_session=False)
+    )
+    record_approved_tasks(db, deliverable_id, delta)
+    apply_task_approval_to_snapshots(db, deliverable_id, delta)
+
+
+def set_task_status(db: Session, task: Task, new_status: str):
+    """Altera o status da tarefa mantendo os contadores de progresso."""
+    delta = int(new_status == "APPROVED") - int(task.status == "APPROVED")
+    task.status = new_status
+    adjust_approved_tasks(db, task.deliverable_id, delta)
+
+
+def load_submission_page(db: Session, id_query, params: PageParams) -> Page:
+    """
+    Página das listagens de submissões em duas etapas. id_query seleciona só
+    (TaskSubmission.id, TaskSubmission.submitted_at) com os filtros: cursor e LIMIT valem
+    sobre uma linha por submissão. Depois as submissões da página são carregadas por id,
+    com selectinload (uma consulta por relação, para a página toda).
+
+    Com joinedload da coleção Deliverable.tasks na mesma consulta do LIMIT, cada submissão
+    vinha repetida uma vez por tarefa do entregável e o custo crescia com o tamanho dos
+    entregáveis, não com o da página.
+    """
+    id_page = paginate(id_query, params, TaskSubmission.submitted_at, TaskSubmission.id)
+    ids = [row.id for row in id_page.items]
+    if not ids:
+        return Page(items=[], next_cursor=id_page.next_cursor)
+
+    task_loader = selectinload(TaskSubmission.task).selectinload(Task.deliverable)
+    loaded = (
+        db.query(TaskSubmission)
+        .options(
+            task_loader.selectinload(Deliverable.project),
+            task_loader.selectinload(Deliverable.tasks),
+            selectinload(TaskSubmission.student),
+            selectinload(TaskSubmission.validator),
+        )
+        .filter(TaskSubmission.id.in_(ids))
+        .all()
+    )
+    by_id = {submission.id: submission for submission in loaded}
+    submissions = [by_id[submission_id] for submission_id in ids if submission_id in by_id]
+    return Page(items=SubmissionSerializer().serialize(submissions), next_cursor=id_page.next_cursor)
+
 
 class TaskSubmissionRepository:
     @staticmethod
@@ -56,11 +128,11 @@ class TaskSubmissionRepository:
             last_submission.validated_by = None
             last_submission.submitted_at = datetime.utcnow()
 
-            task.status = "PENDING"
-            deliverable.status = "IN_DEVELOPMENT"
+            set_task_status(db, task, "PENDING")
+            set_deliverable_status(db, deliverable, "IN_DEVELOPMENT")
+            invalidate_summary_for_project(db, deliverable.project_id)
 
-            db.commit()
-            db.refresh(last_submission)
+            db.flush()
             return last_submission
 
         if last_submission:
@@ -78,64 +150,131 @@ class TaskSubmissionRepository:
         )
         db.add(submission)
 
-        task.status = "PENDING"
-        deliverable.status = "IN_DEVELOPMENT"
-
-        db.commit()
-        db.refresh(submission)
+        set_task_status(db, task, "PENDING")
+        set_deliverable_status(db, deliverable, "IN_DEVELOPMENT")
+        invalidate_summary_for_project(db, deliverable.project_id)
+
+        db.flush()
+        # entregável sem projeto não aparece em nenhuma fila de revisão: fica fora do índice
+        enterprise_id = db.execute(select(Project.enterprise_id).where(Project.id == deliverable.project_id)).scalar()
+        if enterprise_id is not None:
+            index_submission(
+                db, submission.id, enterprise_id, student_id,
+                student.name, deliverable.name, task.name
+            )
         return submission
 
     @staticmethod
     def validate_submission(db: Session, submission_id: UUID, data: TaskSubmissionValidate):
-        enterprise = db.query(Enterprise).filter(Enterprise.id == data.validator_id).first()
-        if not enterprise:
-            raise HTTPException(status_code=404, detail="Empresa validadora não encontrada")
-
-        submission = db.query(TaskSubmission).filter(TaskSubmission.id == str(submission_id)).first()
-        if not submission:
-            raise HTTPException(status_code=404, detail="Submissão não encontrada.")
-
-        if data.status not in ("APPROVED", "REJECTED"):
-            raise HTTPException(status_code=400, detail="Status inválido. Use 'APPROVED' ou 'REJECTED'.")
-
-        submission.status = data.status
-        submission.feedback = data.feedback
-        submission.task.status = data.status
-        submission.validated_by = str(data.validator_id)
-        submission.validated_at = datetime.now(timezone.utc)
+        TaskSubmissionRepository.validate_submissions(db, TaskSubmissionBatchValidate(
+            validator_id=data.validator_id,
+            decisions=[SubmissionDecision(submission_id=submission_id, status=data.status, feedback=data.feedback)],
+        ))
+        return db.query(TaskSubmission).filter(TaskSubmission.id == str(submission_id)).first()
 
-        #se for rejeitada, atualiza deliverable para "IN_DEVELOPMENT"
-        if data.status == "REJECTED":
-            deliverable = db.query(Deliverable).filter(Deliverable.id == submission.task.deliverable_id).first()
-            if deliverable:
-                deliverable.status = "IN_DEVELOPMENT"
-
-        db.commit()
+    @staticmethod
+    def validate_submissions(db: Session, data: TaskSubmissionBatchValidate) -> dict:
+        """
+        Aprova/reprova várias submissões na mesma transação, com o mesmo resultado de
+        validá-las uma a uma na ordem recebida: um UPDATE por grupo (decisão, feedback) nas
+        submissões e um por status final nas tarefas, contadores ajustados por entregável e
+        um EXISTS por entregável afetado para decidir se ele foi concluído.
+        """
+        submission_ids = [str(decision.submission_id) for decision in data.decisions]
+        if len(submission_ids) > VALIDATE_BATCH_MAX_SIZE:
+            raise HTTPException(status_code=400, detail=f"Lote maior que o limite de {VALIDATE_BATCH_MAX_SIZE} submissões.")
+        if len(set(submission_ids)) != len(submission_ids):
+            raise HTTPException(status_code=400, detail="Submissão repetida no lote.")
+
+        if not db.query(Enterprise.id).filter(Enterprise.id == data.validator_id).first():
+            raise HTTPException(status_code=404, detail="Empresa validadora não encontrada")
 
-        #se não há mais pendências, marca o entregável como concluído
-        deliverable_id = submission.task.deliverable_id
-        remaining_tasks = (
-            db.query(TaskSubmission)
-            .join(Task)
-            .filter(
-                Task.deliverable_id == deliverable_id,
-                TaskSubmission.status != "APPROVED"
+        rows = db.execute(
+            select(
+                TaskSubmission.id, TaskSubmission.task_id, Task.status.label("task_status"),
+                Task.deliverable_id, Project.enterprise_id,
+            )
+            .join(Task, Task.id == TaskSubmission.task_id)
+            .outerjoin(Deliverable, Deliverable.id == Task.deliverable_id)
+            .outerjoin(Project, Project.id == Deliverable.project_id)
+            .where(TaskSubmission.id.in_(submission_ids))
+        ).all()
+        found = {row.id: row for row in rows}
+        missing = [submission_id for submission_id in submission_ids if submission_id not in found]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Submissão não encontrada: {', '.join(missing)}")
+
+        # submissões agrupadas por (decisão, feedback); a última decisão sobre uma tarefa define o status dela
+        submission_groups = defaultdict(list)
+        task_status = {}
+        rejected_deliverables = set()
+        for decision, submission_id in zip(data.decisions, submission_ids):
+            row = found[submission_id]
+            submission_groups[(decision.status, decision.feedback)].append(submission_id)
+            task_status[row.task_id] = decision.status
+            if decision.status == "REJECTED":
+                rejected_deliverables.add(row.deliverable_id)
+
+        validated_at = datetime.now(timezone.utc)
+        for (status, feedback), ids in submission_groups.items():
+            db.execute(
+                update(TaskSubmission)
+                .where(TaskSubmission.id.in_(ids))
+                .values(status=status, feedback=feedback, validated_by=str(data.validator_id), validated_at=validated_at)
+                .execution_options(synchronize_session=False)
             )
-            .all()
-        )
-
-        if not remaining_tasks:
-            deliverable = db.query(Deliverable).filter(Deliverable.id == deliverable_id).first()
-            if deliverable:
-                deliverable.status = "COMPLETED"
-                db.commit()
 
-        db.refresh(submission)
-        return submission
+        task_rows = {row.task_id: row for row in rows}
+        task_groups = defaultdict(list)
+        approved_deltas = defaultdict(int)
+        for task_id, status in task_status.items():
+            row = task_rows[task_id]
+            task_groups[status].append(task_id)
+            approved_deltas[row.deliverable_id] += int(status == "APPROVED") - int(row.task_status == "APPROVED")
+        for status, task_ids in task_groups.items():
+            db.execute(
+                update(Task)
+                .where(Task.id.in_(task_ids))
+                .values(status=status)
+                .execution_options(synchronize_session=False)
+            )
+        for deliverable_id, delta in approved_deltas.items():
+            if deliverable_id:
+                adjust_approved_tasks(db, deliverable_id, delta)
+
+        # entregável concluído quando não sobra submissão não aprovada; reprovação volta para desenvolvimento
+        enterprise_of = {row.deliverable_id: row.enterprise_id for row in rows}
+        deliverables = db.query(Deliverable).filter(Deliverable.id.in_([d for d in enterprise_of if d])).all()
+        completed = []
+        for deliverable in deliverables:
+            pending = db.execute(select(case((
+                exists().where(
+                    TaskSubmission.task_id == Task.id,
+                    Task.deliverable_id == deliverable.id,
+                    TaskSubmission.status != "APPROVED",
+                ), 1), else_=0))).scalar()
+            if not pending:
+                if deliverable.status != "COMPLETED":
+                    completed.append(deliverable.id)
+                set_deliverable_status(db, deliverable, "COMPLETED", enterprise_of[deliverable.id])
+            elif deliverable.id in rejected_deliverables:
+                set_deliverable_status(db, deliverable, "IN_DEVELOPMENT", enterprise_of[deliverable.id])
+
+        for enterprise_id in set(enterprise_of.values()):
+            invalidate_enterprise_summary(db, enterprise_id)
+
+        db.flush()
+        approved = sum(len(ids) for (status, _), ids in submission_groups.items() if status == "APPROVED")
+        return {
+            "validated": len(submission_ids),
+            "approved": approved,
+            "rejected": len(submission_ids) - approved,
+            "completed_deliverables": completed,
+        }
 
     @staticmethod
-    def get_student_submissions(db: Session, student_id: str):
-        """Busca todas as submissões de um estudante com informações da task e validator"""
+    def get_student_submissions(db: Session, student_id: str, params: PageParams) -> Page:
+        """Busca uma página das submissões de um estudante com informações da task e validator"""
         try:
             student_uuid = str(UUID(str(student_id)))
         except ValueError:
@@ -146,59 +285,24 @@ class TaskSubmissionRepository:
         if not student_exists:
             raise HTTPException(status_code=404, detail="Estudante não encontrado")
 
-        # Busca todas as submissões do estudante com joins
-        submissions = db.query(TaskSubmission).options(
+        # Busca as submissões do estudante com joins, da mais recente para a mais antiga
+        query = db.query(TaskSubmission).options(
             joinedload(TaskSubmission.task),
             joinedload(TaskSubmission.validator)
-        ).filter(TaskSubmission.student_id == student_uuid).order_by(TaskSubmission.submitted_at.desc()).all()
+        ).filter(TaskSubmission.student_id == student_uuid)
 
-        return submissions
+        return paginate(query, params, TaskSubmission.submitted_at, TaskSubmission.id)
     
     @staticmethod
-    def get_submissions_grouped_by_deliverable(db: Session, enterprise_id: UUID) -> List[SubmissionWithDeliverable]:
-        submissions = (
-            db.query(TaskSubmission)
+    def get_submissions_grouped_by_deliverable(db: Session, enterprise_id: UUID, params: PageParams) -> Page:
+        query = (
+            db.query(TaskSubmission.id, TaskSubmission.submitted_at)
             .join(Task)
             .join(Deliverable)
             .join(Project)
             .filter(Project.enterprise_id == enterprise_id)
-            .order_by(TaskSubmission.submitted_at.desc())
-            .all()
         )
-
-        results = []
-        for submission in submissions:
-            deliverable = submission.task.deliverable
-            project = deliverable.project
-
-            if not deliverable or not project:
-                continue
-
-            deliverable_with_project = DeliverableWithTasks(
-                id=deliverable.id,
-                name=deliverable.name,
-                status=deliverable.status,
-                tasks=[TaskBasicInfo.from_orm(t) for t in deliverable.tasks],
-                project=ProjectResponseSchema.from_orm(deliverable.project)
-            )
-
-            results.append(SubmissionWithDeliverable(
-                id=submission.id,
-                task_id=submission.task.id,
-                status=submission.status,
-                submission_link=submission.submission_link,
-                link_deploy=submission.link_deploy,
-                branch_name=submission.branch_name,
-                evidence_file=submission.evidence_file,
-                feedback=submission.feedback,
-                submitted_at=submission.submitted_at,
-                validated_at=submission.validated_at,
-                validator=submission.validator,
-                student=submission.student,
-                deliverable=deliverable_with_project
-            ))
-
-        return results
+        return load_submission_page(db, query, params)
 
     @staticmethod
     def get_filtered_submissions_to_validate(
@@ -207,78 +311,26 @@ class TaskSubmissionRepository:
         search: Optional[str] = None,
         project_id: Optional[UUID] = None,
         status: Optional[str] = None,
-        limit: int = 50,
-        offset: int = 0
-    ) -> List[SubmissionWithDeliverable]:
+        params: Optional[PageParams] = None
+    ) -> Page:
 
         query = (
-            db.query(TaskSubmission)
-            .options(
-                joinedload(TaskSubmission.task)
-                    .joinedload(Task.deliverable)
-                    .joinedload(Deliverable.project),
-                joinedload(TaskSubmission.task)
-                    .joinedload(Task.deliverable)
-                    .joinedload(Deliverable.tasks),
-                joinedload(TaskSubmission.student),
-                joinedload(TaskSubmission.validator)
-            )
+            db.query(TaskSubmission.id, TaskSubmission.submitted_at)
             .join(Task)
             .join(Deliverable)
             .join(Project)
-            .join(Student)
             .filter(Project.enterprise_id == enterprise_id)
         )
 
         if status:
             query = query.filter(TaskSubmission.status == status)
 
-
         if search:
-            search_like = f"%{search.lower()}%"
-            query = query.filter(
-                or_(
-                    func.lower(Student.name).like(search_like),
-                    func.lower(Deliverable.name).like(search_like),
-                    func.lower(Task.name).like(search_like),
-                )
-            )
+            # busca na tabela de busca mantida (full-text ou LIKE numa tabela estreita), não nos joins
+            query = query.filter(TaskSubmission.id.in_(SubmissionSearchRepository.matching_ids(enterprise_id, search)))
 
         if project_id:
             query = query.filter(Project.id == project_id)
 
-        query = query.order_by(TaskSubmission.submitted_at.desc())
-        submissions = query.limit(limit).offset(offset).all()
-
-        results = []
-        for submission in submissions:
-            deliverable = submission.task.deliverable
-            project = deliverable.project if deliverable else None
-            if not deliverable or not project:
-                continue
-
-            deliverable_with_project = DeliverableWithTasks(
-                id=deliverable.id,
-                name=deliverable.name,
-                status=deliverable.status,
-                project=ProjectResponse.from_orm(project),
-                tasks=[TaskBasicInfo.from_orm(task) for task in deliverable.tasks]
-            )
-
-            results.append(SubmissionWithDeliverable(
-                id=submission.id,
-                task_id=submission.task.id,
-                status=submission.status,
-                submission_link=submission.submission_link,
-                link_deploy=submission.link_deploy,
-                branch_name=submission.branch_name,
-                evidence_file=submission.evidence_file,
-                feedback=submission.feedback,
-                submitted_at=submission.submitted_at,
-                validated_at=submission.validated_at,
-                validator=submission.validator,
-                student=StudentResponse.from_orm(submission.student),
-                deliverable=deliverable_with_project
-            ))
-
-        return results
\ No newline at end of file
+        params = params or PageParams(cursor=None, limit=DEFAULT_PAGE_SIZE)
+        return load_submission_page(db, query, params)
\ No newline at end of file
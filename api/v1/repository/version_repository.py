@@ -0,0 +1,83 @@
+"""
+Tokens de versão para GET condicional: um SELECT de subconsultas escalares (máximos de
+updated_at e contagens) sobre tudo o que a resposta da rota mostra. Contagens cobrem
+exclusões, que não deixam updated_at para trás.
+
+As funções devolvem o statement, para ser executado tanto em Session quanto em AsyncSession.
+"""
+from sqlalchemy import func, select
+
+from db.models.country import Country
+from db.models.delivery_rollup import DeliveryMonthlyRollup
+from db.models.enterprise import Enterprise
+from db.models.project import Project
+from db.models.student import Student
+from db.models.student_project import StudentProject
+from db.models.task import Deliverable, Task
+
+
+def _scalar(*columns, joins=(), where=()):
+    query = select(*columns)
+    for target, onclause in joins:
+        query = query.join(target, onclause)
+    return query.where(*where).scalar_subquery()
+
+
+def enterprise_projects_version(enterprise_id):
+    """Projetos da empresa com entregáveis, tarefas e equipe (GET /projects/enterprises/{id})."""
+    by_enterprise = (Project.enterprise_id == str(enterprise_id),)
+    deliverable_join = (Project, Project.id == Deliverable.project_id)
+    link_join = (Project, Project.id == StudentProject.project_id)
+    return select(
+        _scalar(func.max(Project.updated_at), where=by_enterprise),
+        _scalar(func.count(Project.id), where=by_enterprise),
+        _scalar(func.max(Deliverable.updated_at), joins=[deliverable_join], where=by_enterprise),
+        _scalar(
+            func.max(Task.updated_at),
+            joins=[(Deliverable, Deliverable.id == Task.deliverable_id), deliverable_join],
+            where=by_enterprise,
+        ),
+        _scalar(func.max(StudentProject.updated_at), joins=[link_join], where=by_enterprise),
+        _scalar(func.count(StudentProject.id), joins=[link_join], where=by_enterprise),
+        _scalar(
+            func.max(Student.updated_at),
+            joins=[(StudentProject, StudentProject.student_id == Student.id), link_join],
+            where=by_enterprise,
+        ),
+    )
+
+
+def visible_projects_version():
+    """Projetos visíveis para alunos, com nome da empresa e horas estimadas (GET /students/visible-projects)."""
+    visible = (Project.status != "PENDING",)
+    deliverable_join = (Project, Project.id == Deliverable.project_id)
+    return select(
+        _scalar(func.max(Project.updated_at), where=visible),
+        _scalar(func.count(Project.id), where=visible),
+        _scalar(func.max(Deliverable.updated_at), joins=[deliverable_join], where=visible),
+        _scalar(
+            func.max(Task.updated_at),
+            joins=[(Deliverable, Deliverable.id == Task.deliverable_id), deliverable_join],
+            where=visible,
+        ),
+        _scalar(func.max(Enterprise.updated_at)),
+    )
+
+
+def countries_version():
+    return select(func.max(Country.updated_at), func.count(Country.id))
+
+
+def deliveries_per_project_version(enterprise_id):
+    """
+    Gráfico de entregas: toda mudança de entregável concluído passa pelo agregado mensal;
+    os projetos entram pelo nome (rótulo da série) e pelas exclusões.
+    """
+    by_enterprise = (Project.enterprise_id == str(enterprise_id),)
+    rollup = (DeliveryMonthlyRollup.enterprise_id == str(enterprise_id),)
+    return select(
+        _scalar(func.max(DeliveryMonthlyRollup.updated_at), where=rollup),
+        _scalar(func.count(DeliveryMonthlyRollup.project_id), where=rollup),
+        _scalar(func.max(Project.updated_at), where=by_enterprise),
+        _scalar(func.count(Project.id), where=by_enterprise),
+    )
@@ -0,0 +1,35 @@
+"""
+Resposta JSON rápida para as rotas com payloads grandes (árvores de projetos, fila de revisão).
+
+Usa orjson quando instalado (serialização bem mais rápida que json.dumps, mesma saída
+para os tipos que a API devolve); sem ele, cai no JSONResponse padrão.
+"""
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # dependência opcional
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Serializa conteúdo já convertido para JSON (dicts, listas, tipos simples)."""
+    if orjson is None:
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return dumps(content)
+
+
+def ndjson_line(item: Any) -> bytes:
+    """Uma linha NDJSON: modelos Pydantic, datetimes e UUIDs passam pelo jsonable_encoder."""
+    return dumps(jsonable_encoder(item)) + b"\n"
@@ -1,6 +1,6 @@
 from fastapi import FastAPI, APIRouter
 from fastapi.staticfiles import StaticFiles
-from api.v1.controllers import agent_project_deliver_controller, chat_ws_controller, enterprise_controller, project_controller, student_controller, dashboard_controller, country_controller, auth_controller, student_project_controller, voomp_controller
+from api.v1.controllers import agent_project_deliver_controller, chat_ws_controller, enterprise_controller, project_controller, student_controller, dashboard_controller, country_controller, auth_controller, student_project_controller, voomp_controller, internal_controller
 
 
 
@@ -42,5 +42,8 @@ def setup_routes(app: FastAPI) -> None:
     
     api_router.include_router(chat_ws_controller.router, prefix="/chat", tags=["chat"])
 
+    # Rotas internas (métricas e saúde da aplicação)
+    api_router.include_router(internal_controller.router, prefix="/internal", tags=["internal"])
+
     app.include_router(api_router)
     app.mount("/static", StaticFiles(directory="static"), name="static")
\ No newline at end of file
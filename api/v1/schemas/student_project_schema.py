@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import List
 
 class StudentProjectBase(BaseModel):
     student_id: str
@@ -14,4 +15,14 @@ class StudentProjectRead(StudentProjectBase):
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+class StudentProjectBulkCreate(BaseModel):
+    project_id: str
+    student_ids: List[str] = Field(min_length=1)
+
+class StudentProjectBulkResult(BaseModel):
+    project_id: str
+    created: List[str]
+    skipped: List[str]
+    duplicates: List[str] = []
\ No newline at end of file
@@ -168,4 +168,23 @@ class StudentProjectsResponse(BaseModel):
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+class StudentImportJobResponse(BaseModel):
+    id: str
+    status: str
+    filename: Optional[str]
+    total_rows: int
+    processed_rows: int
+    created: int
+    skipped_existing: int
+    skipped_duplicate: int
+    invalid: int
+    errors: List[str]
+    detail: Optional[str]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    model_config = {
+        "from_attributes": True
+    }
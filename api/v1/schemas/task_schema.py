@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from api.v1.schemas.enterprise_schema import EnterpriseResponse
 from api.v1.schemas.project_schema import ProjectResponse
@@ -21,6 +21,21 @@ class TaskSubmissionValidate(BaseModel):
     status: Literal["APPROVED", "REJECTED"]
     feedback: Optional[str] = None
 
+class SubmissionDecision(BaseModel):
+    submission_id: UUID
+    status: Literal["APPROVED", "REJECTED"]
+    feedback: Optional[str] = None
+
+class TaskSubmissionBatchValidate(BaseModel):
+    validator_id: str
+    decisions: List[SubmissionDecision] = Field(min_length=1)
+
+class TaskSubmissionBatchValidateResponse(BaseModel):
+    validated: int
+    approved: int
+    rejected: int
+    completed_deliverables: List[str]
+
 class TaskSubmissionResponse(BaseModel):
     id: str
     task_id: str
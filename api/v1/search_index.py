@@ -0,0 +1,159 @@
+"""
+Índice de trigramas em memória para a busca de projetos por nome.
+
+Cada nome é normalizado (minúsculas, sem acentos) e quebrado em trigramas, como no
+pg_trgm: "api" vira {"  a", " ap", "api", "pi "}. A busca junta os projetos que
+compartilham trigramas com o termo e ordena por similaridade (trigramas em comum /
+trigramas da união), o que tolera erros de digitação; nomes que contêm o termo
+inteiro vêm primeiro, então todo resultado do antigo ILIKE '%termo%' continua aparecendo.
+
+O índice é por processo: as escritas atualizam o índice do worker que as fez depois
+do commit, e a reconstrução periódica alinha os demais workers.
+"""
+import asyncio
+import logging
+import os
+import re
+import threading
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import select
+
+from db.models.project import Project
+from db.session import SessionLocal
+from db.unit_of_work import on_commit
+
+logger = logging.getLogger(__name__)
+
+PROJECT_SEARCH_MIN_SIMILARITY = float(os.getenv("PROJECT_SEARCH_MIN_SIMILARITY", "0.3"))
+PROJECT_SEARCH_REBUILD_SECONDS = float(os.getenv("PROJECT_SEARCH_REBUILD_SECONDS", "300"))
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+
+def normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def trigrams(normalized: str) -> Set[str]:
+    grams = set()
+    for word in normalized.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class ProjectSearchIndex:
+    def __init__(self, min_similarity: float = PROJECT_SEARCH_MIN_SIMILARITY):
+        self.min_similarity = min_similarity
+        self.ready = False
+        self._names: Dict[str, str] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def rebuild(self, rows: Iterable[Tuple[str, str]]) -> None:
+        """Troca o índice inteiro pelos pares (id, nome) informados."""
+        names, grams, postings = {}, {}, {}
+        for project_id, name in rows:
+            project_id = str(project_id)
+            names[project_id] = normalize(name)
+            grams[project_id] = trigrams(names[project_id])
+            for gram in grams[project_id]:
+                postings.setdefault(gram, set()).add(project_id)
+        with self._lock:
+            self._names, self._grams, self._postings = names, grams, postings
+            self.ready = True
+
+    def upsert(self, project_id: str, name: str) -> None:
+        project_id = str(project_id)
+        with self._lock:
+            self._remove(project_id)
+            self._names[project_id] = normalize(name)
+            self._grams[project_id] = trigrams(self._names[project_id])
+            for gram in self._grams[project_id]:
+                self._postings.setdefault(gram, set()).add(project_id)
+
+    def remove(self, project_id: str) -> None:
+        with self._lock:
+            self._remove(str(project_id))
+
+    def _remove(self, project_id: str) -> None:
+        self._names.pop(project_id, None)
+        for gram in self._grams.pop(project_id, ()):
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(project_id)
+                if not ids:
+                    del self._postings[gram]
+
+    def search(self, query: str, limit: int = 50) -> List[str]:
+        """IDs dos projetos mais parecidos com o termo, do mais relevante para o menos."""
+        term = normalize(query)
+        if not term:
+            return []
+        query_grams = trigrams(term)
+
+        with self._lock:
+            shared = Counter()
+            for gram in query_grams:
+                shared.update(self._postings.get(gram, ()))
+
+            # termos curtos geram poucos trigramas: a busca por substring cobre esses casos
+            substring = {pid for pid, name in self._names.items() if term in name} if len(term) < 3 else set()
+
+            scored = []
+            for project_id in shared.keys() | substring:
+                common = shared.get(project_id, 0)
+                similarity = common / (len(query_grams) + len(self._grams[project_id]) - common)
+                contains = project_id in substring or term in self._names[project_id]
+                if contains or similarity >= self.min_similarity:
+                    scored.append((contains, similarity, self._names[project_id], project_id))
+
+        scored.sort(key=lambda item: (not item[0], -item[1], item[2]))
+        return [project_id for _, _, _, project_id in scored[:limit]]
+
+
+project_search_index = ProjectSearchIndex()
+
+
+def index_project_on_commit(db, project_id: str, name: str) -> None:
+    """Inclui/renomeia o projeto no índice quando a transação confirmar."""
+    on_commit(db, lambda: project_search_index.upsert(project_id, name))
+
+
+def remove_project_on_commit(db, project_id: str) -> None:
+    on_commit(db, lambda: project_search_index.remove(project_id))
+
+
+def rebuild_project_index() -> int:
+    db = SessionLocal(use_replica=True)
+    try:
+        rows = db.execute(select(Project.id, Project.name)).all()
+    finally:
+        db.close()
+    project_search_index.rebuild(rows)
+    logger.info(f"🔎 Índice de busca de projetos reconstruído: {len(rows)} projetos")
+    return len(rows)
+
+
+def ensure_project_index() -> None:
+    if not project_search_index.ready:
+        rebuild_project_index()
+
+
+async def rebuild_project_index_periodically():
+    """Tarefa de fundo do lifespan: reconstrói o índice a cada PROJECT_SEARCH_REBUILD_SECONDS."""
+    while True:
+        try:
+            await asyncio.to_thread(rebuild_project_index)
+        except Exception as e:
+            logger.error(f"❌ Erro ao reconstruir o índice de busca de projetos: {e}")
+        await asyncio.sleep(PROJECT_SEARCH_REBUILD_SECONDS)
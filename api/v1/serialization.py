@@ -0,0 +1,100 @@
+"""
+Serialização em lote das listagens de submissões (fila de revisão e submissões por empresa).
+
+Numa página, várias submissões apontam para o mesmo entregável, projeto, aluno e empresa
+validadora. O SubmissionSerializer monta cada um desses blocos uma vez por requisição e
+reaproveita a mesma instância em todas as submissões; a lista de tarefas do entregável
+é validada de uma vez por um TypeAdapter criado na importação do módulo.
+
+Na saída, a lista já validada vai direto para o dump_json do TypeAdapter, sem o ciclo
+dump → validação → dump que o response_model do FastAPI refaria sobre os mesmos modelos.
+"""
+from typing import Dict, List, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from api.v1.pagination import NEXT_CURSOR_HEADER, Page
+from api.v1.schemas.enterprise_schema import EnterpriseResponse
+from api.v1.schemas.task_schema import DeliverableWithTasks, ProjectResponseSchema, StudentResponse, SubmissionWithDeliverable, TaskBasicInfo
+
+TASK_LIST_ADAPTER = TypeAdapter(List[TaskBasicInfo])
+SUBMISSION_LIST_ADAPTER = TypeAdapter(List[SubmissionWithDeliverable])
+
+
+class SubmissionSerializer:
+    """Uma instância por requisição: os blocos ficam em cache pelo id da entidade."""
+
+    def __init__(self):
+        self._deliverables: Dict[str, DeliverableWithTasks] = {}
+        self._projects: Dict[str, ProjectResponseSchema] = {}
+        self._students: Dict[str, StudentResponse] = {}
+        self._validators: Dict[str, EnterpriseResponse] = {}
+
+    def project(self, project) -> ProjectResponseSchema:
+        key = str(project.id)
+        block = self._projects.get(key)
+        if block is None:
+            block = self._projects[key] = ProjectResponseSchema.model_validate(project)
+        return block
+
+    def deliverable(self, deliverable) -> DeliverableWithTasks:
+        key = str(deliverable.id)
+        block = self._deliverables.get(key)
+        if block is None:
+            block = self._deliverables[key] = DeliverableWithTasks(
+                id=deliverable.id,
+                name=deliverable.name,
+                status=deliverable.status,
+                tasks=TASK_LIST_ADAPTER.validate_python(deliverable.tasks, from_attributes=True),
+                project=self.project(deliverable.project),
+            )
+        return block
+
+    def student(self, student) -> StudentResponse:
+        key = str(student.id)
+        block = self._students.get(key)
+        if block is None:
+            block = self._students[key] = StudentResponse.model_validate(student)
+        return block
+
+    def validator(self, validator) -> Optional[EnterpriseResponse]:
+        if validator is None:
+            return None
+        key = str(validator.id)
+        block = self._validators.get(key)
+        if block is None:
+            block = self._validators[key] = EnterpriseResponse.model_validate(validator)
+        return block
+
+    def submission(self, submission) -> Optional[SubmissionWithDeliverable]:
+        """None quando a submissão perdeu o entregável ou o projeto (fica fora da listagem)."""
+        deliverable = submission.task.deliverable
+        if not deliverable or not deliverable.project:
+            return None
+
+        return SubmissionWithDeliverable(
+            id=submission.id,
+            task_id=submission.task_id,
+            status=submission.status,
+            submission_link=submission.submission_link,
+            link_deploy=submission.link_deploy,
+            branch_name=submission.branch_name,
+            evidence_file=submission.evidence_file,
+            feedback=submission.feedback,
+            submitted_at=submission.submitted_at,
+            validated_at=submission.validated_at,
+            validator=self.validator(submission.validator),
+            student=self.student(submission.student),
+            deliverable=self.deliverable(deliverable),
+        )
+
+    def serialize(self, submissions) -> List[SubmissionWithDeliverable]:
+        results = (self.submission(submission) for submission in submissions)
+        return [result for result in results if result is not None]
+
+
+def submissions_response(page: Page) -> Response:
+    """Resposta JSON de uma página de SubmissionWithDeliverable, com o cursor no header."""
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+    return Response(SUBMISSION_LIST_ADAPTER.dump_json(page.items), media_type="application/json", headers=headers)
@@ -0,0 +1,113 @@
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from api.v1.repository.analytics_repository import GRANULARITIES, AnalyticsRepository
+from api.v1.repository.delivery_rollup_repository import DeliveryRollupRepository
+
+# Limite de pontos por série (ex.: ~3 anos em granularidade diária)
+MAX_BUCKETS = 1100
+
+
+def _bucket_start(day: date, granularity: str) -> date:
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _next_bucket(day: date, granularity: str) -> date:
+    if granularity == "day":
+        return day + timedelta(days=1)
+    if granularity == "week":
+        return day + timedelta(weeks=1)
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def build_buckets(start: date, end: date, granularity: str) -> List[date]:
+    """Todos os períodos que tocam [start, end), para as séries terem zeros nos períodos vazios."""
+    buckets = []
+    current = _bucket_start(start, granularity)
+    while current < end:
+        buckets.append(current)
+        if len(buckets) > MAX_BUCKETS:
+            raise HTTPException(status_code=400, detail="Intervalo grande demais para a granularidade escolhida")
+        current = _next_bucket(current, granularity)
+    return buckets
+
+
+def bucket_label(bucket: date, granularity: str, single_year: bool) -> str:
+    if granularity == "month":
+        return bucket.strftime("%b") if single_year else bucket.strftime("%b %Y")
+    return bucket.isoformat()
+
+
+def resolve_date_range(start_date: Optional[date], end_date: Optional[date]) -> Tuple[date, date]:
+    """Datas omitidas viram 1º de janeiro e 31 de dezembro do ano corrente."""
+    current_year = datetime.now().year
+    return start_date or date(current_year, 1, 1), end_date or date(current_year, 12, 31)
+
+
+def get_deliveries_per_project(
+    db: Session,
+    enterprise_id: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    granularity: str = "month",
+    project_ids: Optional[List[str]] = None,
+):
+    """
+    Série de entregáveis concluídos por projeto (formato ApexCharts) entre start_date e
+    end_date, ambos inclusivos. Sem datas, usa o ano corrente agrupado por mês.
+    """
+    if granularity not in GRANULARITIES:
+        raise HTTPException(status_code=400, detail=f"Granularidade inválida. Use {', '.join(GRANULARITIES)}.")
+
+    start_date, end_date = resolve_date_range(start_date, end_date)
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date deve ser maior ou igual a start_date")
+
+    # Intervalo semiaberto [start, end + 1 dia): o filtro vira um range na coluna e pode usar índice
+    end_exclusive = end_date + timedelta(days=1)
+    buckets = build_buckets(start_date, end_exclusive, granularity)
+
+    if granularity == "month" and start_date.day == 1 and end_exclusive.day == 1:
+        # meses inteiros: lê as poucas linhas do agregado mensal em vez de varrer deliverables
+        rows = DeliveryRollupRepository.monthly_completed_deliverables(
+            db, enterprise_id, start_date, end_exclusive, project_ids
+        )
+    else:
+        rows = AnalyticsRepository.count_completed_deliverables(
+            db,
+            enterprise_id,
+            datetime.combine(start_date, datetime.min.time()),
+            datetime.combine(end_exclusive, datetime.min.time()),
+            granularity,
+            project_ids,
+        )
+
+    # agrupa dados no formato ApexCharts
+    index = {bucket: i for i, bucket in enumerate(buckets)}
+    project_data = {}
+    for row in rows:
+        bucket = row.bucket.date() if isinstance(row.bucket, datetime) else row.bucket
+        if row.project_name not in project_data:
+            project_data[row.project_name] = [0] * len(buckets)
+        if bucket in index:
+            project_data[row.project_name][index[bucket]] += row.count
+
+    single_year = start_date.year == end_date.year
+    labels = [bucket_label(bucket, granularity, single_year) for bucket in buckets]
+    series = [
+        {
+            "name": project_name,
+            "type": "line",
+            "data": [{"x": labels[i], "y": counts[i]} for i in range(len(buckets))]
+        }
+        for project_name, counts in project_data.items()
+    ]
+
+    return {"series": series}
@@ -1,15 +1,20 @@
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from api.v1.repository.dashboard_repository import DashboardRepository
+from api.v1.repository.dashboard_repository import DashboardRepository, summary_cache
 
 
 class DashboardService:
     @staticmethod
     def get_summary(db: Session, enterprise_id: UUID):
-        pending_tasks = DashboardRepository.count_pending_tasks(db, enterprise_id)
-        active_projects = DashboardRepository.count_active_projects(db, enterprise_id)
-        students_in_projects = DashboardRepository.count_students_in_projects(db, enterprise_id)
+        cached = summary_cache.get(str(enterprise_id))
+        if cached is not None:
+            return cached
+
+        counts = DashboardRepository.get_summary_counts(db, enterprise_id)
+        pending_tasks = counts["pending_tasks"]
+        active_projects = counts["active_projects"]
+        students_in_projects = counts["students_in_projects"]
 
         # Total geral
         total = pending_tasks + active_projects + students_in_projects or 1
@@ -47,4 +52,5 @@ class DashboardService:
             },
         ]
 
+        summary_cache.set(str(enterprise_id), summary_cards)
         return summary_cards
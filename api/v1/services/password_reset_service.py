@@ -63,8 +63,7 @@ class PasswordResetService:
         )
         
         db.add(reset_token)
-        db.commit()
-        db.refresh(reset_token)
+        db.flush()
         
         # Enviar email
         try:
@@ -76,9 +75,7 @@ class PasswordResetService:
                 user_type=user_type
             )
         except Exception as e:
-            # Se falhar ao enviar email, remover token
-            db.delete(reset_token)
-            db.commit()
+            # A exceção desfaz a transação da requisição: o token novo some e os anteriores continuam válidos
             raise HTTPException(status_code=500, detail="Erro ao enviar email de recuperação")
         
         return {
@@ -124,7 +121,7 @@ class PasswordResetService:
         # Marcar token como usado
         reset_token.is_used = "true"
         
-        db.commit()
+        db.flush()
         
         return {"message": "Senha alterada com sucesso"}
     
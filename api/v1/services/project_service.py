@@ -2,22 +2,25 @@ from calendar import month_abbr
 import os
 import json
 import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from azure.core.exceptions import ResourceExistsError
 from azure.storage.blob.aio import BlobServiceClient
 from api.v1.repository.project_repository import (
-    filter_projects_by_name,
-    get_projects_by_enterprise,
+    get_projects_by_ids,
+    get_projects_by_enterprise_async,
     get_visible_projects_for_students,
-    list_projects_by_enterprise,
+    list_projects_by_enterprise_async,
     save_project_to_sql,
     get_all_projects,
     get_project_by_id,
     update_project,
     delete_project,
-    update_project_status
+    update_project_status_async
 )
+from api.v1.pagination import Page, PageParams
 from api.v1.schemas.project_schema import ProjectResponse
+from api.v1.search_index import ensure_project_index, project_search_index
 
 
 
@@ -87,27 +90,27 @@ async def publish_project_service(db: Session, data):
 
     return path_prefix
 
-# Retorna todos os projetos
-async def list_projects_service(db: Session):
-    return await get_all_projects(db)
+# Retorna uma página de projetos
+async def list_projects_service(db: AsyncSession, params: PageParams) -> Page:
+    return await get_all_projects(db, params)
 
 # Retorna um projeto por ID
-async def get_project_service(db: Session, project_id: int):
+async def get_project_service(db: AsyncSession, project_id: int):
     return await get_project_by_id(db, project_id)
 
 # Atualiza um projeto
-async def update_project_service(db: Session, project_id: int, update_data: dict):
+async def update_project_service(db: AsyncSession, project_id: int, update_data: dict):
     return await update_project(db, project_id, update_data)
 
 # Deleta um projeto
-async def delete_project_service(db: Session, project_id: int):
+async def delete_project_service(db: AsyncSession, project_id: int):
     return await delete_project(db, project_id)
 
-async def list_enterprise_projects(db: Session, enterprise_id: str) -> list[ProjectResponse]:
-    projects = get_projects_by_enterprise(db, enterprise_id)
+async def list_enterprise_projects(db: AsyncSession, enterprise_id: str, params: PageParams) -> Page:
+    page = await get_projects_by_enterprise_async(db, enterprise_id, params)
     responses = []
     
-    for project in projects:
+    for project in page.items:
         requirements = await load_requirements_from_blob(project.blob_path) if project.blob_path else {}
 
         responses.append(ProjectResponse(
@@ -128,16 +131,20 @@ async def list_enterprise_projects(db: Session, enterprise_id: str) -> list[Proj
             requirements=requirements
         ))
 
-    return responses
+    return Page(items=responses, next_cursor=page.next_cursor)
 
-def get_filtered_projects(db: Session, name: str):
-    return filter_projects_by_name(db, name)
+def get_filtered_projects(db: Session, name: str, limit: int):
+    # o índice devolve os IDs já ordenados por relevância; a hidratação é uma consulta por relação
+    ensure_project_index()
+    project_ids = project_search_index.search(name, limit)
+    projects = {project.id: project for project in get_projects_by_ids(db, project_ids)}
+    return [projects[project_id] for project_id in project_ids if project_id in projects]
 
-async def update_project_status_service(db: Session, project_id: str, new_status: str):
-    return update_project_status(db, project_id, new_status)
+async def update_project_status_service(db: AsyncSession, project_id: str, new_status: str):
+    return await update_project_status_async(db, project_id, new_status)
 
-def list_visible_projects(db: Session):
-    projects = get_visible_projects_for_students(db)
+def list_visible_projects(db: Session, params: PageParams) -> Page:
+    page = get_visible_projects_for_students(db, params)
 
     def serialize(project):
         estimated_hours = sum(
@@ -163,7 +170,7 @@ def list_visible_projects(db: Session):
             "estimated_hours": estimated_hours,
         }
 
-    return [serialize(p) for p in projects]
+    return Page(items=[serialize(p) for p in page.items], next_cursor=page.next_cursor)
 
-async def list_projects_by_enterprise_service(db: Session, enterprise_id: str):
-    return list_projects_by_enterprise(db, enterprise_id)
\ No newline at end of file
+async def list_projects_by_enterprise_service(db: AsyncSession, enterprise_id: str):
+    return await list_projects_by_enterprise_async(db, enterprise_id)
\ No newline at end of file
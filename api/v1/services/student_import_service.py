@@ -0,0 +1,294 @@
+"""
+Importação em lote de alunos a partir de CSV (export da Voomp ou planilha no mesmo formato).
+
+O upload é copiado em blocos para um arquivo temporário e processado em segundo plano,
+em lotes de BULK_IMPORT_CHUNK_SIZE linhas: deduplicação contra Student.email com uma
+consulta por lote, hash bcrypt das senhas num pool de BULK_IMPORT_HASH_WORKERS processos
+e INSERT em lote, com commit por lote (o que já foi importado fica, mesmo se o job falhar).
+
+Linhas sem senha recebem uma senha temporária aleatória, como no webhook da Voomp; o aluno
+define a sua pelo fluxo de "esqueci minha senha".
+
+O progresso fica em memória no processo que recebeu o upload: com vários workers, o
+GET /students/import/{job_id} só encontra o job no mesmo worker.
+"""
+import csv
+import logging
+import multiprocessing
+import os
+import secrets
+import string
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import bcrypt
+from fastapi import BackgroundTasks, HTTPException, UploadFile
+from sqlalchemy.exc import IntegrityError
+
+from api.v1.cache import TTLCache
+from api.v1.repository.student_repository import existing_student_emails, insert_students
+from db.models.student import Student
+from db.session import SessionLocal
+from db.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+BULK_IMPORT_HASH_WORKERS = int(os.getenv("BULK_IMPORT_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+BULK_IMPORT_CHUNK_SIZE = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", "500"))
+BULK_IMPORT_JOB_TTL_SECONDS = int(os.getenv("BULK_IMPORT_JOB_TTL_SECONDS", "86400"))
+
+COPY_BUFFER_SIZE = 1024 * 1024
+MAX_REPORTED_ERRORS = 100
+DEFAULT_ROLE = "introduction"  # mesmo papel dos alunos criados pelo webhook da Voomp
+
+# coluna de Student -> cabeçalhos aceitos no CSV (comparados em minúsculas)
+CSV_COLUMNS = {
+    "name": ("name", "nome", "client_name"),
+    "email": ("email", "e-mail", "client_email"),
+    "password": ("password", "senha"),
+    "phone": ("phone", "telefone", "celular", "cellphone"),
+    "role": ("role",),
+    "location": ("location", "cidade"),
+}
+REQUIRED_COLUMNS = ("name", "email")
+MAX_LENGTHS = {
+    column: Student.__table__.c[column].type.length
+    for column in CSV_COLUMNS
+    if column != "password"
+}
+
+import_jobs = TTLCache(BULK_IMPORT_JOB_TTL_SECONDS, maxsize=1000)
+
+
+@dataclass
+class ImportJob:
+    id: str
+    filename: Optional[str]
+    total_rows: int
+    status: str = "queued"
+    processed_rows: int = 0
+    created: int = 0
+    skipped_existing: int = 0
+    skipped_duplicate: int = 0
+    invalid: int = 0
+    errors: List[str] = field(default_factory=list)
+    detail: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    def report(self, message: str):
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+
+_hash_pool = None
+_hash_pool_lock = threading.Lock()
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            # spawn: o processo da API tem threads (pool de conexões, threadpool) e fork com threads pode travar
+            _hash_pool = ProcessPoolExecutor(
+                max_workers=BULK_IMPORT_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _hash_pool
+
+
+def shutdown_hash_pool():
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown(cancel_futures=True)
+            _hash_pool = None
+
+
+def hash_passwords(passwords: List[str]) -> List[str]:
+    """
+    bcrypt no pool de processos. O salt é gerado aqui (custo padrão 12, o mesmo do passlib)
+    e os processos filhos só executam bcrypt.hashpw, sem importar a aplicação.
+    """
+    secrets_ = [password.encode("utf-8")[:72] for password in passwords]
+    salts = [bcrypt.gensalt() for _ in passwords]
+    chunksize = max(1, len(passwords) // (BULK_IMPORT_HASH_WORKERS * 4))
+    try:
+        return [hashed.decode() for hashed in _get_hash_pool().map(bcrypt.hashpw, secrets_, salts, chunksize=chunksize)]
+    except BrokenProcessPool:
+        # um processo filho morreu: descarta o pool para a próxima importação criar outro
+        shutdown_hash_pool()
+        raise
+
+
+def _temporary_password() -> str:
+    return "".join(secrets.choice(string.ascii_letters + string.digits) for _ in range(12))
+
+
+def _save_upload(upload: UploadFile) -> tuple:
+    """Copia o upload em blocos para um arquivo temporário; devolve o caminho e o número estimado de linhas de dados."""
+    newlines = 0
+    last_byte = b"\n"
+    with tempfile.NamedTemporaryFile("wb", suffix=".csv", delete=False) as tmp:
+        while True:
+            block = upload.file.read(COPY_BUFFER_SIZE)
+            if not block:
+                break
+            newlines += block.count(b"\n")
+            last_byte = block[-1:]
+            tmp.write(block)
+    lines = newlines + (last_byte != b"\n")
+    # estimativa: campos entre aspas com quebra de linha contam mais de uma vez
+    return tmp.name, max(lines - 1, 0)
+
+
+def _read_header(path: str) -> tuple:
+    """Delimitador (vírgula ou ponto e vírgula, comum em exports do Excel) e coluna -> cabeçalho do arquivo."""
+    try:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            first_line = f.readline()
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="O CSV precisa estar em UTF-8.")
+
+    delimiter = ";" if first_line.count(";") > first_line.count(",") else ","
+    header = next(csv.reader([first_line], delimiter=delimiter), [])
+    by_name = {name.strip().lower(): name for name in header}
+
+    columns = {}
+    for column, aliases in CSV_COLUMNS.items():
+        match = next((by_name[alias] for alias in aliases if alias in by_name), None)
+        if match is not None:
+            columns[column] = match
+
+    missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"CSV sem as colunas obrigatórias: {', '.join(missing)}")
+    return delimiter, columns
+
+
+def _validate(values: Dict[str, str]) -> Optional[str]:
+    if not values.get("name"):
+        return "nome vazio"
+    email = values.get("email", "")
+    if "@" not in email or " " in email:
+        return "e-mail inválido"
+    for column, length in MAX_LENGTHS.items():
+        if length and len(values.get(column) or "") > length:
+            return f"{column} com mais de {length} caracteres"
+    return None
+
+
+def _insert_new_students(job: ImportJob, candidates: List[Dict[str, str]]):
+    """Deduplica o lote contra o banco, gera os hashes fora da transação e insere os novos."""
+    with UnitOfWork(SessionLocal) as db:
+        existing = existing_student_emails(db, [values["email"] for values in candidates])
+    new = [values for values in candidates if values["email"] not in existing]
+    job.skipped_existing += len(candidates) - len(new)
+    if not new:
+        return
+
+    hashes = hash_passwords([values.get("password") or _temporary_password() for values in new])
+    rows = [
+        {
+            "name": values["name"],
+            "email": values["email"],
+            "password": hashed,
+            "phone": values.get("phone") or None,
+            "role": values.get("role") or DEFAULT_ROLE,
+            "location": values.get("location") or None,
+        }
+        for values, hashed in zip(new, hashes)
+    ]
+
+    try:
+        with UnitOfWork(SessionLocal) as db:
+            insert_students(db, rows)
+    except IntegrityError:
+        # outro cadastro criou algum desses e-mails entre a consulta e o INSERT: refaz sem eles
+        with UnitOfWork(SessionLocal) as db:
+            existing = existing_student_emails(db, [row["email"] for row in rows])
+            remaining = [row for row in rows if row["email"] not in existing]
+            if remaining:
+                insert_students(db, remaining)
+        job.skipped_existing += len(rows) - len(remaining)
+        rows = remaining
+
+    job.created += len(rows)
+
+
+def _import_chunk(job: ImportJob, chunk: List[tuple], columns: Dict[str, str], seen_emails: set):
+    candidates = []
+    for line_number, row in chunk:
+        values = {column: (row.get(header) or "").strip() for column, header in columns.items()}
+        values["email"] = values["email"].lower()
+
+        error = _validate(values)
+        if error:
+            job.invalid += 1
+            job.report(f"linha {line_number}: {error}")
+            continue
+        if values["email"] in seen_emails:
+            job.skipped_duplicate += 1
+            continue
+        seen_emails.add(values["email"])
+        candidates.append(values)
+
+    if candidates:
+        _insert_new_students(job, candidates)
+    job.processed_rows += len(chunk)
+
+
+def run_student_import(job: ImportJob, path: str, delimiter: str, columns: Dict[str, str]):
+    job.status = "running"
+    job.started_at = datetime.now(timezone.utc)
+    try:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f, delimiter=delimiter)
+            seen_emails = set()
+            chunk = []
+            for row in reader:
+                chunk.append((reader.line_num, row))
+                if len(chunk) >= BULK_IMPORT_CHUNK_SIZE:
+                    _import_chunk(job, chunk, columns, seen_emails)
+                    chunk = []
+            if chunk:
+                _import_chunk(job, chunk, columns, seen_emails)
+        job.status = "completed"
+        logger.info(
+            f"✅ Importação de alunos {job.id}: {job.created} criados, {job.skipped_existing} já existentes, "
+            f"{job.skipped_duplicate} repetidos no arquivo, {job.invalid} inválidos"
+        )
+    except Exception as e:
+        job.status = "failed"
+        job.detail = str(e)
+        logger.error(f"❌ Erro na importação de alunos {job.id} (linhas processadas: {job.processed_rows}): {e}")
+    finally:
+        job.finished_at = datetime.now(timezone.utc)
+        os.remove(path)
+
+
+def start_student_import(upload: UploadFile, background_tasks: BackgroundTasks) -> ImportJob:
+    path, total_rows = _save_upload(upload)
+    try:
+        delimiter, columns = _read_header(path)
+    except HTTPException:
+        os.remove(path)
+        raise
+
+    job = ImportJob(id=str(uuid.uuid4()), filename=upload.filename, total_rows=total_rows)
+    import_jobs.set(job.id, job)
+    background_tasks.add_task(run_student_import, job, path, delimiter, columns)
+    return job
+
+
+def get_import_job(job_id: str) -> ImportJob:
+    job = import_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Importação não encontrada")
+    return job
@@ -1,6 +1,8 @@
 from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
+from api.v1.pagination import Page, PageParams
 from api.v1.repository import student_repository
+from api.v1.repository.submission_search_repository import rename_student_in_search
 from api.v1.repository.student_repository import (
     get_student_by_id,
     get_all_students,
@@ -64,8 +66,8 @@ def create_student_service(data: StudentCreateForm, db: Session):
     return repo_create_student(db, db_student)
 
 
-def list_students(db: Session, enterprise_id: str):
-    return get_all_students(db, enterprise_id)
+def list_students(db: Session, enterprise_id: str, params: PageParams) -> Page:
+    return get_all_students(db, enterprise_id, params)
 
 def get_student_by_id_service(db: Session, student_id: str):
     student = get_student_by_id(db, student_id)
@@ -79,6 +81,8 @@ def update_student_service(student_id: UUID, data: StudentUpdateForm, db: Sessio
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
 
+    if student.name != data.name:
+        rename_student_in_search(db, student.id, data.name)
     student.name = data.name
     student.email = data.email
     student.phone = data.phone
@@ -101,8 +105,7 @@ def update_student_service(student_id: UUID, data: StudentUpdateForm, db: Sessio
         student.photo = handle_image_upload(data.profile_image)
 
 
-    db.commit()
-    db.refresh(student)
+    db.flush()
     return student
 
 def delete_student_service(db: Session, student_id: str):
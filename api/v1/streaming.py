@@ -0,0 +1,75 @@
+"""
+Modo de exportação em streaming (?format=ndjson) para as listagens grandes.
+
+Percorre a listagem página a página pelo mesmo cursor keyset das respostas paginadas,
+cada página em uma sessão própria (de leitura), e envia uma linha JSON por item.
+A memória fica limitada a uma página, qualquer que seja o tamanho do resultado, e
+nenhuma conexão fica presa ao ritmo de leitura do cliente.
+"""
+import logging
+import os
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Literal, Optional
+
+from fastapi.responses import StreamingResponse
+
+from api.v1.pagination import Page, PageParams
+from api.v1.responses import ndjson_line
+from db.session import AsyncSessionLocal, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+EXPORT_PAGE_SIZE = int(os.getenv("EXPORT_PAGE_SIZE", "500"))
+
+# valor do parâmetro ?format= das rotas com exportação
+ExportFormat = Literal["json", "ndjson"]
+
+
+def iter_ndjson(
+    fetch_page: Callable[..., Page],
+    cursor: Optional[str] = None,
+    serialize: Callable = lambda item: item,
+) -> Iterator[bytes]:
+    """fetch_page(db, params) -> Page; um chunk por página, serializado antes de fechar a sessão."""
+    while True:
+        db = SessionLocal(use_replica=True)
+        try:
+            page = fetch_page(db, PageParams(cursor=cursor, limit=EXPORT_PAGE_SIZE))
+            chunk = b"".join(ndjson_line(serialize(item)) for item in page.items)
+        except Exception as e:
+            logger.error(f"❌ Erro na exportação NDJSON: {e}")
+            raise
+        finally:
+            db.close()
+
+        if chunk:
+            yield chunk
+        if not page.next_cursor:
+            return
+        cursor = page.next_cursor
+
+
+async def aiter_ndjson(
+    fetch_page: Callable[..., Awaitable[Page]],
+    cursor: Optional[str] = None,
+    serialize: Callable = lambda item: item,
+) -> AsyncIterator[bytes]:
+    """Versão para repositórios assíncronos: fetch_page(db, params) é awaitable."""
+    while True:
+        async with AsyncSessionLocal() as db:
+            try:
+                page = await fetch_page(db, PageParams(cursor=cursor, limit=EXPORT_PAGE_SIZE))
+                chunk = b"".join(ndjson_line(serialize(item)) for item in page.items)
+            except Exception as e:
+                logger.error(f"❌ Erro na exportação NDJSON: {e}")
+                raise
+
+        if chunk:
+            yield chunk
+        if not page.next_cursor:
+            return
+        cursor = page.next_cursor
+
+
+def ndjson_response(chunks) -> StreamingResponse:
+    return StreamingResponse(chunks, media_type=NDJSON_MEDIA_TYPE)
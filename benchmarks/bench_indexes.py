@@ -0,0 +1,203 @@
+"""
+Benchmark dos índices da migração 0001_hot_path_indexes.
+
+Popula um banco SQL Server descartável, mede as consultas quentes dos repositórios
+sem os índices, aplica a migração e mede de novo.
+
+Uso:
+    BENCH_DATABASE_URL="mssql+pyodbc://..." python -m benchmarks.bench_indexes [--scale 1]
+
+Nunca aponte BENCH_DATABASE_URL para o banco de produção: as tabelas do schema tkse
+são criadas e populadas nele.
+"""
+import argparse
+import importlib
+import os
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func, or_, select, text
+
+from db.base import Base
+from db.models import *
+from db.models.task import TaskSubmission
+
+migration = importlib.import_module("db.migrations.0001_hot_path_indexes")
+
+REPEAT = 20
+
+
+def _ids(n):
+    return [str(uuid.uuid4()) for _ in range(n)]
+
+
+def seed(conn, scale: int):
+    now = datetime.now(timezone.utc)
+    enterprises = _ids(20 * scale)
+    students = _ids(2000 * scale)
+
+    conn.execute(Enterprise.__table__.insert(), [
+        {"id": e, "name": f"Empresa {i}", "email": f"empresa{i}@bench.local", "hashed_password": "x",
+         "is_active": True, "created_at": now, "updated_at": now}
+        for i, e in enumerate(enterprises)
+    ])
+    conn.execute(Student.__table__.insert(), [
+        {"id": s, "name": f"Aluno {i}", "email": f"aluno{i}@bench.local", "password": "x",
+         "welcome": True, "is_active": True, "created_at": now, "updated_at": now}
+        for i, s in enumerate(students)
+    ])
+
+    projects, deliverables, tasks, links, submissions = [], [], [], [], []
+    for e_index, enterprise_id in enumerate(enterprises):
+        for p in range(25):
+            project_id = str(uuid.uuid4())
+            projects.append({
+                "id": project_id, "name": f"Projeto {e_index}-{p}", "enterprise_id": enterprise_id,
+                "blob_path": "", "description": "", "technologies": [], "complexity": "", "category": "",
+                "score": "", "country": "BR", "status": "IN_PROGRESS" if p % 3 else "COMPLETED",
+                "created_at": now, "updated_at": now,
+            })
+            members = students[(e_index * 25 + p) % len(students):][:8]
+            links += [{"id": str(uuid.uuid4()), "student_id": s, "project_id": project_id,
+                       "created_at": now, "updated_at": now} for s in members]
+            for d in range(6):
+                deliverable_id = str(uuid.uuid4())
+                deliverables.append({"id": deliverable_id, "name": f"Entrega {d}", "status": "IN_DEVELOPMENT",
+                                     "project_id": project_id, "created_at": now, "updated_at": now})
+                for t in range(8):
+                    task_id = str(uuid.uuid4())
+                    tasks.append({"id": task_id, "name": f"Tarefa {t}", "description": "", "status": "PENDING",
+                                  "deliverable_id": deliverable_id, "created_at": now, "updated_at": now})
+                    for member in members[:2]:
+                        submissions.append({"id": str(uuid.uuid4()), "task_id": task_id, "student_id": member,
+                                            "status": "PENDING", "submitted_at": now - timedelta(minutes=len(submissions))})
+
+    conn.execute(Project.__table__.insert(), projects)
+    conn.execute(StudentProject.__table__.insert(), links)
+    conn.execute(Deliverable.__table__.insert(), deliverables)
+    conn.execute(Task.__table__.insert(), tasks)
+    conn.execute(TaskSubmission.__table__.insert(), submissions)
+
+    conn.execute(ChatMessage.__table__.insert(), [
+        {"id": uuid.uuid4(), "from_id": students[i % 50], "to_id": students[(i + 1) % 50],
+         "content": "oi", "created_at": now - timedelta(seconds=i)}
+        for i in range(20000 * scale)
+    ])
+    conn.execute(PasswordResetToken.__table__.insert(), [
+        {"id": str(uuid.uuid4()), "token": uuid.uuid4().hex, "email": f"aluno{i % 2000}@bench.local",
+         "user_type": UserType.STUDENT, "user_id": students[i % len(students)], "is_used": "true",
+         "created_at": now, "expires_at": now}
+        for i in range(20000 * scale)
+    ])
+
+    return {
+        "enterprise_id": enterprises[0],
+        "project_id": projects[0]["id"],
+        "deliverable_id": deliverables[0]["id"],
+        "task_id": tasks[0]["id"],
+        "student_id": links[0]["student_id"],
+        "chat_pair": (students[0], students[1]),
+        "email": "aluno1@bench.local",
+    }
+
+
+def hot_queries(keys):
+    user1, user2 = keys["chat_pair"]
+    return {
+        "submissions by enterprise": (
+            select(func.count(TaskSubmission.id))
+            .join(Task).join(Deliverable).join(Project)
+            .where(Project.enterprise_id == keys["enterprise_id"])
+        ),
+        "last submission of task/student": (
+            select(TaskSubmission.id)
+            .where(TaskSubmission.task_id == keys["task_id"], TaskSubmission.student_id == keys["student_id"])
+            .order_by(TaskSubmission.submitted_at.desc()).limit(1)
+        ),
+        "tasks of deliverable": select(Task.id).where(Task.deliverable_id == keys["deliverable_id"]),
+        "deliverables of project": select(Deliverable.id).where(Deliverable.project_id == keys["project_id"]),
+        "active projects of enterprise": (
+            select(func.count(Project.id))
+            .where(Project.enterprise_id == keys["enterprise_id"], Project.status == "IN_PROGRESS")
+        ),
+        "projects of student": select(StudentProject.project_id).where(StudentProject.student_id == keys["student_id"]),
+        "chat history": (
+            select(ChatMessage.id)
+            .where(or_(
+                (ChatMessage.from_id == user1) & (ChatMessage.to_id == user2),
+                (ChatMessage.from_id == user2) & (ChatMessage.to_id == user1),
+            ))
+            .order_by(ChatMessage.created_at)
+        ),
+        "open reset tokens": (
+            select(PasswordResetToken.id)
+            .where(PasswordResetToken.email == keys["email"],
+                   PasswordResetToken.user_type == UserType.STUDENT,
+                   PasswordResetToken.is_used == "false")
+        ),
+    }
+
+
+def measure(conn, queries):
+    results = {}
+    for name, query in queries.items():
+        conn.execute(query).fetchall()  # aquece cache e plano
+        timings = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            conn.execute(query).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = statistics.median(timings)
+    return results
+
+
+def drop_hot_indexes(conn):
+    # create_all já cria os índices declarados nos models, inclusive os de migrações posteriores
+    later = [("deliverables", "ix_deliverables_project_status_created", None)]
+    for table, name, _ in migration.INDEXES + later:
+        conn.execute(text(
+            f"IF EXISTS (SELECT 1 FROM sys.indexes WHERE name = '{name}' AND object_id = OBJECT_ID('tkse.{table}')) "
+            f"DROP INDEX [{name}] ON tkse.[{table}]"
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=1)
+    args = parser.parse_args()
+
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        raise SystemExit("Defina BENCH_DATABASE_URL com um banco descartável.")
+    if url == os.getenv("AZURE_SQL_CONNECTION_STRING"):
+        raise SystemExit("BENCH_DATABASE_URL não pode ser o banco da aplicação.")
+
+    engine = create_engine(url, fast_executemany=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        keys = seed(conn, args.scale)
+        drop_hot_indexes(conn)
+
+    queries = hot_queries(keys)
+    with engine.connect() as conn:
+        before = measure(conn, queries)
+
+    with engine.begin() as conn:
+        migration.upgrade(conn)
+        conn.execute(text("EXEC sp_updatestats"))
+
+    with engine.connect() as conn:
+        after = measure(conn, queries)
+
+    print(f"{'query':<35}{'sem índice (ms)':>18}{'com índice (ms)':>18}{'ganho':>10}")
+    for name in queries:
+        gain = before[name] / after[name] if after[name] else float("inf")
+        print(f"{name:<35}{before[name]:>18.2f}{after[name]:>18.2f}{gain:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark de regressão da fila de revisão (get_filtered_submissions_to_validate).
+
+Para entregáveis de tamanhos diferentes (--task-counts, o padrão vai até 200 tarefas),
+mede uma página da fila com o carregamento antigo (joinedload de Deliverable.tasks na
+consulta paginada) e com o atual (consulta de ids + selectinload) e confere que as duas
+devolvem a mesma página. No antigo, cada submissão volta do banco repetida uma vez por
+tarefa do entregável e o tempo cresce com o tamanho dele; no atual, só com o da página.
+
+Uso:
+    BENCH_DATABASE_URL="mssql+pyodbc://..." python -m benchmarks.bench_review_queue [--page-size 50]
+
+Nunca aponte BENCH_DATABASE_URL para o banco de produção: as tabelas do schema tkse
+são criadas e populadas nele.
+"""
+import argparse
+import os
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, joinedload
+
+from api.v1.pagination import PageParams, paginate
+from api.v1.repository.task_repository import TaskSubmissionRepository
+from api.v1.serialization import SubmissionSerializer
+from db.base import Base
+from db.models import *
+from db.models.task import TaskSubmission
+
+REPEAT = 10
+STUDENTS = 4
+
+
+def seed(conn, task_count: int) -> str:
+    """Uma empresa com um projeto e um entregável de task_count tarefas; uma submissão por tarefa e aluno."""
+    now = datetime.now(timezone.utc)
+    enterprise_id, project_id, deliverable_id = (str(uuid.uuid4()) for _ in range(3))
+    students = [str(uuid.uuid4()) for _ in range(STUDENTS)]
+    tasks = [str(uuid.uuid4()) for _ in range(task_count)]
+
+    conn.execute(Enterprise.__table__.insert(), [{
+        "id": enterprise_id, "name": f"Empresa {task_count}", "email": f"empresa{task_count}@bench.local",
+        "hashed_password": "x", "is_active": True, "created_at": now, "updated_at": now,
+    }])
+    conn.execute(Student.__table__.insert(), [
+        {"id": s, "name": f"Aluno {i}", "email": f"aluno{task_count}-{i}@bench.local", "password": "x",
+         "welcome": True, "is_active": True, "created_at": now, "updated_at": now}
+        for i, s in enumerate(students)
+    ])
+    conn.execute(Project.__table__.insert(), [{
+        "id": project_id, "name": "Projeto", "enterprise_id": enterprise_id, "blob_path": "", "description": "",
+        "technologies": [], "complexity": "", "category": "", "score": "", "country": "BR",
+        "status": "IN_PROGRESS", "created_at": now, "updated_at": now,
+    }])
+    conn.execute(Deliverable.__table__.insert(), [{
+        "id": deliverable_id, "name": "Entrega", "status": "IN_DEVELOPMENT", "project_id": project_id,
+        "created_at": now, "updated_at": now,
+    }])
+    conn.execute(Task.__table__.insert(), [
+        {"id": t, "name": f"Tarefa {i}", "description": "Implementar e documentar.", "status": "PENDING",
+         "deliverable_id": deliverable_id, "created_at": now, "updated_at": now}
+        for i, t in enumerate(tasks)
+    ])
+    conn.execute(TaskSubmission.__table__.insert(), [
+        {"id": str(uuid.uuid4()), "task_id": t, "student_id": s, "submission_link": "https://github.com/aluno/projeto",
+         "status": "PENDING", "submitted_at": now - timedelta(minutes=i * STUDENTS + j)}
+        for i, t in enumerate(tasks) for j, s in enumerate(students)
+    ])
+    return enterprise_id
+
+
+def joinedload_queue(db: Session, enterprise_id: str, params: PageParams):
+    """Carregamento anterior: joinedload da coleção na consulta com LIMIT."""
+    query = (
+        db.query(TaskSubmission)
+        .options(
+            joinedload(TaskSubmission.task).joinedload(Task.deliverable).joinedload(Deliverable.project),
+            joinedload(TaskSubmission.task).joinedload(Task.deliverable).joinedload(Deliverable.tasks),
+            joinedload(TaskSubmission.student),
+            joinedload(TaskSubmission.validator),
+        )
+        .join(Task).join(Deliverable).join(Project)
+        .filter(Project.enterprise_id == enterprise_id)
+    )
+    page = paginate(query, params, TaskSubmission.submitted_at, TaskSubmission.id)
+    return SubmissionSerializer().serialize(page.items)
+
+
+def selectin_queue(db: Session, enterprise_id: str, params: PageParams):
+    return TaskSubmissionRepository.get_filtered_submissions_to_validate(db, enterprise_id, params=params).items
+
+
+def measure(engine, loader, enterprise_id: str, page_size: int):
+    """Mediana em ms e número de consultas de uma página; a primeira rodada só aquece cache e plano."""
+    queries = []
+    count = lambda *args: queries.append(1)
+
+    timings = []
+    for i in range(REPEAT + 1):
+        with Session(engine) as db:
+            started = time.perf_counter()
+            items = loader(db, enterprise_id, PageParams(cursor=None, limit=page_size))
+            if i:
+                timings.append((time.perf_counter() - started) * 1000)
+
+    event.listen(engine, "before_cursor_execute", count)
+    with Session(engine) as db:
+        loader(db, enterprise_id, PageParams(cursor=None, limit=page_size))
+    event.remove(engine, "before_cursor_execute", count)
+    return statistics.median(timings), len(queries), items
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--task-counts", type=int, nargs="+", default=[5, 50, 200])
+    args = parser.parse_args()
+
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        raise SystemExit("Defina BENCH_DATABASE_URL com um banco descartável.")
+    if url == os.getenv("AZURE_SQL_CONNECTION_STRING"):
+        raise SystemExit("BENCH_DATABASE_URL não pode ser o banco da aplicação.")
+
+    engine = create_engine(url, fast_executemany=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    run(engine, args.page_size, args.task_counts)
+
+
+def run(engine, page_size: int, task_counts):
+    with engine.begin() as conn:
+        enterprises = {task_count: seed(conn, task_count) for task_count in task_counts}
+
+    print(f"página de {page_size} submissões ({STUDENTS} por tarefa)")
+    print(f"{'tarefas/entregável':<20}{'joinedload (ms)':>17}{'consultas':>11}{'ids + selectin (ms)':>21}{'consultas':>11}{'ganho':>9}")
+    for task_count, enterprise_id in enterprises.items():
+        old_ms, old_queries, old_items = measure(engine, joinedload_queue, enterprise_id, page_size)
+        new_ms, new_queries, new_items = measure(engine, selectin_queue, enterprise_id, page_size)
+        assert [item.id for item in old_items] == [item.id for item in new_items], "páginas diferentes"
+        print(f"{task_count:<20}{old_ms:>17.1f}{old_queries:>11}{new_ms:>21.1f}{new_queries:>11}{old_ms / new_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Benchmark de serialização e tamanho na rede das respostas pesadas:
+list_enterprise_projects (ProjectResponse com árvore de entregáveis, tarefas, critérios
+e requisitos) e get_filtered_submissions_to_validate (SubmissionWithDeliverable).
+
+Monta payloads sintéticos com os schemas reais da API e compara, por resposta:
+  - tempo de validação/dump do response_model (igual para as duas classes de resposta);
+  - tempo de render do JSONResponse padrão (json.dumps) e do FastJSONResponse (orjson);
+  - bytes sem compressão, com gzip e com brotli (níveis do CompressionMiddleware).
+
+Para a fila de revisão compara também a montagem dos modelos: from_orm linha a linha
+(caminho antigo, seguido do response_model) contra o SubmissionSerializer em lote com
+dump_json do TypeAdapter.
+
+Não precisa de banco.
+
+Uso: python -m benchmarks.bench_serialization [--projects 50] [--submissions 200]
+"""
+import argparse
+import gzip
+import json
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import List
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from api.middlewares.compression import COMPRESSION_BROTLI_QUALITY, COMPRESSION_GZIP_LEVEL, brotli
+from api.v1.responses import FastJSONResponse, orjson
+from api.v1.schemas.project_schema import ProjectResponse
+from api.v1.schemas.task_schema import DeliverableWithTasks, ProjectResponseSchema, StudentResponse, SubmissionWithDeliverable, TaskBasicInfo
+from api.v1.serialization import SUBMISSION_LIST_ADAPTER, SubmissionSerializer
+
+REPEAT = 10
+REQUIREMENTS_HTML = "<h2>Requisitos</h2>" + "".join(
+    f"<p>Requisito {i}: o sistema deve permitir cadastro, edição e listagem com filtros.</p>" for i in range(80)
+)
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def _task(i):
+    return SimpleNamespace(
+        id=str(uuid.uuid4()), name=f"Tarefa {i}", status="PENDING", estimated_time=4.0,
+        description="Implementar o endpoint, escrever a validação dos dados e documentar a rota. " * 3,
+        acceptance_criteria=[SimpleNamespace(description=f"Critério de aceitação {c} atendido") for c in range(4)],
+    )
+
+
+def _student(i):
+    now = _now()
+    return SimpleNamespace(
+        id=str(uuid.uuid4()), name=f"Aluno {i}", email=f"aluno{i}@example.com", phone=None, role="student",
+        location="São Paulo", photo=None, cargo=None, bio="Desenvolvedor em formação.", github=None,
+        linkedin=None, project_count=1, welcome=True, is_active=True, created_at=now, updated_at=now,
+    )
+
+
+def enterprise_projects_payload(n_projects: int) -> list:
+    enterprise_id = str(uuid.uuid4())
+    return [
+        ProjectResponse(
+            id=str(uuid.uuid4()), name=f"Projeto {p}", enterprise_id=enterprise_id, created_at=_now(),
+            deliverables=[
+                SimpleNamespace(name=f"Entregável {d}", status="IN_DEVELOPMENT", tasks=[_task(t) for t in range(5)])
+                for d in range(6)
+            ],
+            description="Plataforma de marketplace com catálogo, carrinho e pagamentos. " * 4,
+            technologies=["Python", "FastAPI", "React", "SQL Server"], complexity="Média", category="Web",
+            score="8", country="BR", status="IN_PROGRESS", progress=40,
+            team=[_student(s) for s in range(4)], requirements=REQUIREMENTS_HTML,
+        )
+        for p in range(n_projects)
+    ]
+
+
+def review_queue_payload(n_submissions: int) -> list:
+    now = _now()
+    validator = SimpleNamespace(
+        id=str(uuid.uuid4()), name="Empresa", email="empresa@example.com", is_active=True,
+        created_at=now, updated_at=now, profile_image_path=None,
+    )
+    project = SimpleNamespace(id=uuid.uuid4(), name="Projeto", country="BR", description="Projeto")
+    deliverables = [
+        SimpleNamespace(
+            id=str(uuid.uuid4()), name=f"Entregável {d}", status="IN_DEVELOPMENT",
+            tasks=[_task(t) for t in range(5)], project=project,
+        )
+        for d in range(6)
+    ]
+    students = [
+        SimpleNamespace(id=str(uuid.uuid4()), name=f"Aluno {s}", email=f"a{s}@example.com", photo=None)
+        for s in range(20)
+    ]
+    items = []
+    for i in range(n_submissions):
+        deliverable = deliverables[i % len(deliverables)]
+        task = SimpleNamespace(id=deliverable.tasks[i % 5].id, deliverable=deliverable)
+        items.append(SimpleNamespace(
+            id=str(uuid.uuid4()), task_id=task.id, task=task, status="PENDING",
+            submission_link="https://github.com/aluno/projeto", link_deploy="https://projeto.example.com",
+            branch_name="main", evidence_file=None, feedback=None, submitted_at=now, validated_at=None,
+            validator=validator, student=students[i % len(students)], deliverable=deliverable,
+        ))
+    return items
+
+
+def _timed(fn):
+    samples = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+def report(label: str, model, items: list):
+    adapter = TypeAdapter(List[model])
+    validate_ms, content = _timed(lambda: adapter.dump_python(adapter.validate_python(items, from_attributes=True), mode="json"))
+    std_ms, std_body = _timed(lambda: JSONResponse(content).body)
+    fast_ms, fast_body = _timed(lambda: FastJSONResponse(content).body)
+
+    print(f"\n{label}: {len(items)} itens")
+    print(f"  response_model (validação + dump): {validate_ms:8.1f} ms")
+    print(f"  JSONResponse (json.dumps):         {std_ms:8.1f} ms")
+    engine = "orjson" if orjson is not None else "sem orjson: fallback json.dumps"
+    print(f"  {f'FastJSONResponse ({engine}):':34} {fast_ms:8.1f} ms ({std_ms / fast_ms:.1f}x)")
+
+    print(f"  bytes sem compressão: {len(std_body):>10,}")
+    gzipped = gzip.compress(fast_body, compresslevel=COMPRESSION_GZIP_LEVEL)
+    print(f"  bytes gzip (nível {COMPRESSION_GZIP_LEVEL}):   {len(gzipped):>10,} ({len(gzipped) / len(std_body):.1%})")
+    if brotli is not None:
+        br_ms, compressed = _timed(lambda: brotli.compress(fast_body, quality=COMPRESSION_BROTLI_QUALITY))
+        print(f"  bytes brotli (q={COMPRESSION_BROTLI_QUALITY}):     {len(compressed):>10,} ({len(compressed) / len(std_body):.1%}, {br_ms:.1f} ms)")
+    else:
+        print("  brotli: pacote não instalado")
+
+
+def _row_by_row(submissions: list) -> list:
+    """Caminho antigo: blocos refeitos por submissão com from_orm."""
+    results = []
+    for submission in submissions:
+        deliverable = submission.task.deliverable
+        results.append(SubmissionWithDeliverable(
+            id=submission.id, task_id=submission.task.id, status=submission.status,
+            submission_link=submission.submission_link, link_deploy=submission.link_deploy,
+            branch_name=submission.branch_name, evidence_file=submission.evidence_file,
+            feedback=submission.feedback, submitted_at=submission.submitted_at,
+            validated_at=submission.validated_at, validator=submission.validator,
+            student=StudentResponse.model_validate(submission.student),
+            deliverable=DeliverableWithTasks(
+                id=deliverable.id, name=deliverable.name, status=deliverable.status,
+                tasks=[TaskBasicInfo.model_validate(task) for task in deliverable.tasks],
+                project=ProjectResponseSchema.model_validate(deliverable.project),
+            ),
+        ))
+    return results
+
+
+def report_submission_serializer(items: list):
+    adapter = TypeAdapter(List[SubmissionWithDeliverable])
+
+    def response_model_path():
+        # o que o FastAPI faz com o response_model: dump, nova validação e dump para JSON
+        models = _row_by_row(items)
+        dumped = [model.model_dump() for model in models]
+        return FastJSONResponse(adapter.dump_python(adapter.validate_python(dumped), mode="json")).body
+
+    old_ms, old_body = _timed(response_model_path)
+    new_ms, new_body = _timed(lambda: SUBMISSION_LIST_ADAPTER.dump_json(SubmissionSerializer().serialize(items)))
+
+    print(f"\nfila de revisão, montagem + resposta: {len(items)} submissões")
+    print(f"  from_orm por linha + response_model: {old_ms:8.1f} ms")
+    print(f"  SubmissionSerializer + dump_json:    {new_ms:8.1f} ms ({old_ms / new_ms:.1f}x)")
+    print(f"  mesmo conteúdo: {json.loads(old_body) == json.loads(new_body)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--submissions", type=int, default=200)
+    args = parser.parse_args()
+
+    report("list_enterprise_projects", ProjectResponse, enterprise_projects_payload(args.projects))
+    queue = review_queue_payload(args.submissions)
+    report("get_filtered_submissions_to_validate", SubmissionWithDeliverable, queue)
+    report_submission_serializer(queue)
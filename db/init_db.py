@@ -1,21 +1,106 @@
-from sqlalchemy import create_engine, text, inspect
+import hashlib
+import json
 import os
 import logging
+import tempfile
+from sqlalchemy import select, text
 from db.base import Base
 from db.session import engine
 from db.models import *
 
+# create: cria as tabelas e registra o fingerprint (desenvolvimento)
+# verify: só compara o fingerprint com tkse.schema_version (produção)
+# skip: não toca no banco durante o startup
+DB_SCHEMA_MODE = os.getenv("DB_SCHEMA_MODE", "create").lower()
+DB_SCHEMA_CACHE_FILE = os.getenv(
+    "DB_SCHEMA_CACHE_FILE",
+    os.path.join(tempfile.gettempdir(), "tkse_schema_fingerprint")
+)
+
+def schema_fingerprint() -> str:
+    """Hash estável das tabelas, colunas e índices declarados nos models."""
+    tables = []
+    for table in sorted(Base.metadata.tables.values(), key=lambda t: t.fullname):
+        tables.append({
+            "table": table.fullname,
+            "columns": [f"{c.name}:{c.type!r}:{c.nullable}" for c in table.columns],
+            "indexes": sorted(
+                f"{i.name}:{','.join(c.name for c in i.columns)}:{i.unique}" for i in table.indexes
+            ),
+        })
+    return hashlib.sha256(json.dumps(tables, sort_keys=True).encode()).hexdigest()
+
+def _read_cached_fingerprint():
+    try:
+        with open(DB_SCHEMA_CACHE_FILE) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _write_cached_fingerprint(fingerprint: str):
+    try:
+        with open(DB_SCHEMA_CACHE_FILE, "w") as f:
+            f.write(fingerprint)
+    except OSError as e:
+        logging.warning(f"⚠️ Não foi possível gravar o cache do schema: {e}")
+
+def get_current_schema_fingerprint(conn):
+    return conn.execute(
+        select(SchemaVersion.fingerprint).order_by(SchemaVersion.id.desc()).limit(1)
+    ).scalar()
+
+def stamp_schema_version(conn, version: str, fingerprint: str):
+    conn.execute(SchemaVersion.__table__.insert().values(version=version, fingerprint=fingerprint))
+
 def create_all_tables():
+    from db.migrate import run_migrations
+
     Base.metadata.create_all(bind=engine)
+    # create_all não altera tabelas existentes; as migrações são idempotentes e cobrem esse caso
+    if engine.dialect.name == "mssql":
+        run_migrations()
+
+    fingerprint = schema_fingerprint()
+    with engine.begin() as conn:
+        if get_current_schema_fingerprint(conn) != fingerprint:
+            stamp_schema_version(conn, "create_all", fingerprint)
+    _write_cached_fingerprint(fingerprint)
+
+def verify_schema() -> bool:
+    """Confere o fingerprint com o cache local e, se preciso, com uma única consulta ao banco."""
+    fingerprint = schema_fingerprint()
+    if _read_cached_fingerprint() == fingerprint:
+        return True
 
-def test_db_connection():
     try:
         with engine.connect() as conn:
-            version = conn.execute(text("SELECT @@VERSION")).fetchone()
-            logging.info(f"🧠 Conectado ao SQL Server: {version[0]}")
+            current = get_current_schema_fingerprint(conn)
+    except Exception as e:
+        logging.error(f"❌ Não foi possível ler tkse.schema_version: {e}")
+        return False
+
+    if current != fingerprint:
+        logging.warning(
+            f"⚠️ Schema do banco ({current}) difere dos models ({fingerprint}). Aplique as migrações pendentes."
+        )
+        return False
 
-            inspector = inspect(engine)
-            tables = inspector.get_table_names("tkse")
-            logging.info(f"📦 Tabelas no schema 'tkse': {tables}")
+    _write_cached_fingerprint(fingerprint)
+    return True
+
+def init_schema():
+    if DB_SCHEMA_MODE == "create":
+        create_all_tables()
+    elif DB_SCHEMA_MODE == "verify":
+        verify_schema()
+    elif DB_SCHEMA_MODE != "skip":
+        raise ValueError(f"DB_SCHEMA_MODE inválido: {DB_SCHEMA_MODE}. Use create, verify ou skip.")
+
+def test_db_connection() -> bool:
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True
     except Exception as e:
-        logging.error(f"❌ Falha ao conectar ao banco: {e}")
\ No newline at end of file
+        logging.error(f"❌ Falha ao conectar ao banco: {e}")
+        return False
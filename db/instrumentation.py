@@ -0,0 +1,98 @@
+import contextvars
+import logging
+import os
+import re
+import time
+from collections import Counter
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("db.instrumentation")
+
+SQL_INSTRUMENTATION_ENABLED = os.getenv("SQL_INSTRUMENTATION_ENABLED", "true").lower() in ("1", "true", "yes", "on")
+# Quantas vezes o mesmo statement pode se repetir numa requisição antes de ser tratado como N+1
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10"))
+
+_WHITESPACE = re.compile(r"\s+")
+_EXPANDED_PARAMS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalize_statement(statement: str) -> str:
+    """Agrupa statements que só diferem em espaços ou no tamanho de listas IN (?, ?, ...)."""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _EXPANDED_PARAMS.sub("(?...)", statement)
+
+
+class RequestQueryStats:
+    """Estatísticas de SQL acumuladas durante uma requisição."""
+
+    def __init__(self, route: str):
+        self.route = route
+        self.count = 0
+        self.total_time = 0.0
+        self.statements = Counter()
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.total_time += elapsed
+        self.statements[normalize_statement(statement)] += 1
+
+    def repeated_statements(self, threshold: int = SQL_N_PLUS_ONE_THRESHOLD) -> List[Tuple[str, int]]:
+        return [(stmt, n) for stmt, n in self.statements.most_common() if n >= threshold]
+
+    @property
+    def total_time_ms(self) -> float:
+        return round(self.total_time * 1000, 1)
+
+
+_request_stats: contextvars.ContextVar[Optional[RequestQueryStats]] = contextvars.ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def start_request_stats(route: str):
+    stats = RequestQueryStats(route)
+    return stats, _request_stats.set(stats)
+
+
+def end_request_stats(token):
+    _request_stats.reset(token)
+
+
+def current_request_stats() -> Optional[RequestQueryStats]:
+    return _request_stats.get()
+
+
+def report_request_stats(stats: RequestQueryStats):
+    repeated = stats.repeated_statements()
+    if repeated:
+        statement, times = repeated[0]
+        logger.warning(
+            f"⚠️ Possível N+1 em {stats.route}: {stats.count} queries em {stats.total_time_ms} ms; "
+            f"statement repetido {times}x: {statement[:300]}"
+        )
+    else:
+        logger.debug(f"{stats.route}: {stats.count} queries em {stats.total_time_ms} ms")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_start_time", None)
+    if start is None:
+        return
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - start)
+
+
+def instrument_engine(engine: Engine) -> None:
+    if not SQL_INSTRUMENTATION_ENABLED:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,44 @@
+"""
+Aplica as migrações pendentes de db/migrations e registra cada uma em tkse.schema_version.
+
+Uso: python -m db.migrate
+"""
+import logging
+from sqlalchemy import select
+
+from db.init_db import schema_fingerprint, stamp_schema_version
+from db.migrations import load_migrations
+from db.models.schema_version import SchemaVersion
+from db.session import engine
+
+
+def applied_versions(conn) -> set:
+    return set(conn.execute(select(SchemaVersion.version)).scalars())
+
+
+def run_migrations():
+    SchemaVersion.__table__.create(bind=engine, checkfirst=True)
+    fingerprint = schema_fingerprint()
+
+    with engine.connect() as conn:
+        applied = applied_versions(conn)
+
+    for migration in load_migrations():
+        if migration.VERSION in applied:
+            continue
+
+        logging.info(f"🛠️ Aplicando migração {migration.VERSION}")
+        if getattr(migration, "TRANSACTIONAL", True):
+            with engine.begin() as conn:
+                migration.upgrade(conn)
+                stamp_schema_version(conn, migration.VERSION, fingerprint)
+        else:
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                migration.upgrade(conn)
+            with engine.begin() as conn:
+                stamp_schema_version(conn, migration.VERSION, fingerprint)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_migrations()
@@ -0,0 +1,19 @@
+"""Índices para as chaves estrangeiras e filtros mais usados pelos repositórios."""
+from db.migrations import create_index_if_missing
+
+VERSION = "0001_hot_path_indexes"
+
+INDEXES = [
+    ("task_submissions", "ix_task_submissions_task_student_submitted", ["task_id", "student_id", "submitted_at"]),
+    ("tasks", "ix_tasks_deliverable_id", ["deliverable_id"]),
+    ("deliverables", "ix_deliverables_project_id", ["project_id"]),
+    ("projects", "ix_projects_enterprise_status", ["enterprise_id", "status"]),
+    ("student_project", "ix_student_project_student_project", ["student_id", "project_id"]),
+    ("chat_messages", "ix_chat_messages_from_to_created", ["from_id", "to_id", "created_at"]),
+    ("password_reset_tokens", "ix_password_reset_tokens_email_type_used", ["email", "user_type", "is_used"]),
+]
+
+
+def upgrade(conn):
+    for table, name, columns in INDEXES:
+        create_index_if_missing(conn, table, name, columns)
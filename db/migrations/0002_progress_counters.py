@@ -0,0 +1,33 @@
+"""Contadores de tarefas (total e aprovadas) em deliverables e projects, com backfill."""
+from sqlalchemy import text
+
+from db.migrations import add_column_if_missing
+
+VERSION = "0002_progress_counters"
+
+COUNTER_COLUMNS = [
+    ("deliverables", "total_tasks"),
+    ("deliverables", "approved_tasks"),
+    ("projects", "total_tasks"),
+    ("projects", "approved_tasks"),
+]
+
+
+def upgrade(conn):
+    for table, column in COUNTER_COLUMNS:
+        add_column_if_missing(
+            conn, table, column, f"INT NOT NULL CONSTRAINT [df_{table}_{column}] DEFAULT 0"
+        )
+
+    conn.execute(text("""
+        UPDATE d SET
+            total_tasks = (SELECT COUNT(*) FROM tkse.tasks t WHERE t.deliverable_id = d.id),
+            approved_tasks = (SELECT COUNT(*) FROM tkse.tasks t WHERE t.deliverable_id = d.id AND t.status = 'APPROVED')
+        FROM tkse.deliverables d
+    """))
+    conn.execute(text("""
+        UPDATE p SET
+            total_tasks = COALESCE((SELECT SUM(d.total_tasks) FROM tkse.deliverables d WHERE d.project_id = p.id), 0),
+            approved_tasks = COALESCE((SELECT SUM(d.approved_tasks) FROM tkse.deliverables d WHERE d.project_id = p.id), 0)
+        FROM tkse.projects p
+    """))
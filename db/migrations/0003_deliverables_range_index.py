@@ -0,0 +1,14 @@
+"""
+Índice para os relatórios por período: (project_id, status, created_at) em deliverables.
+Substitui ix_deliverables_project_id, que é prefixo do novo.
+"""
+from db.migrations import create_index_if_missing, drop_index_if_exists
+
+VERSION = "0003_deliverables_range_index"
+
+
+def upgrade(conn):
+    create_index_if_missing(
+        conn, "deliverables", "ix_deliverables_project_status_created", ["project_id", "status", "created_at"]
+    )
+    drop_index_if_exists(conn, "deliverables", "ix_deliverables_project_id")
@@ -0,0 +1,22 @@
+"""
+Tabela tkse.delivery_monthly_rollup (entregáveis concluídos e tarefas aprovadas por projeto e mês),
+populada a partir dos entregáveis existentes (usa os contadores de 0002_progress_counters).
+"""
+from sqlalchemy import text
+
+from db.models.delivery_rollup import DeliveryMonthlyRollup
+
+VERSION = "0004_delivery_monthly_rollup"
+
+
+def upgrade(conn):
+    DeliveryMonthlyRollup.__table__.create(conn, checkfirst=True)
+    conn.execute(text("""
+        INSERT INTO tkse.delivery_monthly_rollup (project_id, month, enterprise_id, completed_deliverables, approved_tasks, updated_at)
+        SELECT d.project_id, DATEFROMPARTS(YEAR(d.created_at), MONTH(d.created_at), 1), p.enterprise_id,
+               SUM(CASE WHEN d.status = 'COMPLETED' THEN 1 ELSE 0 END), SUM(d.approved_tasks), SYSDATETIMEOFFSET()
+        FROM tkse.deliverables d
+        JOIN tkse.projects p ON p.id = d.project_id
+        WHERE NOT EXISTS (SELECT 1 FROM tkse.delivery_monthly_rollup x)
+        GROUP BY d.project_id, DATEFROMPARTS(YEAR(d.created_at), MONTH(d.created_at), 1), p.enterprise_id
+    """))
@@ -0,0 +1,11 @@
+"""
+Tabela tkse.student_dashboard_snapshot (números do dashboard do aluno pré-calculados).
+Depois de aplicar, popule com: python -m jobs.check_student_dashboard
+"""
+from db.models.student_dashboard import StudentDashboardSnapshot
+
+VERSION = "0005_student_dashboard_snapshot"
+
+
+def upgrade(conn):
+    StudentDashboardSnapshot.__table__.create(conn, checkfirst=True)
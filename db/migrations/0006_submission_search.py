@@ -0,0 +1,20 @@
+"""Tabela tkse.submission_search (busca da fila de revisão), populada a partir das submissões existentes."""
+from sqlalchemy import text
+
+from db.models.submission_search import SubmissionSearch
+
+VERSION = "0006_submission_search"
+
+
+def upgrade(conn):
+    SubmissionSearch.__table__.create(conn, checkfirst=True)
+    conn.execute(text("""
+        INSERT INTO tkse.submission_search (submission_id, enterprise_id, student_id, student_name, deliverable_name, task_name)
+        SELECT s.id, p.enterprise_id, s.student_id, st.name, d.name, t.name
+        FROM tkse.task_submissions s
+        JOIN tkse.tasks t ON t.id = s.task_id
+        JOIN tkse.deliverables d ON d.id = t.deliverable_id
+        JOIN tkse.projects p ON p.id = d.project_id
+        JOIN tkse.students st ON st.id = s.student_id
+        WHERE NOT EXISTS (SELECT 1 FROM tkse.submission_search x WHERE x.submission_id = s.id)
+    """))
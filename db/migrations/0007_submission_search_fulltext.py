@@ -0,0 +1,24 @@
+"""
+Índice full-text em tkse.submission_search, quando o servidor tem Full-Text Search
+(Azure SQL tem). Sem ele, a busca usa LIKE na tabela de busca; com ele, ligue
+SUBMISSION_SEARCH_FULLTEXT=true. DDL de full-text não roda dentro de transação.
+"""
+from sqlalchemy import text
+
+VERSION = "0007_submission_search_fulltext"
+TRANSACTIONAL = False
+
+
+def upgrade(conn):
+    if not conn.execute(text("SELECT FULLTEXTSERVICEPROPERTY('IsFullTextInstalled')")).scalar():
+        return
+    conn.execute(text("""
+        IF NOT EXISTS (SELECT 1 FROM sys.fulltext_catalogs WHERE name = 'ftc_tkse')
+            CREATE FULLTEXT CATALOG ftc_tkse
+    """))
+    conn.execute(text("""
+        IF NOT EXISTS (SELECT 1 FROM sys.fulltext_indexes WHERE object_id = OBJECT_ID('tkse.submission_search'))
+            CREATE FULLTEXT INDEX ON tkse.submission_search (student_name, deliverable_name, task_name)
+            KEY INDEX pk_submission_search ON ftc_tkse
+            WITH CHANGE_TRACKING AUTO
+    """))
@@ -0,0 +1,25 @@
+"""
+task_submissions.submitted_at NOT NULL: é a chave de ordenação da paginação por cursor.
+Submissões antigas sem a data recebem a da validação ou, sem ela, a de criação da tarefa.
+O índice que inclui a coluna é recriado em volta do ALTER COLUMN.
+"""
+from sqlalchemy import text
+
+from db.migrations import create_index_if_missing, drop_index_if_exists
+
+VERSION = "0008_task_submissions_submitted_at_not_null"
+
+INDEX = ("task_submissions", "ix_task_submissions_task_student_submitted", ["task_id", "student_id", "submitted_at"])
+
+
+def upgrade(conn):
+    conn.execute(text("""
+        UPDATE s SET submitted_at = COALESCE(s.validated_at, t.created_at)
+        FROM tkse.task_submissions s
+        JOIN tkse.tasks t ON t.id = s.task_id
+        WHERE s.submitted_at IS NULL
+    """))
+    table, name, columns = INDEX
+    drop_index_if_exists(conn, table, name)
+    conn.execute(text("ALTER TABLE tkse.task_submissions ALTER COLUMN submitted_at DATETIMEOFFSET NOT NULL"))
+    create_index_if_missing(conn, table, name, columns)
@@ -0,0 +1,54 @@
+import importlib
+from typing import List
+from sqlalchemy import text
+
+# Ordem de aplicação das migrações. Cada módulo define VERSION e upgrade(conn);
+# migrações que não podem rodar dentro de transação definem TRANSACTIONAL = False.
+MIGRATIONS = [
+    "0001_hot_path_indexes",
+    "0002_progress_counters",
+    "0003_deliverables_range_index",
+    "0004_delivery_monthly_rollup",
+    "0005_student_dashboard_snapshot",
+    "0006_submission_search",
+    "0007_submission_search_fulltext",
+    "0008_task_submissions_submitted_at_not_null",
+]
+
+
+def load_migrations() -> List:
+    return [importlib.import_module(f"db.migrations.{name}") for name in MIGRATIONS]
+
+
+def index_exists(conn, table: str, name: str) -> bool:
+    return conn.execute(
+        text("SELECT 1 FROM sys.indexes WHERE name = :name AND object_id = OBJECT_ID(:table)"),
+        {"name": name, "table": f"tkse.{table}"},
+    ).first() is not None
+
+
+def create_index_if_missing(conn, table: str, name: str, columns: List[str], unique: bool = False):
+    if index_exists(conn, table, name):
+        return
+    column_list = ", ".join(f"[{c}]" for c in columns)
+    conn.execute(text(
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX [{name}] ON tkse.[{table}] ({column_list}) WITH (ONLINE = ON)"
+    ))
+
+
+def drop_index_if_exists(conn, table: str, name: str):
+    if index_exists(conn, table, name):
+        conn.execute(text(f"DROP INDEX [{name}] ON tkse.[{table}]"))
+
+
+def column_exists(conn, table: str, column: str) -> bool:
+    return conn.execute(
+        text("SELECT COL_LENGTH(:table, :column)"),
+        {"table": f"tkse.{table}", "column": column},
+    ).scalar() is not None
+
+
+def add_column_if_missing(conn, table: str, column: str, definition: str):
+    if column_exists(conn, table, column):
+        return
+    conn.execute(text(f"ALTER TABLE tkse.[{table}] ADD [{column}] {definition}"))
@@ -5,4 +5,8 @@ from .student import Student
 from .student_project import StudentProject
 from .country import Country
 from .password_reset import PasswordResetToken, UserType
-from .chat_message import ChatMessage
\ No newline at end of file
+from .chat_message import ChatMessage
+from .schema_version import SchemaVersion
+from .delivery_rollup import DeliveryMonthlyRollup
+from .student_dashboard import StudentDashboardSnapshot
+from .submission_search import SubmissionSearch
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text
+from sqlalchemy import Column, Index, String, DateTime, Text
 from sqlalchemy.dialects.mssql import UNIQUEIDENTIFIER
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -7,7 +7,10 @@ from db.base import Base
 
 class ChatMessage(Base):
     __tablename__ = "chat_messages"
-    __table_args__ = {"schema": "tkse"}
+    __table_args__ = (
+        Index("ix_chat_messages_from_to_created", "from_id", "to_id", "created_at"),
+        {"schema": "tkse"},
+    )
 
     id = Column(UNIQUEIDENTIFIER, primary_key=True, default=uuid.uuid4, nullable=False)
     from_id = Column(String(36), nullable=False)
@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, String
+from db.base import Base
+
+
+class DeliveryMonthlyRollup(Base):
+    """
+    Agregado mensal por projeto: entregáveis concluídos e tarefas aprovadas.
+    O mês é o de criação do entregável (o mesmo agrupamento do gráfico de entregas).
+    Mantido de forma incremental pelas mudanças de status; jobs/backfill_delivery_rollup.py reconstrói.
+    """
+    __tablename__ = "delivery_monthly_rollup"
+    __table_args__ = (
+        Index("ix_delivery_monthly_rollup_enterprise_month", "enterprise_id", "month"),
+        {"schema": "tkse"},
+    )
+
+    project_id = Column(String(36), ForeignKey("tkse.projects.id", ondelete="CASCADE"), primary_key=True)
+    month = Column(Date, primary_key=True)
+    enterprise_id = Column(String(36), nullable=False)
+    completed_deliverables = Column(Integer, nullable=False, default=0, server_default="0")
+    approved_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
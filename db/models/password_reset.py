@@ -1,6 +1,6 @@
 from datetime import datetime, timezone, timedelta
 import uuid
-from sqlalchemy import Column, DateTime, String, Text, Enum
+from sqlalchemy import Column, DateTime, Index, String, Text, Enum
 from sqlalchemy.orm import relationship
 from db.base import Base
 import enum
@@ -13,7 +13,10 @@ class UserType(enum.Enum):
 
 class PasswordResetToken(Base):
     __tablename__ = "password_reset_tokens"
-    __table_args__ = {"schema": "tkse"}
+    __table_args__ = (
+        Index("ix_password_reset_tokens_email_type_used", "email", "user_type", "is_used"),
+        {"schema": "tkse"},
+    )
 
     id = Column(String(36), default=lambda: str(uuid.uuid4()), primary_key=True)
     token = Column(String(255), unique=True, nullable=False, index=True)
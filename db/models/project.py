@@ -1,6 +1,6 @@
 from enum import Enum
 import uuid
-from sqlalchemy import JSON, Column, ForeignKey, String, DateTime, Enum as SQLEnum
+from sqlalchemy import JSON, Column, ForeignKey, Index, Integer, String, DateTime, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from db.base import Base
@@ -16,7 +16,10 @@ class ProjectStatus(str, Enum):
 
 class Project(Base):
     __tablename__ = "projects"
-    __table_args__ = {"schema": "tkse"}
+    __table_args__ = (
+        Index("ix_projects_enterprise_status", "enterprise_id", "status"),
+        {"schema": "tkse"},
+    )
 
     id = Column(String(36), default=lambda: str(uuid.uuid4()), primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -29,6 +32,9 @@ class Project(Base):
     score = Column(String, nullable=False)
     country = Column(String, nullable=False)
     status = Column(SQLEnum(ProjectStatus), nullable=False, default=ProjectStatus.PENDING)
+    # Contadores de tarefas (soma dos entregáveis), usados por progress
+    total_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    approved_tasks = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
 
@@ -39,11 +45,9 @@ class Project(Base):
     
     @property
     def progress(self):
-        tasks = [t for d in self.deliverables for t in d.tasks]
-        if not tasks:
+        if not self.total_tasks:
             return 0
-        approved = sum(1 for t in tasks if t.status == "APPROVED")
-        return round((approved / len(tasks)) * 100)
+        return round((self.approved_tasks / self.total_tasks) * 100)
 
     @property
     def team(self):
@@ -0,0 +1,12 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, Integer, String
+from db.base import Base
+
+class SchemaVersion(Base):
+    __tablename__ = "schema_version"
+    __table_args__ = {"schema": "tkse"}
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    version = Column(String(100), nullable=False)
+    fingerprint = Column(String(64), nullable=False)
+    applied_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
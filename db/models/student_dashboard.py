@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from db.base import Base
+
+
+class StudentDashboardSnapshot(Base):
+    """
+    Números do dashboard do aluno, pré-calculados.
+    Atualizado pelas validações de tarefas e pelos vínculos aluno-projeto;
+    jobs/check_student_dashboard.py detecta e corrige divergências.
+    """
+    __tablename__ = "student_dashboard_snapshot"
+    __table_args__ = {"schema": "tkse"}
+
+    student_id = Column(String(36), ForeignKey("tkse.students.id", ondelete="CASCADE"), primary_key=True)
+    completed_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    in_progress_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    total_deliverables = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
@@ -1,12 +1,15 @@
 import uuid
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, String
+from sqlalchemy import Column, Index, Integer, ForeignKey, DateTime, String
 from sqlalchemy.orm import relationship
 from db.base import Base
 from datetime import datetime, timezone
 
 class StudentProject(Base):
     __tablename__ = "student_project"
-    __table_args__ = {"schema": "tkse"}
+    __table_args__ = (
+        Index("ix_student_project_student_project", "student_id", "project_id"),
+        {"schema": "tkse"},
+    )
 
     id = Column(String(36), default=lambda: str(uuid.uuid4()), primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, ForeignKey, Index, PrimaryKeyConstraint, String
+from db.base import Base
+
+
+class SubmissionSearch(Base):
+    """
+    Tabela de busca da fila de revisão: uma linha por submissão com os textos pesquisáveis
+    (aluno, entregável, tarefa) já desnormalizados, filtrável por empresa sem joins.
+    Mantida na criação da submissão e na troca de nome do aluno.
+    """
+    __tablename__ = "submission_search"
+    __table_args__ = (
+        # nome fixo: é a KEY INDEX do índice full-text (migração 0007)
+        PrimaryKeyConstraint("submission_id", name="pk_submission_search"),
+        Index("ix_submission_search_enterprise", "enterprise_id"),
+        Index("ix_submission_search_student", "student_id"),
+        {"schema": "tkse"},
+    )
+
+    submission_id = Column(String(36), ForeignKey("tkse.task_submissions.id", ondelete="CASCADE"), nullable=False)
+    enterprise_id = Column(String(36), nullable=False)
+    student_id = Column(String(36), nullable=False)
+    student_name = Column(String(150), nullable=False, default="")
+    deliverable_name = Column(String, nullable=False, default="")
+    task_name = Column(String, nullable=False, default="")
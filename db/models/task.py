@@ -1,13 +1,17 @@
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Column, DateTime, Integer, String, Text, Float, ForeignKey
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, Float, ForeignKey
 from sqlalchemy.orm import relationship
 from db.base import Base
 
 
 class Deliverable(Base):
     __tablename__ = "deliverables"
-    __table_args__ = {"schema": "tkse"}
+    __table_args__ = (
+        # cobre o join por projeto e o filtro por status + intervalo de datas dos relatórios
+        Index("ix_deliverables_project_status_created", "project_id", "status", "created_at"),
+        {"schema": "tkse"},
+    )
 
     id = Column(String(36), default=lambda: str(uuid.uuid4()), primary_key=True)
     name = Column(String, nullable=False)
@@ -15,13 +19,19 @@ class Deliverable(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
     project_id = Column(String(36), ForeignKey("tkse.projects.id"))
+    # Contadores mantidos por save_project_to_sql e pelas mudanças de status das tarefas
+    total_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    approved_tasks = Column(Integer, nullable=False, default=0, server_default="0")
 
     project = relationship("Project", back_populates="deliverables")
     tasks = relationship("Task", back_populates="deliverable")
 
 class Task(Base):
     __tablename__ = "tasks"
-    __table_args__ = {"schema": "tkse"}
+    __table_args__ = (
+        Index("ix_tasks_deliverable_id", "deliverable_id"),
+        {"schema": "tkse"},
+    )
 
     id = Column(String(36), default=lambda: str(uuid.uuid4()), primary_key=True)
     name = Column(String, nullable=False)
@@ -54,7 +64,10 @@ class AcceptanceCriteria(Base):
     
 class TaskSubmission(Base):
     __tablename__ = "task_submissions"
-    __table_args__ = {"schema": "tkse"}
+    __table_args__ = (
+        Index("ix_task_submissions_task_student_submitted", "task_id", "student_id", "submitted_at"),
+        {"schema": "tkse"},
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     task_id = Column(String(36), ForeignKey("tkse.tasks.id"), nullable=False)
@@ -67,7 +80,7 @@ class TaskSubmission(Base):
     evidence_file = Column(String(500), nullable=True)
     status = Column(String(20), default="PENDING")
     feedback = Column(String(150), nullable=True)
-    submitted_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    submitted_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
     validated_at = Column(DateTime(timezone=True), nullable=True)
 
     task = relationship("Task")
@@ -0,0 +1,146 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Configuração do pool de conexões, lida das variáveis de ambiente."""
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 1800  # Azure SQL derruba conexões ociosas após ~30 min
+    pool_pre_ping: bool = True
+    pool_use_lifo: bool = True
+
+    @classmethod
+    def from_env(cls, prefix: str = "DB_POOL_") -> "PoolSettings":
+        return cls(
+            pool_size=_env_int(f"{prefix}SIZE", cls.pool_size),
+            max_overflow=_env_int(f"{prefix}MAX_OVERFLOW", cls.max_overflow),
+            pool_timeout=_env_int(f"{prefix}TIMEOUT", cls.pool_timeout),
+            pool_recycle=_env_int(f"{prefix}RECYCLE", cls.pool_recycle),
+            pool_pre_ping=_env_bool(f"{prefix}PRE_PING", cls.pool_pre_ping),
+            pool_use_lifo=_env_bool(f"{prefix}USE_LIFO", cls.pool_use_lifo),
+        )
+
+    def engine_kwargs(self, is_async: bool = False) -> dict:
+        return {
+            "poolclass": InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+            "pool_use_lifo": self.pool_use_lifo,
+        }
+
+
+class PoolStats:
+    """Contadores acumulados de checkout do pool (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, elapsed: float):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += elapsed
+            if elapsed > self.max_wait:
+                self.max_wait = elapsed
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            avg_wait = self.total_wait / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(avg_wait * 1000, 3),
+                "wait_ms_max": round(self.max_wait * 1000, 3),
+                "wait_ms_total": round(self.total_wait * 1000, 3),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Mede o tempo gasto para obter uma conexão do pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record_timeout()
+            raise
+        finally:
+            self.stats.record_wait(time.perf_counter() - start)
+
+    def recreate(self):
+        # engine.dispose() recria o pool; mantém os contadores acumulados
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+_engines: Dict[str, Engine] = {}
+
+
+def register_engine(name: str, engine: Engine) -> None:
+    _engines[name] = engine
+
+
+def pool_status() -> dict:
+    status = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        data = {"pool_class": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            data.update({
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+            })
+        stats = getattr(pool, "stats", None)
+        if stats is not None:
+            data.update(stats.snapshot())
+        status[name] = data
+    return status
@@ -1,6 +1,14 @@
 import os
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
+
+from db.instrumentation import instrument_engine
+from db.pool import PoolSettings, register_engine
+from db.slow_query_log import enable_slow_query_log
+from db.unit_of_work import AsyncUnitOfWork, UnitOfWork
 
 AZURE_SQL_CONNECTION_STRING = os.getenv("AZURE_SQL_CONNECTION_STRING")
 
@@ -10,12 +18,83 @@ if not AZURE_SQL_CONNECTION_STRING:
         "Please configure this variable in your Azure App Service settings."
     )
 
-engine = create_engine(AZURE_SQL_CONNECTION_STRING)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Por padrão a engine assíncrona usa a mesma string de conexão com o driver aioodbc
+AZURE_SQL_ASYNC_CONNECTION_STRING = os.getenv("AZURE_SQL_ASYNC_CONNECTION_STRING")
+async_database_url = AZURE_SQL_ASYNC_CONNECTION_STRING or make_url(AZURE_SQL_CONNECTION_STRING).set(drivername="mssql+aioodbc")
+
+pool_settings = PoolSettings.from_env()
+
+# fast_executemany manda os INSERTs em lote (executemany) num único round trip; só existe no pyodbc
+DB_FAST_EXECUTEMANY = os.getenv("DB_FAST_EXECUTEMANY", "true").lower() in ("1", "true", "yes", "on")
+engine_options = {}
+if DB_FAST_EXECUTEMANY and make_url(AZURE_SQL_CONNECTION_STRING).drivername == "mssql+pyodbc":
+    engine_options["fast_executemany"] = True
+
+engine = create_engine(AZURE_SQL_CONNECTION_STRING, **pool_settings.engine_kwargs(), **engine_options)
+register_engine("primary", engine)
+instrument_engine(engine)
+enable_slow_query_log(engine)
+
+async_engine = create_async_engine(async_database_url, **pool_settings.engine_kwargs(is_async=True))
+register_engine("primary_async", async_engine.sync_engine)
+instrument_engine(async_engine.sync_engine)
+enable_slow_query_log(async_engine.sync_engine)
+
+# Réplica de leitura (ex.: mesma string com ApplicationIntent=ReadOnly). Sem ela, tudo vai para o primário.
+AZURE_SQL_REPLICA_CONNECTION_STRING = os.getenv("AZURE_SQL_REPLICA_CONNECTION_STRING")
+
+if AZURE_SQL_REPLICA_CONNECTION_STRING:
+    replica_engine = create_engine(
+        AZURE_SQL_REPLICA_CONNECTION_STRING,
+        **PoolSettings.from_env("DB_REPLICA_POOL_").engine_kwargs()
+    )
+    register_engine("replica", replica_engine)
+    instrument_engine(replica_engine)
+    enable_slow_query_log(replica_engine)
+else:
+    replica_engine = engine
+
+
+class RoutingSession(Session):
+    """
+    Sessão que envia consultas para a réplica quando criada com use_replica=True.
+
+    Escritas (flush, INSERT/UPDATE/DELETE) sempre vão para o primário e, a partir
+    da primeira escrita, todas as leituras da sessão também ficam no primário
+    para preservar read-after-write.
+    """
+
+    def __init__(self, *args, use_replica: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_replica = use_replica
+        self._pinned_to_primary = False
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self._pinned_to_primary = True
+        if self.use_replica and not self._pinned_to_primary:
+            return replica_engine
+        return engine
+
+
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+
+# expire_on_commit=False: atributos expirados exigiriam lazy load, que não é permitido em AsyncSession
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 def get_db():
-    db = SessionLocal()
+    """Uma sessão e uma transação por requisição: commit no fim, rollback em qualquer erro."""
+    with UnitOfWork(SessionLocal) as db:
+        yield db
+
+def get_read_db():
+    """Sessão para rotas somente leitura (dashboards, listagens, histórico de chat)."""
+    db = SessionLocal(use_replica=True)
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncUnitOfWork(AsyncSessionLocal) as db:
+        yield db
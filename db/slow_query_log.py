@@ -0,0 +1,189 @@
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from db.instrumentation import current_request_stats
+
+logger = logging.getLogger("db.slow_queries")
+
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "500"))
+SLOW_QUERY_BUFFER_SIZE = int(os.getenv("SLOW_QUERY_BUFFER_SIZE", "200"))
+SLOW_QUERY_LOG_FILE = os.getenv("SLOW_QUERY_LOG_FILE", "logs/slow_queries.log")
+SLOW_QUERY_LOG_MAX_BYTES = int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+SLOW_QUERY_LOG_BACKUP_COUNT = int(os.getenv("SLOW_QUERY_LOG_BACKUP_COUNT", "3"))
+# Captura o plano estimado (SHOWPLAN_XML) numa conexão separada; só para SQL Server no engine síncrono
+SLOW_QUERY_CAPTURE_PLAN = os.getenv("SLOW_QUERY_CAPTURE_PLAN", "false").lower() in ("1", "true", "yes", "on")
+# Por padrão só tipo e tamanho de cada parâmetro; com true, os valores (exceto colunas sensíveis)
+SLOW_QUERY_LOG_PARAMETERS = os.getenv("SLOW_QUERY_LOG_PARAMETERS", "false").lower() in ("1", "true", "yes", "on")
+
+_REPOSITORY_PATH = os.path.join("api", "v1", "repository") + os.sep
+_MAX_PARAMS = 50
+_MAX_PARAM_LENGTH = 200
+# parâmetros cujo nome contém um destes trechos nunca têm o valor registrado
+_SENSITIVE_PARAMS = ("password", "token", "secret", "email")
+_COMPILED_VALUE = re.compile(r'ParameterCompiledValue="[^"]*"')
+
+
+class SlowQueryLog:
+    """Ring buffer em memória com as queries lentas mais recentes, espelhado num arquivo rotativo."""
+
+    def __init__(self, maxlen: int, log_file: Optional[str]):
+        self._entries = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._file_logger = None
+        if log_file:
+            os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+            handler = RotatingFileHandler(
+                log_file, maxBytes=SLOW_QUERY_LOG_MAX_BYTES, backupCount=SLOW_QUERY_LOG_BACKUP_COUNT
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._file_logger = logging.getLogger("db.slow_queries.file")
+            self._file_logger.addHandler(handler)
+            self._file_logger.setLevel(logging.INFO)
+            self._file_logger.propagate = False
+
+    def record(self, entry: dict):
+        with self._lock:
+            self._entries.append(entry)
+        if self._file_logger:
+            self._file_logger.info(json.dumps(entry, default=str))
+        logger.warning(
+            f"🐢 Query lenta ({entry['duration_ms']} ms) em {entry['route']} / {entry['repository_function']}"
+        )
+
+    def entries(self, limit: Optional[int] = None) -> List[dict]:
+        with self._lock:
+            items = list(reversed(self._entries))
+        return items[:limit] if limit else items
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(SLOW_QUERY_BUFFER_SIZE, SLOW_QUERY_LOG_FILE)
+_plan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-plan")
+
+
+def _format_value(name: Optional[str], value) -> str:
+    """Tipo e tamanho do valor; o valor em si só com SLOW_QUERY_LOG_PARAMETERS e fora das colunas sensíveis."""
+    if value is None:
+        return "None"
+    sensitive = name is None or any(part in name.lower() for part in _SENSITIVE_PARAMS)
+    if SLOW_QUERY_LOG_PARAMETERS and not (sensitive and isinstance(value, (str, bytes))):
+        return repr(value)[:_MAX_PARAM_LENGTH]
+    if isinstance(value, (str, bytes)):
+        return f"<{type(value).__name__} len={len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def _parameter_names(context) -> Optional[List[str]]:
+    """Nomes dos parâmetros posicionais (pyodbc usa '?'), a partir do statement compilado."""
+    compiled = getattr(context, "compiled", None)
+    return list(getattr(compiled, "positiontup", None) or []) or None
+
+
+def _format_parameters(parameters, executemany: bool, names: Optional[List[str]] = None):
+    # insertmanyvalues executa o lote como um único INSERT com os parâmetros achatados
+    if executemany and parameters and not isinstance(parameters[0], (dict, list, tuple)):
+        return {"executemany": True, "parameters": _format_parameters(parameters, False, names)}
+    if executemany:
+        return {"executemany": True, "rows": len(parameters), "first_row": _format_parameters(parameters[0], False, names) if parameters else None}
+    if isinstance(parameters, dict):
+        items = list(parameters.items())[:_MAX_PARAMS]
+        return {k: _format_value(k, v) for k, v in items}
+    values = list(parameters or ())[:_MAX_PARAMS]
+    if names and len(names) >= len(values):
+        return {name: _format_value(name, v) for name, v in zip(names, values)}
+    # SQL textual sem nomes: sem como saber a coluna, trata tudo como sensível
+    return [_format_value(None, v) for v in values]
+
+
+def _find_repository_function() -> Optional[str]:
+    """Primeiro frame da pilha que pertence a api/v1/repository (não existe em chamadas async)."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        if _REPOSITORY_PATH in frame.f_code.co_filename:
+            module = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def _capture_plan(engine: Engine, statement: str, parameters) -> Optional[str]:
+    raw = None
+    try:
+        raw = engine.raw_connection()
+        cursor = raw.cursor()
+        cursor.execute("SET SHOWPLAN_XML ON")
+        try:
+            cursor.execute(statement, parameters)
+            row = cursor.fetchone()
+            if not row:
+                return None
+            # o plano traz os valores usados na compilação: mesma regra dos parâmetros
+            return row[0] if SLOW_QUERY_LOG_PARAMETERS else _COMPILED_VALUE.sub('ParameterCompiledValue="?"', row[0])
+        finally:
+            cursor.execute("SET SHOWPLAN_XML OFF")
+    except Exception as e:
+        return f"plan unavailable: {e}"
+    finally:
+        if raw is not None:
+            raw.close()
+
+
+def _record_with_plan(engine: Engine, entry: dict, statement: str, parameters):
+    # a entrada é registrada mesmo se a captura do plano falhar de um jeito inesperado
+    try:
+        entry["plan"] = _capture_plan(engine, statement, parameters)
+    finally:
+        slow_query_log.record(entry)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._slow_query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_slow_query_start_time", None)
+    if start is None:
+        return
+    duration_ms = (time.perf_counter() - start) * 1000
+    if duration_ms < SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    stats = current_request_stats()
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "duration_ms": round(duration_ms, 1),
+        "engine": str(conn.engine.url.host or conn.engine.url.database or conn.engine.url.drivername),
+        "route": stats.route if stats else None,
+        "repository_function": _find_repository_function(),
+        "statement": statement,
+        "parameters": _format_parameters(parameters, executemany, _parameter_names(context)),
+    }
+
+    # engines async (aioodbc) não abrem conexão fora do event loop: sem plano para elas
+    dialect = conn.engine.dialect
+    if SLOW_QUERY_CAPTURE_PLAN and not executemany and dialect.name == "mssql" and not dialect.is_async:
+        _plan_executor.submit(_record_with_plan, conn.engine, entry, statement, parameters)
+    else:
+        slow_query_log.record(entry)
+
+
+def enable_slow_query_log(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
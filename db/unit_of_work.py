@@ -0,0 +1,87 @@
+import logging
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger("db.unit_of_work")
+
+_ON_COMMIT_KEY = "on_commit_callbacks"
+
+
+class UnitOfWork:
+    """
+    Uma sessão e uma transação por unidade de trabalho (requisição, mensagem de websocket, job).
+
+    Os repositórios só fazem flush; o commit acontece uma única vez na saída do bloco,
+    e qualquer exceção (inclusive HTTPException) desfaz tudo.
+
+        with UnitOfWork(SessionLocal) as db:
+            ...
+    """
+
+    def __init__(self, session_factory: Callable[..., Session], **session_kwargs):
+        self.session_factory = session_factory
+        self.session_kwargs = session_kwargs
+        self.session = None
+
+    def __enter__(self) -> Session:
+        self.session = self.session_factory(**self.session_kwargs)
+        return self.session
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.session.commit()
+            else:
+                self.session.rollback()
+        finally:
+            self.session.close()
+
+
+class AsyncUnitOfWork:
+    """Versão assíncrona do UnitOfWork para AsyncSession."""
+
+    def __init__(self, session_factory, **session_kwargs):
+        self.session_factory = session_factory
+        self.session_kwargs = session_kwargs
+        self.session = None
+
+    async def __aenter__(self):
+        self.session = self.session_factory(**self.session_kwargs)
+        return self.session
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                await self.session.commit()
+            else:
+                await self.session.rollback()
+        finally:
+            await self.session.close()
+
+
+def on_commit(db, callback: Callable[[], None]) -> None:
+    """
+    Agenda callback para depois do commit da transação atual (invalidação de cache,
+    índices em memória...). Se a transação for desfeita, o callback é descartado.
+    Aceita Session ou AsyncSession.
+    """
+    session = getattr(db, "sync_session", db)
+    session.info.setdefault(_ON_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_on_commit_callbacks(session):
+    for callback in session.info.pop(_ON_COMMIT_KEY, []):
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"❌ Erro em callback pós-commit {callback!r}: {e}")
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_on_commit_callbacks(session, transaction):
+    # rollback ou close sem commit: os callbacks pendentes não valem mais
+    if transaction.parent is None:
+        session.info.pop(_ON_COMMIT_KEY, None)
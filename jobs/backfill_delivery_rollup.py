@@ -0,0 +1,30 @@
+"""
+Reconstrói tkse.delivery_monthly_rollup a partir de deliverables.
+
+A migração 0004 já popula a tabela; rode sempre que o agregado precisar ser conferido
+(ex.: após correções manuais no banco). É idempotente: apaga e recalcula as linhas.
+
+Uso: python -m jobs.backfill_delivery_rollup [--enterprise-id <id>]
+"""
+import argparse
+import logging
+
+from api.v1.repository.delivery_rollup_repository import DeliveryRollupRepository
+from db.session import SessionLocal
+from db.unit_of_work import UnitOfWork
+
+
+def backfill(enterprise_id=None) -> int:
+    with UnitOfWork(SessionLocal) as db:
+        rows = DeliveryRollupRepository.rebuild(db, enterprise_id)
+    logging.info(f"📊 Agregado mensal de entregas reconstruído: {rows} linhas")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--enterprise-id", help="Reconstrói só as linhas desta empresa")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    backfill(args.enterprise_id)
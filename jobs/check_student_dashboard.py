@@ -0,0 +1,67 @@
+"""
+Confere tkse.student_dashboard_snapshot contra os números recalculados e corrige as divergências
+(snapshots ausentes ou com contadores diferentes). Também serve de backfill após a migração 0005.
+
+Uso: python -m jobs.check_student_dashboard [--dry-run] [--batch-size 500]
+"""
+import argparse
+import logging
+
+from sqlalchemy import or_, select
+
+from api.v1.repository.dashboard_repository import refresh_student_snapshots, student_dashboard_totals
+from db.models.student import Student
+from db.models.student_dashboard import StudentDashboardSnapshot
+from db.session import SessionLocal
+from db.unit_of_work import UnitOfWork
+
+COUNTERS = ("completed_tasks", "in_progress_tasks", "total_deliverables")
+
+
+def find_drift(db, student_ids):
+    """IDs dos alunos cujo snapshot está ausente ou diferente do valor recalculado."""
+    expected = student_dashboard_totals(student_ids).subquery()
+    query = (
+        select(expected.c.student_id)
+        .outerjoin(StudentDashboardSnapshot, StudentDashboardSnapshot.student_id == expected.c.student_id)
+        .where(or_(
+            StudentDashboardSnapshot.student_id.is_(None),
+            *[getattr(StudentDashboardSnapshot, name) != expected.c[name] for name in COUNTERS],
+        ))
+    )
+    return db.execute(query).scalars().all()
+
+
+def check(dry_run: bool = False, batch_size: int = 500) -> int:
+    drifted = 0
+    last_id = ""
+    while True:
+        # um lote por transação, em ordem de ID, para não segurar locks na tabela inteira
+        with UnitOfWork(SessionLocal) as db:
+            student_ids = db.execute(
+                select(Student.id).where(Student.id > last_id).order_by(Student.id).limit(batch_size)
+            ).scalars().all()
+            if not student_ids:
+                break
+            last_id = student_ids[-1]
+
+            ids = find_drift(db, student_ids)
+            if ids:
+                drifted += len(ids)
+                logging.warning(f"⚠️ {len(ids)} snapshots divergentes no lote (ex.: {ids[:5]})")
+                if not dry_run:
+                    refresh_student_snapshots(db, ids)
+
+    action = "encontrados" if dry_run else "corrigidos"
+    logging.info(f"📊 Snapshots do dashboard do aluno: {drifted} {action}")
+    return drifted
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Só reporta, sem corrigir")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    check(args.dry_run, args.batch_size)
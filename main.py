@@ -1,11 +1,18 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
+import asyncio
 import logging
 import os
 
+from api.middlewares.compression import CompressionMiddleware
+from api.middlewares.etag import ETagMiddleware
+from api.middlewares.sql_instrumentation import SQLInstrumentationMiddleware
 from api.v1.routes import setup_routes
-from db.init_db import test_db_connection, create_all_tables
+from api.v1.search_index import PROJECT_SEARCH_REBUILD_SECONDS, rebuild_project_index_periodically
+from api.v1.services.student_import_service import shutdown_hash_pool
+from db.init_db import init_schema
 
 # Carrega variáveis de ambiente
 load_dotenv()
@@ -15,13 +22,21 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 logging.getLogger("azure").setLevel(logging.WARNING)
 
-# Inicializa FastAPI
-app = FastAPI()
-
-create_all_tables()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema conforme DB_SCHEMA_MODE; a conectividade é checada em /api/internal/health/ready
+    init_schema()
+    # Índice de busca de projetos: reconstrução periódica (sem ela, é montado na primeira busca)
+    search_rebuild = None
+    if PROJECT_SEARCH_REBUILD_SECONDS > 0:
+        search_rebuild = asyncio.create_task(rebuild_project_index_periodically())
+    yield
+    if search_rebuild:
+        search_rebuild.cancel()
+    shutdown_hash_pool()
 
-# Testa conexão com banco
-test_db_connection()
+# Inicializa FastAPI
+app = FastAPI(lifespan=lifespan)
 
 # Registra rotas
 setup_routes(app)
@@ -33,10 +48,20 @@ def get_cors_origins():
         return [origin.strip() for origin in origins.split(',')]
     return []
 
+# ETag pelo hash do corpo nas respostas JSON de GET (304 se o cliente já tem a versão)
+app.add_middleware(ETagMiddleware)
+
+# brotli/gzip conforme Accept-Encoding; fica por fora do ETag, que é calculado sobre o corpo original
+app.add_middleware(CompressionMiddleware)
+
+# Contagem de queries e detecção de N+1 por requisição
+app.add_middleware(SQLInstrumentationMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=get_cors_origins(),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],
 )